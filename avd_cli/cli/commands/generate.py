@@ -71,6 +71,23 @@ def generate(ctx: click.Context) -> None:
     envvar="AVD_CLI_WORKFLOW",
     show_envvar=True,
 )
+@click.option(
+    "--skip-structured-config-validation",
+    is_flag=True,
+    default=False,
+    envvar="AVD_CLI_SKIP_STRUCTURED_CONFIG_VALIDATION",
+    show_envvar=True,
+    help="Skip structured config schema validation before rendering (inputs are still validated)",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    default=False,
+    envvar="AVD_CLI_CACHE",
+    show_envvar=True,
+    help="Reuse unchanged eos-design results cached in <output>/configs/.avdcache by previous --cache runs",
+)
 def generate_all(
     ctx: click.Context,
     inventory_path: Path,
@@ -79,6 +96,8 @@ def generate_all(
     limit_to_groups_patterns: Tuple[str, ...],
     show_deprecation_warnings: bool,
     workflow: str,
+    skip_structured_config_validation: bool,
+    use_cache: bool,
 ) -> None:
     verbose = ctx.obj.get("verbose", False)
     all_patterns = _merge_patterns(limit_patterns, limit_to_groups_patterns)
@@ -105,7 +124,14 @@ def generate_all(
             sys.exit(1)
 
         console.print("[cyan]→[/cyan] Generating configurations, documentation, and tests...")
-        configs, docs, tests = gen_all(inventory, output_path, workflow, device_filter)
+        configs, docs, tests = gen_all(
+            inventory,
+            output_path,
+            workflow,
+            device_filter,
+            skip_structured_config_validation=skip_structured_config_validation,
+            use_cache=use_cache,
+        )
 
         console.print("\n[green]✓[/green] Generation complete!")
         table = Table(title="Generated Files")
@@ -133,6 +159,23 @@ def generate_all(
     envvar="AVD_CLI_WORKFLOW",
     show_envvar=True,
 )
+@click.option(
+    "--skip-structured-config-validation",
+    is_flag=True,
+    default=False,
+    envvar="AVD_CLI_SKIP_STRUCTURED_CONFIG_VALIDATION",
+    show_envvar=True,
+    help="Skip structured config schema validation before rendering (inputs are still validated)",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    default=False,
+    envvar="AVD_CLI_CACHE",
+    show_envvar=True,
+    help="Reuse unchanged eos-design results cached in <output>/configs/.avdcache by previous --cache runs",
+)
 def generate_configs(
     ctx: click.Context,
     inventory_path: Path,
@@ -141,6 +184,8 @@ def generate_configs(
     limit_to_groups_patterns: Tuple[str, ...],
     show_deprecation_warnings: bool,
     workflow: str,
+    skip_structured_config_validation: bool,
+    use_cache: bool,
 ) -> None:
     verbose = ctx.obj.get("verbose", False)
     all_patterns = _merge_patterns(limit_patterns, limit_to_groups_patterns)
@@ -168,7 +213,11 @@ def generate_configs(
             sys.exit(1)
 
         console.print("[cyan]→[/cyan] Generating configurations...")
-        generator = ConfigurationGenerator(workflow=workflow)
+        generator = ConfigurationGenerator(
+            workflow=workflow,
+            skip_structured_config_validation=skip_structured_config_validation,
+            use_cache=use_cache,
+        )
         configs = generator.generate(inventory, output_path, device_filter)
 
         console.print(f"\n[green]✓[/green] Generated {len(configs)} configuration files")
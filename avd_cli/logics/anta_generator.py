@@ -8,13 +8,14 @@ device roles, structured configurations, and fabric topology.
 """
 
 import logging
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from avd_cli.exceptions import TestGenerationError
 from avd_cli.models.inventory import DeviceDefinition, InventoryData
+from avd_cli.utils import fastyaml
+from avd_cli.utils.batch_writer import batch_write
 
 
 class AntaCatalogGenerator:
@@ -64,7 +65,8 @@ class AntaCatalogGenerator:
             # Get devices to process
             devices = inventory.get_all_devices()
             if limit_to_groups:
-                devices = [d for d in devices if d.fabric in limit_to_groups]
+                selected_groups = frozenset(limit_to_groups)
+                devices = [d for d in devices if d.fabric in selected_groups]
 
             # Create output directory
             output_path.mkdir(parents=True, exist_ok=True)
@@ -74,21 +76,18 @@ class AntaCatalogGenerator:
                 # Create empty catalog file
                 catalog_file = output_path / "anta_catalog.yaml"
                 empty_catalog: Dict[str, Any] = {"anta.tests.connectivity": []}
-                with open(catalog_file, "w", encoding="utf-8") as f:
-                    yaml.dump(empty_catalog, f, default_flow_style=False, sort_keys=False, indent=2)
-                return [catalog_file]
-
-            # Generate individual test catalog for each device
-            generated_files: List[Path] = []
-            for device in devices:
-                device_catalog = self._build_device_test_catalog(device, structured_configs)
-
-                # Write device-specific catalog to file
-                catalog_file = output_path / f"{device.hostname}_tests.yaml"
-                with open(catalog_file, "w", encoding="utf-8") as f:
-                    yaml.dump(device_catalog, f, default_flow_style=False, sort_keys=False, indent=2)
-
-                generated_files.append(catalog_file)
+                return batch_write([(catalog_file, self._dump_catalog(empty_catalog))])
+
+            # Generate individual test catalog for each device, each serialized in memory
+            # and written with a single write call
+            catalogs = [
+                (
+                    output_path / f"{device.hostname}_tests.yaml",
+                    self._dump_catalog(self._build_device_test_catalog(device, structured_configs)),
+                )
+                for device in devices
+            ]
+            generated_files = batch_write(catalogs)
 
             self.logger.info("Generated ANTA catalogs for %d devices", len(generated_files))
             return generated_files
@@ -96,6 +95,11 @@ class AntaCatalogGenerator:
         except Exception as e:
             raise TestGenerationError(f"Failed to generate ANTA catalog: {e}") from e
 
+    @staticmethod
+    def _dump_catalog(catalog: Dict[str, Any]) -> bytes:
+        """Serialize a test catalog to UTF-8 encoded YAML."""
+        return fastyaml.dump_bytes(catalog, indent=2)
+
     def _build_test_catalog(
         self, devices: List[DeviceDefinition], structured_configs: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -211,11 +215,11 @@ class AntaCatalogGenerator:
         # Management connectivity tests
         mgmt_ips: List[str] = [str(device.mgmt_ip) for device in devices]
 
-        for device in devices:
-            # Test reachability to all other devices' management IPs
-            other_mgmt_ips: List[str] = [ip for ip in mgmt_ips if ip != str(device.mgmt_ip)]
+        for device_ip in mgmt_ips:
+            # Test reachability to other devices' management IPs
+            other_mgmt_ips = (ip for ip in mgmt_ips if ip != device_ip)
 
-            for target_ip in other_mgmt_ips[:5]:  # Limit to first 5 to avoid excessive tests
+            for target_ip in islice(other_mgmt_ips, 5):  # Limit to first 5 to avoid excessive tests
                 tests.append({"VerifyReachability": {"hosts": [{"destination": target_ip, "source": "Management1"}]}})
 
         # Add loopback connectivity tests
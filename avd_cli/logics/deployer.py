@@ -181,6 +181,7 @@ class Deployer:
         self.show_diff = show_diff
         # Support both old limit_to_groups and new device_filter for backward compatibility
         self.limit_to_groups = limit_to_groups or []
+        self._limit_groups = frozenset(self.limit_to_groups)
         self.device_filter = device_filter
         self.max_concurrent = max_concurrent
         self.timeout = timeout
@@ -327,7 +328,7 @@ class Deployer:
                         continue
                 elif self.limit_to_groups:
                     # Legacy behavior: only check group name
-                    if group_name not in self.limit_to_groups:
+                    if group_name not in self._limit_groups:
                         self.logger.debug("Skipping %s: group %s not in limit_to_groups", hostname, group_name)
                         continue
 
@@ -417,7 +418,7 @@ class Deployer:
                 self.logger.debug("Skipping %s: doesn't match filter", host.hostname)
                 return False
         elif self.limit_to_groups:
-            if not any(group in self.limit_to_groups for group in host.groups):
+            if self._limit_groups.isdisjoint(host.groups):
                 self.logger.debug("Skipping %s: groups %s not in limit_to_groups", host.hostname, host.groups)
                 return False
         return True
@@ -7,19 +7,31 @@ This module provides functionality to generate device configurations,
 documentation, and test files from AVD inventory data.
 """
 
+import json
 import logging
-from copy import deepcopy
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pickle import PicklingError
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
+import yaml
 from rich.console import Console
 
 from avd_cli.constants import (DEFAULT_CONFIGS_DIR, DEFAULT_DOCS_DIR,
                                DEFAULT_TESTS_DIR, normalize_workflow)
-from avd_cli.exceptions import (ConfigurationGenerationError,
+from avd_cli.exceptions import (AvdCliError, ConfigurationGenerationError,
                                 DocumentationGenerationError,
                                 TestGenerationError)
 from avd_cli.models.inventory import DeviceDefinition, InventoryData
+from avd_cli import __version__ as avd_cli_version
+from avd_cli.utils.batch_writer import batch_write
+from avd_cli.utils import fastjson, fastyaml
+from avd_cli.utils.cache import CACHE_DIR_NAME, StructuredConfigCache, fingerprint
 from avd_cli.utils.merge import deep_merge
 
 # Conditional import for DeviceFilter (used in type hints)
@@ -33,6 +45,271 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Float strings converted by ConfigurationGenerator._convert_numeric_strings:
+# single dot, no leading zero in a multi-digit integer or decimal part
+# (keeps IDs such as '0000.0001' or '1.001' as strings)
+_FLOAT_RE = re.compile(r"(?:0|(?!0)\d+|-\d+)\.(?:\d|(?!0)\d+)")
+
+# Keys identifying an AVD node type definition (spine, l3leaf, p, ...)
+_TOPOLOGY_SUBKEYS = ("defaults", "nodes", "node_groups")
+
+# Topology keys reported under a different device type by _determine_device_type
+_DEVICE_TYPE_MAPPING = {"l2leaf": "leaf", "l3spine": "spine"}
+
+# Minimum number of devices for eos_designs to run in a process pool: below it,
+# starting worker processes and sending them the AVD facts costs more than it saves
+PROCESS_POOL_THRESHOLD = 32
+
+# Data shared by all devices of the current batch (AVD facts or fabric data), set once in each worker process
+_worker_shared: Any = None
+
+
+def _as_plain_dict(structured_config: Any) -> Dict[str, Any]:
+    """Return a pyavd structured config as a plain dict."""
+    result: Dict[str, Any] = (
+        structured_config._as_dict() if hasattr(structured_config, "_as_dict") else structured_config
+    )
+    return result
+
+
+def _cache_salt(pyavd: Any, workflow: str) -> str:
+    """Return the structured config cache salt: any tool version or workflow change invalidates all entries."""
+    return f"{getattr(pyavd, '__version__', 'unknown')}:{avd_cli_version}:{workflow}"
+
+
+def _facts_digest(avd_facts: Any) -> Optional[str]:
+    """Fingerprint the AVD facts of all devices, which every structured config depends on."""
+    return fingerprint({host: _as_plain_dict(facts) for host, facts in avd_facts.items()})
+
+
+def _lookup_cached_structured_configs(
+    cache: Optional[StructuredConfigCache], all_inputs: Dict[str, Dict[str, Any]], avd_facts: Any
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Optional[str]]]:
+    """Look up the cached eos_designs structured configs of all devices.
+
+    A device's structured config depends on its own inputs and on the facts of
+    all devices: both are part of its cache key.
+
+    Parameters
+    ----------
+    cache : Optional[StructuredConfigCache]
+        Structured config cache, None if caching is disabled
+    all_inputs : Dict[str, Dict[str, Any]]
+        pyavd inputs of ALL devices, keyed by hostname
+    avd_facts : Any
+        AVD facts of ALL devices, as returned by ``pyavd.get_avd_facts``
+
+    Returns
+    -------
+    Tuple[Dict[str, Dict[str, Any]], Dict[str, Optional[str]]]
+        Cached structured configs, and the cache key of every device missing
+        from the cache (None if it cannot be cached)
+    """
+    cached_configs: Dict[str, Dict[str, Any]] = {}
+    cache_keys: Dict[str, Optional[str]] = {}
+    facts_digest = _facts_digest(avd_facts) if cache is not None else None
+    for hostname, device_inputs in all_inputs.items():
+        cache_key = None
+        if cache is not None and facts_digest is not None:
+            input_digest = fingerprint(device_inputs)
+            if input_digest is not None:
+                cache_key = cache.fingerprint(facts_digest, input_digest)
+            cached = cache.get(hostname, cache_key)
+            if cached is not None:
+                cached_configs[hostname] = cached
+                continue
+        cache_keys[hostname] = cache_key
+    return cached_configs, cache_keys
+
+
+def _import_pyavd(error_cls: Type[AvdCliError]) -> Any:
+    """Import pyavd, raising ``error_cls`` with install instructions if it is missing.
+
+    pyavd is kept out of module imports so that commands not using it start fast.
+    Repeated imports are served from ``sys.modules``.
+    """
+    try:
+        import pyavd
+    except ImportError as e:
+        raise error_cls("pyavd library not installed. Install with: pip install pyavd") from e
+    return pyavd
+
+
+def _init_worker(shared: Any) -> None:
+    """Store the data shared by all devices in a worker process."""
+    global _worker_shared  # pylint: disable=global-statement
+    _worker_shared = shared
+
+
+def _input_validation_result(pyavd: Any, inputs: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
+    """Validate one device's inputs, returning ``(errors, deprecation messages)``; errors is None if valid."""
+    validation_result = pyavd.validate_inputs(inputs)
+    if validation_result.validated_data is None:
+        errors = "\n".join(
+            f"{'.'.join(str(p) for p in v.path)}: {v.message}"
+            for v in validation_result.validation_result.violations
+        )
+        return errors, []
+    return None, [deprecation.message for deprecation in validation_result.validation_result.deprecations or []]
+
+
+def _validate_device_inputs(_hostname: str, inputs: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
+    """Validate one device's inputs against the eos_designs schema in a worker process."""
+    import pyavd
+
+    return _input_validation_result(pyavd, inputs)
+
+
+def _build_device_structured_config(hostname: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Run eos_designs for one device in a worker process."""
+    import pyavd
+
+    return _as_plain_dict(
+        pyavd.get_device_structured_config(hostname=hostname, inputs=inputs, avd_facts=_worker_shared)
+    )
+
+
+def _build_device_test_catalog(hostname: str, structured_config: Dict[str, Any]) -> List[Any]:
+    """Run the ANTA test factory for one device in a worker process."""
+    import pyavd
+
+    return list(
+        pyavd.get_device_test_catalog(
+            hostname=hostname, structured_config=structured_config, fabric_data=_worker_shared
+        ).tests
+    )
+
+
+def _render_device_config(_hostname: str, structured_config: Dict[str, Any]) -> str:
+    """Render the EOS CLI configuration of one device in a worker process."""
+    import pyavd
+
+    config_text: str = pyavd.get_device_config(structured_config)
+    return config_text
+
+
+def _render_device_doc(_hostname: str, structured_config: Dict[str, Any]) -> str:
+    """Render the documentation of one device in a worker process."""
+    import pyavd
+
+    doc_text: str = pyavd.get_device_doc(structured_config, add_md_toc=True)
+    return doc_text
+
+
+def _map_in_worker_pool(
+    func: Callable[[str, Any], Any], device_data: Dict[str, Any], shared: Any
+) -> Optional[List[Any]]:
+    """Call ``func(hostname, data)`` for each device in worker processes.
+
+    Parameters
+    ----------
+    func : Callable[[str, Any], Any]
+        Module-level function run in the workers, reading ``shared`` from ``_worker_shared``
+    device_data : Dict[str, Any]
+        Per-device argument keyed by hostname
+    shared : Any
+        Data needed by every device, sent once per worker process
+
+    Returns
+    -------
+    Optional[List[Any]]
+        Results in ``device_data`` order, or None if the batch is below
+        ``PROCESS_POOL_THRESHOLD`` devices, worker processes cannot be started or
+        die, or the data cannot be pickled. Callers then process devices in this process.
+
+    Raises
+    ------
+    Exception
+        Any error raised by ``func`` in a worker (``OSError`` included), unchanged
+    """
+    workers = min(os.cpu_count() or 1, len(device_data))
+    if len(device_data) < PROCESS_POOL_THRESHOLD or workers < 2:
+        return None
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared,))
+    except OSError as e:
+        logger.debug("Process pool unavailable (%s), processing devices sequentially", e)
+        return None
+    with executor:
+        try:
+            # Worker processes are started while the calls are submitted
+            results = executor.map(
+                func,
+                device_data.keys(),
+                device_data.values(),
+                chunksize=max(1, len(device_data) // (workers * 4)),
+            )
+        except OSError as e:
+            logger.debug("Process pool unavailable (%s), processing devices sequentially", e)
+            return None
+        try:
+            # Errors raised by func in a worker surface here and are not retried
+            return list(results)
+        except (BrokenProcessPool, PicklingError) as e:
+            logger.debug("Process pool unavailable (%s), processing devices sequentially", e)
+            return None
+
+
+def _get_device_structured_configs(
+    pyavd: Any, device_inputs: Dict[str, Dict[str, Any]], avd_facts: Any
+) -> Dict[str, Dict[str, Any]]:
+    """Run eos_designs for each device, in worker processes for large batches.
+
+    Parameters
+    ----------
+    pyavd : Any
+        Imported pyavd module
+    device_inputs : Dict[str, Dict[str, Any]]
+        pyavd inputs of the devices to process, keyed by hostname
+    avd_facts : Any
+        AVD facts of ALL devices, as returned by ``pyavd.get_avd_facts``
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        eos_designs structured configs (plain dicts) keyed by hostname
+    """
+    results = _map_in_worker_pool(_build_device_structured_config, device_inputs, avd_facts)
+    if results is not None:
+        return dict(zip(device_inputs, results))
+
+    return {
+        hostname: _as_plain_dict(
+            pyavd.get_device_structured_config(hostname=hostname, inputs=inputs, avd_facts=avd_facts)
+        )
+        for hostname, inputs in device_inputs.items()
+    }
+
+
+def _get_device_test_catalogs(
+    pyavd: Any, structured_configs: Dict[str, Dict[str, Any]], fabric_data: Any
+) -> List[Any]:
+    """Run the ANTA test factory for each device, in worker processes for large batches.
+
+    Parameters
+    ----------
+    pyavd : Any
+        Imported pyavd module
+    structured_configs : Dict[str, Dict[str, Any]]
+        Structured configs keyed by hostname
+    fabric_data : Any
+        Fabric data built from ALL structured configs
+
+    Returns
+    -------
+    List[Any]
+        ANTA test definitions of all devices, in device order
+    """
+    results = _map_in_worker_pool(_build_device_test_catalog, structured_configs, fabric_data)
+    if results is None:
+        results = [
+            pyavd.get_device_test_catalog(
+                hostname=hostname, structured_config=structured_config, fabric_data=fabric_data
+            ).tests
+            for hostname, structured_config in structured_configs.items()
+        ]
+    return list(chain.from_iterable(results))
+
 
 class ConfigurationGenerator:
     """Generator for device configurations.
@@ -47,75 +324,119 @@ class ConfigurationGenerator:
     >>> print(f"Generated {len(configs)} configurations")
     """
 
-    def __init__(self, workflow: str = "eos-design") -> None:
+    def __init__(
+        self,
+        workflow: str = "eos-design",
+        skip_structured_config_validation: bool = False,
+        use_cache: bool = False,
+    ) -> None:
         """Initialize the configuration generator.
 
         Parameters
         ----------
         workflow : str, optional
             Workflow type ('eos-design' or 'cli-config'), by default "eos-design"
+        skip_structured_config_validation : bool, optional
+            Skip validating structured configs before rendering, by default False.
+            With the eos-design workflow, inputs are still validated.
+        use_cache : bool, optional
+            Reuse structured configs and rendered configs of unchanged devices from
+            an on-disk cache in the configs directory, by default False. Only used
+            with the eos-design workflow.
         """
         self.workflow = normalize_workflow(workflow)
+        self.skip_structured_config_validation = skip_structured_config_validation
+        self.use_cache = use_cache
+        self._cache: Optional[StructuredConfigCache] = None
+        # pyavd inputs, eos_designs output (eos-design workflow only) and structured configs
+        # of ALL devices from the last generate() run, reusable by other generators working
+        # on the same inventory
+        self.inputs: Dict[str, Dict[str, Any]] = {}
+        self.eos_designs_configs: Dict[str, Dict[str, Any]] = {}
+        self.structured_configs: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.pyavd: Any = None  # Will be initialized when needed
 
     def _setup_generation(self, output_path: Path) -> Path:
         """Setup directories and import pyavd for generation."""
-        # Import pyavd
-        try:
-            import pyavd
-            self.pyavd = pyavd
-        except ImportError as e:
-            raise ConfigurationGenerationError(
-                "pyavd library not installed. Install with: pip install pyavd"
-            ) from e
+        # Import pyavd once per generator
+        if self.pyavd is None:
+            self.pyavd = _import_pyavd(ConfigurationGenerationError)
 
         # Create output directory
         configs_dir = output_path / DEFAULT_CONFIGS_DIR
         configs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Only eos_designs output is worth caching: cli-config structured configs are the inputs
+        if self.use_cache and self.workflow == "eos-design":
+            self._cache = StructuredConfigCache(configs_dir / CACHE_DIR_NAME, _cache_salt(self.pyavd, self.workflow))
         return configs_dir
 
+    def _validate_inputs(self, all_inputs: Dict[str, Dict[str, Any]]) -> None:
+        """Validate device inputs against the eos_designs schema and log their deprecation warnings.
+
+        Parameters
+        ----------
+        all_inputs : Dict[str, Dict[str, Any]]
+            pyavd inputs keyed by hostname
+
+        Raises
+        ------
+        ConfigurationGenerationError
+            If the inputs of a device fail validation
+        """
+        self.logger.info("Validating inputs against eos_designs schema")
+        # Devices are validated independently: large batches run in worker processes,
+        # otherwise lazily so that the first invalid device stops validation
+        results: Any = _map_in_worker_pool(_validate_device_inputs, all_inputs, None)
+        if results is None:
+            results = (_input_validation_result(self.pyavd, inputs) for inputs in all_inputs.values())
+        device_deprecations: Dict[str, List[str]] = {}
+        for hostname, (errors, deprecations) in zip(all_inputs, results):
+            if errors is not None:
+                raise ConfigurationGenerationError(f"Input validation failed for {hostname}:\n{errors}")
+            device_deprecations[hostname] = deprecations
+
+        # Warnings are only logged once every device is valid, in inventory order
+        for hostname, deprecations in device_deprecations.items():
+            for message in deprecations:
+                self.logger.warning("Deprecation warning for %s: %s", hostname, message)
+
     def _generate_structured_configs(self, all_inputs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Generate structured configurations based on workflow."""
         structured_configs: Dict[str, Dict[str, Any]] = {}
 
         if self.workflow == "eos-design":
-            # Validate inputs first
-            self.logger.info("Validating inputs against eos_designs schema")
-            for hostname, inputs in all_inputs.items():
-                validation_result = self.pyavd.validate_inputs(inputs)
-                if validation_result.validated_data is None:
-                    errors = "\n".join(
-                        f"{'.'.join(str(p) for p in v.path)}: {v.message}"
-                        for v in validation_result.validation_result.violations
-                    )
-                    raise ConfigurationGenerationError(
-                        f"Input validation failed for {hostname}:\n{errors}"
-                    )
-                if validation_result.validation_result.deprecations:
-                    for deprecation in validation_result.validation_result.deprecations:
-                        self.logger.warning("Deprecation warning for %s: %s", hostname, deprecation.message)
+            self._validate_inputs(all_inputs)
 
             # Generate AVD facts and structured configs
             self.logger.info("Generating AVD facts for %d devices", len(all_inputs))
             avd_facts = self.pyavd.get_avd_facts(all_inputs)
 
             self.logger.info("Generating structured configurations")
-            for hostname, inputs in all_inputs.items():
-                # Generate structured_config from eos_designs schema
-                structured_config = self.pyavd.get_device_structured_config(
-                    hostname=hostname, inputs=inputs, avd_facts=avd_facts
-                )
-
+            eos_designs_configs, cache_keys = _lookup_cached_structured_configs(self._cache, all_inputs, avd_facts)
+            if len(cache_keys) < len(all_inputs):
+                self.logger.info("Reused %d cached structured configurations", len(all_inputs) - len(cache_keys))
+
+            # Generate structured_config from eos_designs schema
+            eos_designs_configs.update(_get_device_structured_configs(
+                self.pyavd, {hostname: all_inputs[hostname] for hostname in cache_keys}, avd_facts
+            ))
+            if self._cache is not None:
+                for hostname, cache_key in cache_keys.items():
+                    self._cache.put(hostname, cache_key, eos_designs_configs[hostname])
+
+            # Keep the inventory order of devices, whether cached or generated
+            self.eos_designs_configs = {hostname: eos_designs_configs[hostname] for hostname in all_inputs}
+            for hostname, eos_designs_config in self.eos_designs_configs.items():
                 # Merge with eos_cli_config_gen variables (aliases, ntp, snmp, logging, aaa, etc.)
                 # The inputs contain ALL variables from group_vars/host_vars, including those
                 # that are specific to eos_cli_config_gen schema (not part of eos_designs)
                 # We deep merge to ensure structured_config from eos_designs takes precedence
-                # but eos_cli_config_gen variables are added where not present
-                structured_configs[hostname] = deep_merge(
-                    inputs,
-                    structured_config._as_dict() if hasattr(structured_config, "_as_dict") else structured_config,
-                )
+                # but eos_cli_config_gen variables are added where not present.
+                # Structured configs are only read downstream, so copy=False shares the
+                # untouched input and eos_designs subtrees instead of cloning them per device
+                structured_configs[hostname] = deep_merge(all_inputs[hostname], eos_designs_config, copy=False)
         else:
             # Config-only workflow (cli-config)
             self.logger.info("Using cli-config workflow (eos_cli_config_gen only)")
@@ -124,6 +445,31 @@ class ConfigurationGenerator:
 
         return structured_configs
 
+    def _validate_structured_configs(self, structured_configs: Dict[str, Dict[str, Any]]) -> None:
+        """Validate structured configs against the eos_cli_config_gen schema.
+
+        Parameters
+        ----------
+        structured_configs : Dict[str, Dict[str, Any]]
+            Structured configs keyed by hostname
+
+        Raises
+        ------
+        ConfigurationGenerationError
+            If a structured config fails validation
+        """
+        self.logger.info("Validating structured configurations for %d devices", len(structured_configs))
+        for hostname, structured_config in structured_configs.items():
+            validation_result = self.pyavd.validate_structured_config(structured_config)
+            if validation_result.validated_data is None:
+                errors = "\n".join(
+                    f"{'.'.join(str(p) for p in v.path)}: {v.message}"
+                    for v in validation_result.validation_result.violations
+                )
+                raise ConfigurationGenerationError(
+                    f"Structured config validation failed for {hostname}:\n{errors}"
+                )
+
     def _write_config_files(
         self,
         structured_configs: Dict[str, Dict[str, Any]],
@@ -146,41 +492,49 @@ class ConfigurationGenerator:
         List[Path]
             List of generated configuration file paths
         """
-        generated_files: List[Path] = []
-
         # Determine which configs to write
-        hostnames_to_write = filtered_hostnames if filtered_hostnames else list(structured_configs.keys())
+        hostnames_to_write = filtered_hostnames if filtered_hostnames else list(structured_configs)
 
         # Validate ALL structured configs (even if not writing all)
-        # This ensures consistency and catches errors early
-        self.logger.info("Validating structured configurations for %d devices", len(structured_configs))
-        for hostname, structured_config in structured_configs.items():
-            validation_result = self.pyavd.validate_structured_config(structured_config)
-            if validation_result.validated_data is None:
-                errors = "\n".join(
-                    f"{'.'.join(str(p) for p in v.path)}: {v.message}"
-                    for v in validation_result.validation_result.violations
-                )
-                raise ConfigurationGenerationError(
-                    f"Structured config validation failed for {hostname}:\n{errors}"
-                )
+        # This ensures consistency and catches errors early. With eos-design, this also
+        # covers the eos_cli_config_gen variables merged from the inputs as they are
+        if self.skip_structured_config_validation:
+            self.logger.info("Skipping structured configuration validation")
+        else:
+            self._validate_structured_configs(structured_configs)
 
         # Generate EOS CLI configurations ONLY for filtered devices
         self.logger.info("Generating EOS CLI configurations for %d devices", len(hostnames_to_write))
+        generated_files: List[Path] = []
+        pending: Dict[str, Dict[str, Any]] = {}
         for hostname in hostnames_to_write:
             if hostname not in structured_configs:
                 continue
-
-            structured_config = structured_configs[hostname]
             config_file = configs_dir / f"{hostname}.cfg"
-            config_text = self.pyavd.get_device_config(structured_config)
-
-            with open(config_file, "w", encoding="utf-8") as f:
-                f.write(config_text)
-
             generated_files.append(config_file)
+            if self._cache is not None and self._cache.is_config_current(hostname, config_file):
+                self.logger.debug("Config unchanged, reusing: %s", config_file)
+                continue
+            pending[hostname] = structured_configs[hostname]
+
+        # Templates are CPU bound: render large batches in worker processes
+        config_texts = _map_in_worker_pool(_render_device_config, pending, None)
+        if config_texts is None:
+            # pyavd and the cache are not thread safe: render in this thread, only the writes are threaded
+            config_texts = [self.pyavd.get_device_config(structured_config) for structured_config in pending.values()]
+        if self._cache is not None:
+            for hostname, config_text in zip(pending, config_texts):
+                self._cache.record_config(hostname, config_text)
+        written = batch_write([
+            (configs_dir / f"{hostname}.cfg", config_text.encode("utf-8"))
+            for hostname, config_text in zip(pending, config_texts)
+        ])
+        for config_file in written:
             self.logger.debug("Generated config: %s", config_file)
 
+        if self._cache is not None:
+            self._cache.save()
+
         return generated_files
 
     def generate(
@@ -220,11 +574,16 @@ class ConfigurationGenerator:
             if device_filter:
                 self.logger.info("Will generate configs for %d filtered devices", len(filtered_devices))
 
+            self.inputs = {}
+            self.eos_designs_configs = {}
+            self.structured_configs = {}
+
             # Build pyavd inputs from ALL devices in inventory (for proper AVD context)
             # This ensures avd_facts calculation has complete topology information
             self.logger.info("Building pyavd inputs from resolved inventory (all devices for context)")
             all_devices = inventory.get_all_devices()
             all_inputs = self._build_pyavd_inputs_from_inventory(inventory, all_devices)
+            self.inputs = all_inputs
 
             if not all_inputs:
                 self.logger.warning("No devices to process")
@@ -232,6 +591,7 @@ class ConfigurationGenerator:
 
             # Generate structured configs for ALL devices (needed for dependencies)
             structured_configs = self._generate_structured_configs(all_inputs)
+            self.structured_configs = structured_configs
 
             # Write config files ONLY for filtered devices
             generated_files = self._write_config_files(structured_configs, configs_dir, filtered_hostnames)
@@ -244,12 +604,16 @@ class ConfigurationGenerator:
         except Exception as e:
             raise ConfigurationGenerationError(f"Failed to generate configurations: {e}") from e
 
-    def _convert_numeric_strings(self, data: Any) -> Any:  # noqa: C901 pylint: disable=too-many-return-statements
-        """Recursively convert string representations of numbers to actual numbers.
+    def _convert_numeric_strings(self, data: Any) -> Any:
+        """Convert string representations of numbers to actual numbers.
 
         This handles cases where Jinja2 templates resolve to string numbers
         (e.g., "9214" → 9214) which pyavd schema expects as integers.
 
+        Dicts and lists are walked iteratively and updated in place. Strings with
+        leading zeros (ISIS system IDs such as '0000.0001'), multiple dots (IPv4
+        addresses, versions) and other identifier-like patterns are left untouched.
+
         Parameters
         ----------
         data : Any
@@ -260,41 +624,90 @@ class ConfigurationGenerator:
         Any
             Data with numeric strings converted to numbers
         """
-        if isinstance(data, dict):
-            return {key: self._convert_numeric_strings(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._convert_numeric_strings(item) for item in data]
-        elif isinstance(data, str):
-            # Try to convert to int
-            if data.isdigit() or (data.startswith("-") and data[1:].isdigit()):
-                return int(data)
-            # Try to convert to float - only if it looks like a valid float
-            # Avoid converting:
-            # - Strings with leading zeros (e.g., '0000.0001' for ISIS system IDs)
-            # - Multiple dots (e.g., IPv4 addresses, version numbers)
-            # - Other identifier-like patterns
-            try:
-                if "." in data and data.count(".") == 1:
-                    parts = data.split(".")
-                    if len(parts) == 2:
-                        # Don't convert if integer part has leading zeros (except '0' itself)
-                        if parts[0].startswith("0") and len(parts[0]) > 1:
-                            return data
-                        # Don't convert if decimal part has leading zeros (indicates it's an ID, not a number)
-                        if parts[1].startswith("0") and len(parts[1]) > 1:
-                            return data
-                        # Only convert if both parts are numeric (with optional leading minus)
-                        if (
-                            parts[0].isdigit()
-                            or (parts[0].startswith("-") and parts[0][1:].isdigit())
-                        ) and parts[1].isdigit():
-                            return float(data)
-            except ValueError:
-                pass
-            return data
+        if type(data) is str:
+            return self._convert_numeric_string(data)
+
+        # Exact type checks: YAML and Jinja2 only produce plain dicts, lists and strings
+        convert = self._convert_numeric_string
+        stack: List[Any] = [data]
+        push = stack.append
+        while stack:
+            container = stack.pop()
+            container_type = type(container)
+            if container_type is dict:
+                # Replacing values of existing keys does not resize the dict: no snapshot needed
+                items: Any = container.items()
+            elif container_type is list:
+                items = enumerate(container)
+            else:
+                continue
+            for key, value in items:
+                value_type = type(value)
+                if value_type is str:
+                    converted = convert(value)
+                    if converted is not value:
+                        container[key] = converted
+                elif value_type is dict or value_type is list:
+                    push(value)
+        return data
+
+    def _converted_numeric_strings(self, data: Any) -> Any:
+        """Return a copy of data with numeric strings converted, sharing untouched subtrees.
+
+        Unlike :meth:`_convert_numeric_strings`, the input is never modified: only the
+        dicts and lists on the path to a converted string are copied, every other
+        subtree is returned as is. Callers must treat the result as read-only.
+
+        Parameters
+        ----------
+        data : Any
+            Data structure to process
+
+        Returns
+        -------
+        Any
+            ``data`` itself when nothing needs converting, otherwise a
+            copy-on-write version of it
+        """
+        data_type = type(data)
+        if data_type is str:
+            return self._convert_numeric_string(data)
+        if data_type is dict:
+            items: Any = data.items()
+        elif data_type is list:
+            items = enumerate(data)
         else:
             return data
 
+        # Scalars are handled inline: only nested containers cost a recursive call
+        convert = self._convert_numeric_string
+        result: Any = None
+        for key, value in items:
+            value_type = type(value)
+            if value_type is str:
+                converted = convert(value)
+            elif value_type is dict or value_type is list:
+                converted = self._converted_numeric_strings(value)
+            else:
+                continue
+            if converted is not value:
+                if result is None:
+                    result = data.copy()
+                result[key] = converted
+        return data if result is None else result
+
+    @staticmethod
+    def _convert_numeric_string(value: str) -> Union[str, int, float]:
+        """Convert a single numeric string, returning non-numeric strings unchanged."""
+        # str.isdecimal() matches exactly what the regex \d+ does, without the regex call
+        if value.isdecimal():
+            return int(value)
+        if "." in value:
+            return float(value) if _FLOAT_RE.fullmatch(value) else value
+        if value[:1] == "-" and value[1:].isdecimal():
+            return int(value)
+        return value
+
     def _build_pyavd_inputs_from_inventory(
         self, inventory: InventoryData, devices: List[DeviceDefinition]
     ) -> Dict[str, Dict[str, Any]]:
@@ -316,33 +729,46 @@ class ConfigurationGenerator:
             Dictionary mapping hostnames to their complete AVD variables
         """
         all_inputs: Dict[str, Dict[str, Any]] = {}
+        # Converted global_vars (None key) and group_vars, shared by all group layers
+        converted_vars: Dict[Optional[str], Dict[str, Any]] = {}
+        # Merged global + group layers, built once per distinct group prefix
+        group_layers: Dict[Tuple[str, ...], Tuple[Dict[str, Any], Any]] = {}
+        # Node IDs declared in each group layer's topology, indexed on first use
+        topology_indexes: Dict[Tuple[str, ...], Dict[str, List[Tuple[Any, bool]]]] = {}
+        # Same indexes keyed by the identity of the layer's topology sections: layers share
+        # unchanged subtrees, so group sets that do not redefine the topology share one index
+        section_indexes: Dict[Tuple[int, ...], Dict[str, List[Tuple[Any, bool]]]] = {}
+        # Sorted merge groups per distinct group membership: devices of the same rack or pod
+        # list the same groups, so the filtering and sorting run once per membership
+        merge_groups: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
         for device in devices:
-            device_vars: Dict[str, Any] = {}
-
-            # Start with global variables
-            device_vars = deepcopy(inventory.global_vars)
-
             # Merge ONLY group variables that this device belongs to (from device.groups)
             # Plus the fabric group (from device.fabric)
             # This prevents variables from unrelated groups from being incorrectly applied
-            device_groups = set(device.groups + [device.fabric])
-            for group_name in sorted(device_groups):
-                if group_name in inventory.group_vars:
-                    device_vars = deep_merge(device_vars, inventory.group_vars[group_name])
+            membership = (device.fabric, *device.groups)
+            device_groups = merge_groups.get(membership)
+            if device_groups is None:
+                # Groups without variables add nothing: leaving them out lets more devices share a layer
+                device_groups = merge_groups[membership] = tuple(
+                    sorted({group_name for group_name in membership if group_name in inventory.group_vars})
+                )
+            if device_groups not in group_layers:
+                self._build_group_layer(inventory, device_groups, converted_vars, group_layers)
 
             # Capture AVD 'type' from group_vars before host_vars merge
             # The 'type' in group_vars (l2leaf, l3leaf, spine, etc.) takes precedence
             # over any device_type from host_vars (which is for internal use only)
-            avd_type_from_groups = device_vars.get("type")
+            group_layer, avd_type_from_groups = group_layers[device_groups]
 
             # Merge host-specific variables (highest priority, already resolved)
+            # The group layer is shared between devices and never mutated: copy=False
+            # only copies the dicts along the merged paths and references everything else
             if device.hostname in inventory.host_vars:
-                device_vars = deep_merge(device_vars, inventory.host_vars[device.hostname])
-
-            # Convert numeric strings to actual numbers (for pyavd schema validation)
-            # This handles Jinja2 templates that resolve to string numbers
-            device_vars = self._convert_numeric_strings(device_vars)
+                host_vars = self._converted_numeric_strings(inventory.host_vars[device.hostname])
+                device_vars = deep_merge(group_layer, host_vars, copy=False)
+            else:
+                device_vars = dict(group_layer)
 
             # Ensure hostname is present (required by pyavd)
             # Always override with actual hostname from inventory to prevent empty values
@@ -364,7 +790,10 @@ class ConfigurationGenerator:
             # Extract node ID from AVD topology structure (required by pyavd)
             # The ID is nested in l2leaf/l3spine/spine/leaf node_groups
             if "id" not in device_vars:
-                node_id = self._extract_node_id(device_vars, device.hostname)
+                node_id = self._find_node_id(
+                    inventory, device.hostname, device_vars, group_layer, device_groups,
+                    topology_indexes, section_indexes,
+                )
                 if node_id is not None:
                     device_vars["id"] = node_id
                     self.logger.debug("Extracted node ID %s for device %s", node_id, device.hostname)
@@ -377,6 +806,139 @@ class ConfigurationGenerator:
 
         return all_inputs
 
+    def _find_node_id(
+        self,
+        inventory: InventoryData,
+        hostname: str,
+        device_vars: Dict[str, Any],
+        group_layer: Dict[str, Any],
+        device_groups: Tuple[str, ...],
+        topology_indexes: Dict[Tuple[str, ...], Dict[str, List[Tuple[Any, bool]]]],
+        section_indexes: Dict[Tuple[int, ...], Dict[str, List[Tuple[Any, bool]]]],
+    ) -> Union[int, None]:
+        """Find a device's node ID in the AVD topology structure.
+
+        Devices whose host_vars do not change the topology are looked up in the
+        topology index of their group layer. Indexes are memoized in
+        ``topology_indexes`` by group set and in ``section_indexes`` by the
+        identity of the layer's topology sections.
+
+        Parameters
+        ----------
+        inventory : InventoryData
+            Complete inventory data with resolved variables
+        hostname : str
+            Device hostname
+        device_vars : Dict[str, Any]
+            Merged variables of the device
+        group_layer : Dict[str, Any]
+            Merged global and group variables of the device
+        device_groups : Tuple[str, ...]
+            Groups the group layer was built from
+        topology_indexes : Dict[Tuple[str, ...], Dict[str, List[Tuple[Any, bool]]]]
+            Node ID indexes by group set, filled on first use
+        section_indexes : Dict[Tuple[int, ...], Dict[str, List[Tuple[Any, bool]]]]
+            Node ID indexes by topology section identities, filled on first use
+
+        Returns
+        -------
+        Union[int, None]
+            Node ID of the device, or None if the topology does not define one
+        """
+        host_vars_topology = any(
+            self._is_topology_data(group_layer.get(key)) or self._is_topology_data(device_vars.get(key))
+            for key in inventory.host_vars.get(hostname, {})
+        )
+        if host_vars_topology:
+            # host_vars change the topology: scan this device's own variables
+            return self._extract_node_id(device_vars, hostname)
+
+        if device_groups not in topology_indexes:
+            # Layers stay alive in group_layers for the whole loop, so ids are stable
+            sections = tuple(id(value) for value in group_layer.values() if self._is_topology_data(value))
+            if sections not in section_indexes:
+                section_indexes[sections] = self._build_topology_index(group_layer)
+            topology_indexes[device_groups] = section_indexes[sections]
+        return self._lookup_node_id(topology_indexes[device_groups], hostname)
+
+    def _build_group_layer(
+        self,
+        inventory: InventoryData,
+        group_names: Tuple[str, ...],
+        converted_vars: Dict[Optional[str], Dict[str, Any]],
+        group_layers: Dict[Tuple[str, ...], Tuple[Dict[str, Any], Any]],
+    ) -> Tuple[Dict[str, Any], Any]:
+        """Merge global variables with the given groups' variables.
+
+        Layers are memoized in ``group_layers`` by group prefix: the layer of
+        ``(A, B, C)`` is built from the cached layer of ``(A, B)``, so group sets
+        sharing leading groups (fabric, pod, ...) only merge their own tail. The
+        empty prefix holds the global variables.
+
+        Each variable source (global_vars, then each group's vars) is copied and
+        numeric-converted once per run, cached in ``converted_vars`` (global vars
+        under the ``None`` key). Layers are merged with ``deep_merge(copy=False)``
+        so subtrees coming from the same source are one shared object across all
+        layers and devices. Nothing reachable from a layer may be mutated.
+
+        Parameters
+        ----------
+        inventory : InventoryData
+            Complete inventory data with resolved variables
+        group_names : Tuple[str, ...]
+            Sorted group names to merge, in merge order
+        converted_vars : Dict[Optional[str], Dict[str, Any]]
+            Cache of converted variable sources, filled on first use
+        group_layers : Dict[Tuple[str, ...], Tuple[Dict[str, Any], Any]]
+            Cache of merged layers keyed by group prefix, filled on first use
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], Any]
+            Merged and converted variables, and the AVD 'type' defined by the
+            groups (captured before numeric conversion) or None
+        """
+        # Start from the longest prefix of group_names already merged
+        depth = len(group_names)
+        while group_names[:depth] not in group_layers:
+            if not depth:
+                group_layers[()] = self._merge_layer_source({}, None, None, inventory.global_vars, converted_vars)
+                break
+            depth -= 1
+        layer, avd_type = group_layers[group_names[:depth]]
+
+        for index in range(depth, len(group_names)):
+            group_name = group_names[index]
+            if group_name in inventory.group_vars:
+                layer, avd_type = self._merge_layer_source(
+                    layer, avd_type, group_name, inventory.group_vars[group_name], converted_vars
+                )
+            group_layers[group_names[:index + 1]] = (layer, avd_type)
+
+        return layer, avd_type
+
+    def _merge_layer_source(
+        self,
+        layer: Dict[str, Any],
+        avd_type: Any,
+        source_name: Optional[str],
+        source_vars: Dict[str, Any],
+        converted_vars: Dict[Optional[str], Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], Any]:
+        """Merge one variable source on top of a layer, returning the new layer and AVD type."""
+        if "type" in source_vars:
+            raw_type = source_vars["type"]
+            if isinstance(avd_type, dict) and isinstance(raw_type, dict):
+                avd_type = deep_merge(avd_type, raw_type)
+            else:
+                avd_type = raw_type
+        if source_name not in converted_vars:
+            # Convert numeric strings to actual numbers (for pyavd schema validation)
+            # This handles Jinja2 templates that resolve to string numbers. Subtrees without
+            # numeric strings stay shared with the inventory instead of being deep-copied
+            converted_vars[source_name] = self._converted_numeric_strings(source_vars)
+        return deep_merge(layer, converted_vars[source_name], copy=False), avd_type
+
     def _convert_inventory_to_pyavd_inputs(
         self, inventory: InventoryData, devices: List[DeviceDefinition]
     ) -> Dict[str, Dict[str, Any]]:
@@ -402,24 +964,81 @@ class ConfigurationGenerator:
         """
         return self._build_pyavd_inputs_from_inventory(inventory, devices)
 
-    def _find_node_in_groups(self, node_groups: List[Any], hostname: str) -> Union[int, None]:
-        """Search through node groups for a hostname and return its ID."""
-        for node_group in node_groups:
-            if not isinstance(node_group, dict):
-                continue
+    @staticmethod
+    def _is_topology_data(value: Any) -> bool:
+        """Return True if value looks like an AVD node type definition (spine, l3leaf, p, ...)."""
+        # AVD variables are plain YAML data: exact type checks are enough and cheaper than isinstance
+        return type(value) is dict and any(subkey in value for subkey in _TOPOLOGY_SUBKEYS)
+
+    def _build_topology_index(self, device_vars: Dict[str, Any]) -> Dict[str, List[Tuple[Any, bool]]]:
+        """Index node IDs declared in the AVD topology structure by node name.
+
+        The topology is walked once; each hostname maps to its candidate IDs in
+        lookup order. Per topology key, the first ``node_groups[].nodes[]`` entry
+        is followed by the first direct ``nodes[]`` entry, which is final even when
+        invalid (flag set to True).
+
+        Parameters
+        ----------
+        device_vars : Dict[str, Any]
+            Variables containing AVD topology structure
+
+        Returns
+        -------
+        Dict[str, List[Tuple[Any, bool]]]
+            Candidate raw node IDs and their "final" flag, keyed by node name
+        """
+        index: Dict[str, List[Tuple[Any, bool]]] = {}
+        index_node = self._index_node
 
-            nodes = node_group.get("nodes", [])
-            if not isinstance(nodes, list):
+        # Discover topology keys dynamically from device_vars
+        # This supports L3LS-EVPN (spine, leaf), MPLS (p, pe), and custom node types
+        for topology_data in device_vars.values():
+            if not self._is_topology_data(topology_data):
                 continue
+            topology_get = topology_data.get
 
-            for node in nodes:
-                if not isinstance(node, dict):
-                    continue
+            found_in_groups: Set[str] = set()
+            node_groups = topology_get("node_groups", [])
+            if type(node_groups) is list:
+                for node_group in node_groups:
+                    if type(node_group) is not dict:
+                        continue
+                    nodes = node_group.get("nodes", [])
+                    if type(nodes) is not list:
+                        continue
+                    for node in nodes:
+                        index_node(index, node, found_in_groups, final=False)
 
-                if node.get("name") == hostname:
-                    node_id = node.get("id")
-                    if node_id is not None:
-                        return self._validate_node_id(node_id, hostname)
+            # Also check direct nodes[] (used in MPLS P routers)
+            found_in_nodes: Set[str] = set()
+            nodes = topology_get("nodes", [])
+            if type(nodes) is list:
+                for node in nodes:
+                    index_node(index, node, found_in_nodes, final=True)
+
+        return index
+
+    @staticmethod
+    def _index_node(
+        index: Dict[str, List[Tuple[Any, bool]]], node: Any, found: Set[str], final: bool
+    ) -> None:
+        """Record the first node ID seen for a node name within one topology section."""
+        if type(node) is not dict:
+            return
+        name = node.get("name")
+        node_id = node.get("id")
+        if type(name) is not str or node_id is None or name in found:
+            return
+        found.add(name)
+        index.setdefault(name, []).append((node_id, final))
+
+    def _lookup_node_id(self, index: Dict[str, List[Tuple[Any, bool]]], hostname: str) -> Union[int, None]:
+        """Resolve a hostname's node ID from a topology index."""
+        for node_id, final in index.get(hostname, []):
+            result = self._validate_node_id(node_id, hostname)
+            if result is not None or final:
+                return result
         return None
 
     def _validate_node_id(self, node_id: Any, hostname: str) -> Union[int, None]:
@@ -432,7 +1051,7 @@ class ConfigurationGenerator:
             )
             return None
 
-    def _determine_device_type(self, device_vars: Dict[str, Any], hostname: str) -> Union[str, None]:  # noqa: C901
+    def _determine_device_type(self, device_vars: Dict[str, Any], hostname: str) -> Union[str, None]:
         """Determine device type from AVD topology structure.
 
         Parameters
@@ -449,61 +1068,40 @@ class ConfigurationGenerator:
         """
         # Discover topology keys dynamically from device_vars
         # This supports L3LS-EVPN (spine, leaf), MPLS (p, pe), and custom node types
-        topology_keys = [
-            key for key in device_vars.keys()
-            if isinstance(device_vars.get(key), dict) and
-            any(subkey in device_vars[key] for subkey in ["defaults", "nodes", "node_groups"])
-        ]
-
-        for topology_key in topology_keys:
-            topology_data = device_vars.get(topology_key)
-            if not isinstance(topology_data, dict):
+        for topology_key, topology_data in device_vars.items():
+            if not self._is_topology_data(topology_data):
                 continue
+            topology_get = topology_data.get
 
-            # Check node_groups first
-            node_groups = topology_data.get("node_groups", [])
-            if isinstance(node_groups, list):
-                # Search through all node groups for matching hostname
+            # Check node_groups first, then direct nodes[] (used in MPLS P routers)
+            node_groups = topology_get("node_groups", [])
+            if type(node_groups) is list:
                 for node_group in node_groups:
-                    if not isinstance(node_group, dict):
+                    if type(node_group) is not dict:
                         continue
-
                     nodes = node_group.get("nodes", [])
-                    if not isinstance(nodes, list):
-                        continue
-
-                    for node in nodes:
-                        if not isinstance(node, dict):
-                            continue
-
-                        if node.get("name") == hostname:
-                            # Return the device type (topology_key)
-                            # Map l2leaf/l3spine to leaf/spine for consistency
-                            type_mapping = {
-                                "l2leaf": "leaf",
-                                "l3spine": "spine",
-                                "spine": "spine",
-                                "leaf": "leaf",
-                                "super_spine": "super_spine"
-                            }
-                            return type_mapping.get(topology_key, topology_key)
+                    if type(nodes) is list and self._has_node(nodes, hostname):
+                        # Map l2leaf/l3spine to leaf/spine for consistency
+                        return _DEVICE_TYPE_MAPPING.get(topology_key, topology_key)
 
-            # Also check direct nodes[] (used in MPLS P routers)
-            nodes = topology_data.get("nodes", [])
-            if isinstance(nodes, list):
-                for node in nodes:
-                    if not isinstance(node, dict):
-                        continue
-                    if node.get("name") == hostname:
-                        # Map type if needed
-                        type_mapping = {
-                            "l2leaf": "leaf",
-                            "l3spine": "spine",
-                        }
-                        return type_mapping.get(topology_key, topology_key)
+            nodes = topology_get("nodes", [])
+            if type(nodes) is list and self._has_node(nodes, hostname):
+                return _DEVICE_TYPE_MAPPING.get(topology_key, topology_key)
 
         return None
 
+    @staticmethod
+    def _has_node(nodes: List[Any], hostname: str) -> bool:
+        """Return True if a ``nodes[]`` list declares a node with the given name."""
+        for node in nodes:
+            try:
+                if node["name"] == hostname:
+                    return True
+            except (KeyError, TypeError):
+                # Missing name or not a dict node entry
+                continue
+        return False
+
     def _extract_node_id(self, device_vars: Dict[str, Any], hostname: str) -> Union[int, None]:
         """Extract node ID from AVD topology structure.
 
@@ -527,38 +1125,7 @@ class ConfigurationGenerator:
         int | None
             Node ID if found, None otherwise
         """
-        # Discover topology keys dynamically from device_vars
-        # This supports L3LS-EVPN (spine, leaf), MPLS (p, pe), and custom node types
-        topology_keys = [
-            key for key in device_vars.keys()
-            if isinstance(device_vars.get(key), dict) and
-            any(subkey in device_vars[key] for subkey in ["defaults", "nodes", "node_groups"])
-        ]
-
-        for topology_key in topology_keys:
-            topology_data = device_vars.get(topology_key)
-            if not isinstance(topology_data, dict):
-                continue
-
-            # Check node_groups first
-            node_groups = topology_data.get("node_groups", [])
-            if isinstance(node_groups, list):
-                result = self._find_node_in_groups(node_groups, hostname)
-                if result is not None:
-                    return result
-
-            # Also check direct nodes[] (used in MPLS P routers)
-            nodes = topology_data.get("nodes", [])
-            if isinstance(nodes, list):
-                for node in nodes:
-                    if not isinstance(node, dict):
-                        continue
-                    if node.get("name") == hostname:
-                        node_id = node.get("id")
-                        if node_id is not None:
-                            return self._validate_node_id(node_id, hostname)
-
-        return None
+        return self._lookup_node_id(self._build_topology_index(device_vars), hostname)
 
 
 class DocumentationGenerator:
@@ -568,8 +1135,16 @@ class DocumentationGenerator:
     data using py-avd library.
     """
 
-    def __init__(self) -> None:
-        """Initialize the documentation generator."""
+    def __init__(self, use_cache: bool = False) -> None:
+        """Initialize the documentation generator.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Reuse structured configs from the configuration cache of the output
+            directory, written by a previous run with the cache enabled, by default False
+        """
+        self.use_cache = use_cache
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.pyavd: Any = None
 
@@ -586,16 +1161,102 @@ class DocumentationGenerator:
         DocumentationGenerationError
             If pyavd is not installed
         """
-        try:
-            import pyavd
-            return pyavd
-        except ImportError as e:
-            raise DocumentationGenerationError(
-                "pyavd library not installed. Install with: pip install pyavd"
-            ) from e
+        if self.pyavd is None:
+            self.pyavd = _import_pyavd(DocumentationGenerationError)
+        return self.pyavd
+
+    def _generate_structured_configs(
+        self,
+        pyavd: Any,
+        inventory: InventoryData,
+        inputs: Optional[Dict[str, Dict[str, Any]]] = None,
+        cache: Optional[StructuredConfigCache] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Generate eos_designs structured configs for ALL devices of the inventory.
+
+        Devices whose entry in ``cache`` (the configuration cache, read-only here)
+        matches their inputs and the AVD facts are not generated again.
+        """
+        if inputs is None:
+            # Reuse the conversion logic from ConfigurationGenerator
+            config_gen = ConfigurationGenerator(workflow="eos-design")
+
+            # Build inputs from ALL devices (for proper AVD context)
+            all_devices = inventory.get_all_devices()
+            inputs = config_gen._build_pyavd_inputs_from_inventory(inventory, all_devices)
+        all_inputs = inputs
+        if not all_inputs:
+            return {}
+
+        # Generate AVD facts and structured configs for ALL devices
+        self.logger.info("Generating AVD facts for documentation")
+        avd_facts = pyavd.get_avd_facts(all_inputs)
+
+        # Same cache keys as ConfigurationGenerator, which wrote the entries
+        structured_configs, cache_keys = _lookup_cached_structured_configs(cache, all_inputs, avd_facts)
+        if len(cache_keys) < len(all_inputs):
+            self.logger.info("Reused %d cached structured configurations", len(all_inputs) - len(cache_keys))
+        pending = {hostname: all_inputs[hostname] for hostname in cache_keys}
+
+        structured_configs.update(_get_device_structured_configs(pyavd, pending, avd_facts))
+        return {hostname: structured_configs[hostname] for hostname in all_inputs}
+
+    def write_docs(
+        self,
+        structured_configs: Dict[str, Dict[str, Any]],
+        docs_dir: Path,
+        hostnames: Optional[Set[str]] = None,
+    ) -> List[Path]:
+        """Render and write device documentation from structured configs.
+
+        Parameters
+        ----------
+        structured_configs : Dict[str, Dict[str, Any]]
+            Structured configs keyed by hostname
+        docs_dir : Path
+            Directory to write documentation files to
+        hostnames : Optional[Set[str]], optional
+            If provided, only document these hostnames, by default all
+
+        Returns
+        -------
+        List[Path]
+            List of generated documentation file paths
+        """
+        pyavd = self._import_pyavd()
+
+        # Generate device documentation ONLY for filtered devices
+        hostnames_to_document = hostnames if hostnames is not None else set(structured_configs)
+
+        self.logger.info("Generating device documentation for %d devices", len(hostnames_to_document))
+        pending = {
+            hostname: structured_configs[hostname]
+            for hostname in hostnames_to_document
+            if hostname in structured_configs
+        }
+
+        # Templates are CPU bound: render large batches in worker processes
+        doc_texts = _map_in_worker_pool(_render_device_doc, pending, None)
+        if doc_texts is None:
+            # pyavd is not thread safe: render in this thread, only the writes are threaded
+            doc_texts = [
+                pyavd.get_device_doc(structured_config, add_md_toc=True) for structured_config in pending.values()
+            ]
+        generated_files = batch_write([
+            (docs_dir / f"{hostname}.md", doc_text.encode("utf-8"))
+            for hostname, doc_text in zip(pending, doc_texts)
+        ])
+        for doc_file in generated_files:
+            self.logger.debug("Generated doc: %s", doc_file)
+        return generated_files
 
     def generate(
-        self, inventory: InventoryData, output_path: Path, device_filter: Optional["DeviceFilter"] = None
+        self,
+        inventory: InventoryData,
+        output_path: Path,
+        device_filter: Optional["DeviceFilter"] = None,
+        structured_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+        inputs: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[Path]:
         """Generate device documentation.
 
@@ -609,6 +1270,14 @@ class DocumentationGenerator:
             Filter to determine which devices to generate docs for, by default None.
             Note: All devices are used for avd_facts calculation, filter only affects
             which doc files are written.
+        structured_configs : Optional[Dict[str, Dict[str, Any]]], optional
+            eos_designs structured configs already generated for ALL devices
+            (e.g. ``ConfigurationGenerator.eos_designs_configs``), by default None.
+            When provided, AVD facts and structured configs are not computed again.
+        inputs : Optional[Dict[str, Dict[str, Any]]], optional
+            pyavd inputs already built for ALL devices of the inventory (e.g. by
+            ConfigurationGenerator), by default None. Only used when
+            ``structured_configs`` is not provided.
 
         Returns
         -------
@@ -626,68 +1295,32 @@ class DocumentationGenerator:
         docs_dir = output_path / DEFAULT_DOCS_DIR
         docs_dir.mkdir(parents=True, exist_ok=True)
 
-        generated_files: List[Path] = []
-
         try:
             # Import pyavd
             pyavd = self._import_pyavd()
 
-            # Reuse the conversion logic from ConfigurationGenerator
-            from avd_cli.logics.generator import ConfigurationGenerator
-
-            config_gen = ConfigurationGenerator(workflow="eos-design")
-
             # Determine which devices to generate docs for
             if device_filter:
                 filtered_devices = [
                     d for d in inventory.get_all_devices()
                     if device_filter.matches_device(d.hostname, d.groups + [d.fabric])
                 ]
-                filtered_hostnames = {d.hostname for d in filtered_devices}
+                filtered_hostnames: Optional[Set[str]] = {d.hostname for d in filtered_devices}
             else:
                 filtered_hostnames = None
 
-            # Build inputs from ALL devices (for proper AVD context)
-            all_devices = inventory.get_all_devices()
-            all_inputs = config_gen._build_pyavd_inputs_from_inventory(inventory, all_devices)
-
-            if not all_inputs:
-                self.logger.warning("No devices to process")
-                return generated_files
-
-            # Generate AVD facts and structured configs for ALL devices
-            self.logger.info("Generating AVD facts for documentation")
-            avd_facts = pyavd.get_avd_facts(all_inputs)
-
-            structured_configs: Dict[str, Dict[str, Any]] = {}
-            for hostname, inputs in all_inputs.items():
-                structured_config = pyavd.get_device_structured_config(
-                    hostname=hostname, inputs=inputs, avd_facts=avd_facts
-                )
-                structured_configs[hostname] = (
-                    structured_config._as_dict() if hasattr(structured_config, "_as_dict") else structured_config
-                )
-
-            # Generate device documentation ONLY for filtered devices
-            hostnames_to_document = (
-                filtered_hostnames if filtered_hostnames is not None
-                else set(structured_configs.keys())
-            )
-
-            self.logger.info("Generating device documentation for %d devices", len(hostnames_to_document))
-            for hostname in hostnames_to_document:
-                if hostname not in structured_configs:
-                    continue
+            if structured_configs is None:
+                # Reuse structured configs cached by a previous configuration run, if enabled
+                cache_dir = output_path / DEFAULT_CONFIGS_DIR / CACHE_DIR_NAME
+                cache = None
+                if self.use_cache and cache_dir.is_dir():
+                    cache = StructuredConfigCache(cache_dir, _cache_salt(pyavd, "eos-design"))
+                structured_configs = self._generate_structured_configs(pyavd, inventory, inputs, cache)
+                if not structured_configs:
+                    self.logger.warning("No devices to process")
+                    return []
 
-                structured_config = structured_configs[hostname]
-                doc_file = docs_dir / f"{hostname}.md"
-                doc_text = pyavd.get_device_doc(structured_config, add_md_toc=True)
-
-                with open(doc_file, "w", encoding="utf-8") as f:
-                    f.write(doc_text)
-
-                generated_files.append(doc_file)
-                self.logger.debug("Generated doc: %s", doc_file)
+            generated_files = self.write_docs(structured_configs, docs_dir, filtered_hostnames)
 
             self.logger.info("Generated %d documentation files", len(generated_files))
             return generated_files
@@ -704,16 +1337,23 @@ class TestGenerator:
     This class handles generation of ANTA test files from AVD inventory data.
     """
 
-    def __init__(self, test_type: str = "anta") -> None:
+    def __init__(self, test_type: str = "anta", serialization_format: str = "yaml") -> None:
         """Initialize the test generator.
 
         Parameters
         ----------
         test_type : str, optional
             Test type ('anta' or 'robot'), by default "anta"
+        serialization_format : str, optional
+            Format of the generated catalog and inventory files ('yaml' or 'json'), by default "yaml".
+            JSON files are compact and much faster to write and parse, for machine consumers.
         """
         self.test_type = test_type
+        self.serialization_format = serialization_format
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.pyavd: Any = None
+        # (AVDFabricData, AntaCatalogFile) once probed, empty if the ANTA extra is not installed
+        self._anta_factory: Optional[Tuple[Any, ...]] = None
 
     def _filter_devices_with_id(self, all_inputs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Filter out devices without ID required for ANTA test generation.
@@ -742,39 +1382,46 @@ class TestGenerator:
             return {k: v for k, v in all_inputs.items() if "id" in v}
         return all_inputs
 
-    def _build_interface_tests(self, structured_configs: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Build interface tests for devices with interfaces configured."""
-        interface_tests = []
-        for hostname, config in structured_configs.items():
-            if config.get("ethernet_interfaces") or config.get("port_channel_interfaces"):
-                interface_tests.append({
-                    "VerifyInterfacesStatus": {
-                        "interfaces": [
-                            {"name": iface["name"], "status": "up"}
-                            for iface in config.get("ethernet_interfaces", [])
-                            if not iface.get("shutdown", False)
-                        ][:10],  # Limit to first 10 interfaces
-                        "filters": {"tags": [hostname]}
-                    }
-                })
-        return interface_tests
-
-    def _build_protocol_tests(self, structured_configs: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Build protocol-specific tests (MLAG, BGP, VXLAN)."""
-        protocol_tests: Dict[str, List[Dict[str, Any]]] = {}
-
-        # MLAG tests
-        mlag_tests = [
-            {"VerifyMlagStatus": {"filters": {"tags": [hostname]}}}
-            for hostname, config in structured_configs.items()
-            if config.get("mlag_configuration")
-        ]
-        if mlag_tests:
-            protocol_tests["anta.tests.mlag"] = mlag_tests
+    def _build_interface_test(self, hostname: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build the interface status test of a device, or None if it has no interfaces configured."""
+        ethernet_interfaces = config.get("ethernet_interfaces")
+        if not ethernet_interfaces and not config.get("port_channel_interfaces"):
+            return None
+        # Limit to first 10 interfaces: islice stops scanning once they are found
+        up_interfaces = islice(
+            (iface for iface in ethernet_interfaces or () if not iface.get("shutdown", False)), 10
+        )
+        return {
+            "VerifyInterfacesStatus": {
+                "interfaces": [{"name": iface["name"], "status": "up"} for iface in up_interfaces],
+                "filters": {"tags": [hostname]}
+            }
+        }
 
-        # BGP tests
-        bgp_tests = []
+    def _build_device_tests(self, structured_configs: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Build device-specific tests (connectivity, interfaces, MLAG, BGP, VXLAN) in a single pass."""
+        connectivity_tests: List[Dict[str, Any]] = []
+        interface_tests: List[Dict[str, Any]] = []
+        mlag_tests: List[Dict[str, Any]] = []
+        bgp_tests: List[Dict[str, Any]] = []
+        vxlan_tests: List[Dict[str, Any]] = []
+
+        # Every test gets its own filters dict: shared objects would be dumped as YAML aliases
         for hostname, config in structured_configs.items():
+            connectivity_tests.append({
+                "VerifyReachability": {
+                    "hosts": [{"destination": "8.8.8.8", "source": "Management0", "vrf": "default"}],
+                    "filters": {"tags": [hostname]}
+                }
+            })
+
+            interface_test = self._build_interface_test(hostname, config)
+            if interface_test:
+                interface_tests.append(interface_test)
+
+            if config.get("mlag_configuration"):
+                mlag_tests.append({"VerifyMlagStatus": {"filters": {"tags": [hostname]}}})
+
             if config.get("router_bgp"):
                 bgp_tests.extend([
                     {
@@ -793,28 +1440,28 @@ class TestGenerator:
                         }
                     }
                 ])
-        if bgp_tests:
-            protocol_tests["anta.tests.routing.bgp"] = bgp_tests
-
-        # VXLAN tests
-        vxlan_tests = [
-            {"VerifyVxlan1Interface": {"filters": {"tags": [hostname]}}}
-            for hostname, config in structured_configs.items()
-            if config.get("vxlan_interface")
-        ]
-        if vxlan_tests:
-            protocol_tests["anta.tests.vxlan"] = vxlan_tests
 
-        return protocol_tests
+            if config.get("vxlan_interface"):
+                vxlan_tests.append({"VerifyVxlan1Interface": {"filters": {"tags": [hostname]}}})
 
-    def _generate_basic_anta_catalog(self, structured_configs: Dict[str, Dict[str, Any]]) -> str:
-        """Generate a basic ANTA test catalog in YAML format.
+        # Connectivity tests are always listed, other categories only when they have tests
+        device_tests: Dict[str, List[Dict[str, Any]]] = {"anta.tests.connectivity": connectivity_tests}
+        for category, tests in (
+            ("anta.tests.interfaces", interface_tests),
+            ("anta.tests.mlag", mlag_tests),
+            ("anta.tests.routing.bgp", bgp_tests),
+            ("anta.tests.vxlan", vxlan_tests),
+        ):
+            if tests:
+                device_tests[category] = tests
+        return device_tests
+
+    def _generate_basic_anta_catalog(self, structured_configs: Dict[str, Dict[str, Any]]) -> bytes:
+        """Generate a basic ANTA test catalog as UTF-8 encoded YAML.
 
         Creates a comprehensive ANTA catalog with tests for all devices based on their configurations.
         Tests are organized by category and use filters/tags for device-specific targeting.
         """
-        import yaml
-
         # Organize tests by category
         catalog: Dict[str, List[Dict[str, Any]]] = {}
 
@@ -839,77 +1486,100 @@ class TestGenerator:
             {"VerifyNTP": None},
         ]
 
-        # Connectivity tests per device
-        catalog["anta.tests.connectivity"] = [
-            {
-                "VerifyReachability": {
-                    "hosts": [{"destination": "8.8.8.8", "source": "Management0", "vrf": "default"}],
-                    "filters": {"tags": [hostname]}
-                }
-            }
-            for hostname in structured_configs.keys()
-        ]
-
-        # Interface tests
-        interface_tests = self._build_interface_tests(structured_configs)
-        if interface_tests:
-            catalog["anta.tests.interfaces"] = interface_tests
-
-        # Protocol tests (MLAG, BGP, VXLAN)
-        catalog.update(self._build_protocol_tests(structured_configs))
+        # Device-specific tests (connectivity, interfaces, MLAG, BGP, VXLAN)
+        catalog.update(self._build_device_tests(structured_configs))
 
-        return yaml.dump(catalog, default_flow_style=False, sort_keys=False)
+        return self._dump_data(catalog)
 
     def _generate_anta_inventory(
         self, structured_configs: Dict[str, Dict[str, Any]], inventory: InventoryData
     ) -> str:
         """Generate ANTA inventory file with device connection information."""
-        import yaml
-
-        # Build inventory structure
-        hosts = []
-        for hostname in structured_configs.keys():
-            device = inventory.get_device_by_hostname(hostname)
-            if device:
-                hosts.append({
-                    "host": str(device.mgmt_ip),
-                    "name": hostname,
-                    "tags": [device.fabric, device.device_type],
-                })
-
-        anta_inventory = {
-            "anta_inventory": {
-                "hosts": hosts
-            }
-        }
-
-        return yaml.dump(anta_inventory, default_flow_style=False, sort_keys=False)
-
-    def _serialize_anta_catalog(self, catalog_file_obj: Any) -> str:
-        """Serialize ANTA catalog to YAML, handling Python 3.10 Pydantic compatibility.
+        # Index devices once instead of scanning the inventory for every host
+        device_map = {device.hostname: device for device in inventory.get_all_devices()}
+        rows = [
+            (str(device.mgmt_ip), hostname, device.fabric, device.device_type)
+            for hostname in structured_configs
+            if (device := device_map.get(hostname)) is not None
+        ]
 
-        This method provides a workaround for Pydantic serialization issues that occur
+        if self.serialization_format == "json":
+            hosts = [
+                {"host": host, "name": name, "tags": [fabric, device_type]}
+                for host, name, fabric, device_type in rows
+            ]
+            return fastjson.dumps({"anta_inventory": {"hosts": hosts}}).decode("utf-8")
+        return self._dump_anta_inventory(rows)
+
+    @staticmethod
+    def _dump_anta_inventory(rows: List[Tuple[str, str, str, str]]) -> str:
+        """Serialize ANTA inventory rows to YAML.
+
+        The inventory has a fixed, shallow layout, so each ``(host, name, fabric,
+        device_type)`` row is formatted directly instead of building host dicts
+        and walking them with ``yaml.dump``. Hostnames, IPv4 addresses and tags
+        are written exactly as PyYAML would write them; other values may be
+        quoted where PyYAML would not.
+        """
+        if not rows:
+            return "anta_inventory:\n  hosts: []\n"
+        scalar = fastyaml.scalar
+        return "anta_inventory:\n  hosts:\n" + "".join([
+            f"  - host: {scalar(host)}\n    name: {scalar(name)}\n    tags:\n"
+            f"    - {scalar(fabric)}\n    - {scalar(device_type)}\n"
+            for host, name, fabric, device_type in rows
+        ])
+
+    def _dump_data(self, data: Any) -> bytes:
+        """Serialize test data to UTF-8 encoded YAML or JSON, as configured."""
+        if self.serialization_format == "json":
+            return fastjson.dumps(data)
+        return fastyaml.dump_bytes(data)
+
+    def _serialize_anta_catalog(self, catalog_file_obj: Any) -> bytes:
+        """Serialize ANTA catalog to UTF-8 encoded YAML, handling Python 3.10 Pydantic compatibility.
+
+        ANTA's yaml() method dumps the catalog to JSON, loads it back with the
+        pure-Python YAML loader and dumps it again. The same document is built
+        here by parsing the JSON dump directly and emitting it with the libyaml
+        dumper.
+
+        This method also provides a workaround for Pydantic serialization issues that occur
         with Python 3.10 and older ANTA versions (1.5.0). The standard yaml() method
         uses model_dump_json() which can fail with 'Unable to serialize unknown type:
         <class 'module'>' errors on Python 3.10.
-        """
-        import yaml
-        import math
 
+        With the JSON serialization format, the JSON dump is written as is.
+        """
         try:
-            # Try the native ANTA yaml() method first (works on Python 3.11+)
-            result: str = catalog_file_obj.yaml()
-            return result
-        except Exception:
-            # Fallback for Python 3.10: manually serialize the catalog structure
-            self.logger.debug(
-                "Using fallback ANTA catalog serialization for Python 3.10 compatibility"
-            )
-            catalog_data = self._extract_catalog_data(catalog_file_obj)
-            yaml_str: str = yaml.dump(
-                catalog_data, default_flow_style=False, sort_keys=False, width=math.inf
+            catalog_json: str = catalog_file_obj.model_dump_json(serialize_as_any=True, exclude_unset=True)
+            if self.serialization_format == "json":
+                return catalog_json.encode("utf-8")
+            return fastyaml.dump_bytes(
+                json.loads(catalog_json), sort_keys=True, indent=2, width=fastyaml.UNLIMITED_WIDTH
             )
-            return yaml_str
+        except Exception:
+            pass
+
+        if self.serialization_format != "json":
+            try:
+                # Try the native ANTA yaml() method (works on Python 3.11+)
+                result: str = catalog_file_obj.yaml()
+                return result.encode("utf-8")
+            except Exception:
+                pass
+
+        # Fallback for Python 3.10: manually serialize the catalog structure
+        self.logger.debug(
+            "Using fallback ANTA catalog serialization for Python 3.10 compatibility"
+        )
+        catalog_data = self._extract_catalog_data(catalog_file_obj)
+        if self.serialization_format == "json":
+            return fastjson.dumps(catalog_data)
+        yaml_bytes: bytes = yaml.dump(
+            catalog_data, default_flow_style=False, sort_keys=False, width=math.inf, encoding="utf-8"
+        )
+        return yaml_bytes
 
     def _extract_catalog_data(self, catalog_file_obj: Any) -> Dict[str, Any]:
         """Extract catalog data from AntaCatalogFile for manual serialization."""
@@ -962,58 +1632,58 @@ class TestGenerator:
         self, pyavd: Any, all_inputs: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Dict[str, Any]]:
         """Generate structured configurations for all devices using pyavd."""
-        self.logger.info("Generating AVD facts for test catalog (%d devices)", len(all_inputs))
+        self.logger.info("Generating AVD facts and structured configurations for %d devices", len(all_inputs))
         avd_facts = pyavd.get_avd_facts(all_inputs)
+        return _get_device_structured_configs(pyavd, all_inputs, avd_facts)
 
-        self.logger.info("Generating structured configurations for %d devices", len(all_inputs))
-        structured_configs: Dict[str, Dict[str, Any]] = {}
-        for hostname, inputs in all_inputs.items():
-            structured_config = pyavd.get_device_structured_config(
-                hostname=hostname, inputs=inputs, avd_facts=avd_facts
-            )
-            structured_configs[hostname] = (
-                structured_config._as_dict() if hasattr(structured_config, "_as_dict") else structured_config
-            )
-        return structured_configs
+    def _import_anta_factory(self) -> Tuple[Any, ...]:
+        """Import pyavd's ANTA test factory classes, probing the environment once per generator.
 
-    def _write_anta_catalog(self, tests_dir: Path, structured_configs: Dict[str, Dict[str, Any]]) -> Path:
-        """Write ANTA catalog file, using pyavd factory if available or basic generation as fallback."""
+        Returns
+        -------
+        Tuple[Any, ...]
+            ``(AVDFabricData, AntaCatalogFile)``, or an empty tuple if anta/pydantic are not installed
+        """
+        if self._anta_factory is None:
+            try:
+                from anta.catalog import AntaCatalogFile
+                from pyavd.api.anta import AVDFabricData
+            except ImportError as e:
+                self.logger.warning(
+                    "Could not use pyavd ANTA factory (%s: %s). Generating basic catalog.",
+                    type(e).__name__, str(e)
+                )
+                self._anta_factory = ()
+            else:
+                self._anta_factory = (AVDFabricData, AntaCatalogFile)
+        return self._anta_factory
+
+    def _build_anta_catalog(self, pyavd: Any, structured_configs: Dict[str, Dict[str, Any]]) -> bytes:
+        """Build the ANTA catalog as UTF-8 encoded YAML, using pyavd factory if available or basic generation."""
         self.logger.info("Generating comprehensive ANTA test catalog for %d devices", len(structured_configs))
 
-        catalog_file = tests_dir / "anta_catalog.yml"
+        anta_factory = self._import_anta_factory()
+        if not anta_factory:
+            return self._generate_basic_anta_catalog(structured_configs)
+        avd_fabric_data_cls, anta_catalog_file_cls = anta_factory
 
         try:
-            # Try to use pyavd.get_device_test_catalog if anta/pydantic are available
-            from pyavd.api.anta import AVDFabricData
-            import pyavd
-
             # Build fabric data once for cross-device test generation
-            fabric_data = AVDFabricData.from_structured_configs(structured_configs)
+            fabric_data = avd_fabric_data_cls.from_structured_configs(structured_configs)
 
             # Generate per-device catalogs and combine them
-            all_tests = []
-            for hostname, struct_config in structured_configs.items():
-                device_catalog = pyavd.get_device_test_catalog(
-                    hostname=hostname,
-                    structured_config=struct_config,
-                    fabric_data=fabric_data,
-                )
-                all_tests.extend(device_catalog.tests)
-
-            # Write combined catalog using ANTA's native dump method
-            self.logger.info("Writing ANTA catalog to: %s", catalog_file)
+            all_tests = _get_device_test_catalogs(pyavd, structured_configs, fabric_data)
 
-            # Create an ANTA catalog from all tests
-            from anta.catalog import AntaCatalog
-            combined_catalog = AntaCatalog(tests=all_tests)
+            # Group tests by module like AntaCatalog(tests=...).dump(), without validating
+            # again the test definitions pyavd just built
+            root: Dict[str, List[Any]] = {}
+            for test in all_tests:
+                root.setdefault(test.test.__module__, []).append(test)
+            catalog_file_obj = anta_catalog_file_cls.model_construct(root=root)
 
-            # Use ANTA's dump method to get AntaCatalogFile, then serialize to YAML
             # Note: We use a custom serialization approach to avoid Pydantic serialization
             # issues with Python 3.10 and older ANTA versions
-            catalog_file_obj = combined_catalog.dump()
-            yaml_content = self._serialize_anta_catalog(catalog_file_obj)
-            with open(catalog_file, "w", encoding="utf-8") as f:
-                f.write(yaml_content)
+            return self._serialize_anta_catalog(catalog_file_obj)
 
         except Exception as e:
             # Fall back to basic ANTA catalog generation if pyavd ANTA factory is unavailable
@@ -1023,14 +1693,14 @@ class TestGenerator:
                 "Could not use pyavd ANTA factory (%s: %s). Generating basic catalog.",
                 type(e).__name__, str(e)
             )
-            self.logger.info("Writing basic ANTA catalog to: %s", catalog_file)
-            with open(catalog_file, "w", encoding="utf-8") as f:
-                f.write(self._generate_basic_anta_catalog(structured_configs))
-
-        return catalog_file
+            return self._generate_basic_anta_catalog(structured_configs)
 
     def generate(
-        self, inventory: InventoryData, output_path: Path, device_filter: Optional["DeviceFilter"] = None
+        self,
+        inventory: InventoryData,
+        output_path: Path,
+        device_filter: Optional["DeviceFilter"] = None,
+        inputs: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> List[Path]:
         """Generate test files.
 
@@ -1044,6 +1714,9 @@ class TestGenerator:
             Filter to determine which devices to generate tests for, by default None.
             Note: All devices are used for avd_facts calculation, filter only affects
             which test files are written.
+        inputs : Optional[Dict[str, Dict[str, Any]]], optional
+            pyavd inputs already built for ALL devices of the inventory (e.g. by
+            ConfigurationGenerator), by default None
 
         Returns
         -------
@@ -1064,19 +1737,18 @@ class TestGenerator:
         generated_files: List[Path] = []
 
         try:
-            # Import pyavd for ANTA catalog generation
-            try:
-                import pyavd
-            except ImportError as e:
-                raise TestGenerationError(
-                    "pyavd library not installed. Install with: pip install pyavd"
-                ) from e
-
-            # Reuse the conversion logic from ConfigurationGenerator
-            config_gen = ConfigurationGenerator(workflow="eos-design")
-            # Build inputs from ALL devices (for proper AVD context)
-            all_devices = inventory.get_all_devices()
-            all_inputs = config_gen._build_pyavd_inputs_from_inventory(inventory, all_devices)
+            # Import pyavd for ANTA catalog generation, once per generator
+            if self.pyavd is None:
+                self.pyavd = _import_pyavd(TestGenerationError)
+            pyavd = self.pyavd
+
+            if inputs is None:
+                # Reuse the conversion logic from ConfigurationGenerator
+                config_gen = ConfigurationGenerator(workflow="eos-design")
+                # Build inputs from ALL devices (for proper AVD context)
+                all_devices = inventory.get_all_devices()
+                inputs = config_gen._build_pyavd_inputs_from_inventory(inventory, all_devices)
+            all_inputs = inputs
 
             if not all_inputs:
                 self.logger.warning("No devices to process")
@@ -1092,18 +1764,19 @@ class TestGenerator:
             # Generate structured configs for all devices
             structured_configs = self._generate_structured_configs(pyavd, all_inputs)
 
-            # Generate and write ANTA catalog
-            catalog_file = self._write_anta_catalog(tests_dir, structured_configs)
-            generated_files.append(catalog_file)
-
-            # Generate ANTA inventory file with device information
-            inventory_file = tests_dir / "anta_inventory.yml"
-            self.logger.info("Generating ANTA inventory file: %s", inventory_file)
-
-            with open(inventory_file, "w", encoding="utf-8") as f:
-                f.write(self._generate_anta_inventory(structured_configs, inventory))
+            # Generate ANTA catalog and inventory file with device information
+            suffix = ".json" if self.serialization_format == "json" else ".yml"
+            catalog_file = tests_dir / f"anta_catalog{suffix}"
+            inventory_file = tests_dir / f"anta_inventory{suffix}"
+            catalog_content = self._build_anta_catalog(pyavd, structured_configs)
+            inventory_content = self._generate_anta_inventory(structured_configs, inventory)
 
-            generated_files.append(inventory_file)
+            # Write both files in a single batch
+            self.logger.info("Writing ANTA catalog and inventory files to: %s", tests_dir)
+            generated_files.extend(batch_write([
+                (catalog_file, catalog_content),
+                (inventory_file, inventory_content.encode("utf-8")),
+            ]))
 
             self.logger.info(
                 "Generated %d ANTA files (catalog + inventory) with tests for all configured features",
@@ -1122,6 +1795,8 @@ def generate_all(
     output_path: Path,
     workflow: str = "eos-design",
     device_filter: Optional["DeviceFilter"] = None,
+    skip_structured_config_validation: bool = False,
+    use_cache: bool = False,
 ) -> Tuple[List[Path], List[Path], List[Path]]:
     """Generate all outputs: configurations, documentation, and tests.
 
@@ -1137,18 +1812,36 @@ def generate_all(
         Filter to determine which devices to generate outputs for, by default None.
         Note: All devices are used for avd_facts calculation, filter only affects
         which output files are written.
+    skip_structured_config_validation : bool, optional
+        Skip structured config validation before rendering configurations, by default False
+    use_cache : bool, optional
+        Reuse cached structured configs of unchanged devices, by default False
 
     Returns
     -------
     Tuple[List[Path], List[Path], List[Path]]
         Tuple of (config_files, doc_files, test_files)
     """
-    config_gen = ConfigurationGenerator(workflow=normalize_workflow(workflow))
-    doc_gen = DocumentationGenerator()
+    config_gen = ConfigurationGenerator(
+        workflow=normalize_workflow(workflow),
+        skip_structured_config_validation=skip_structured_config_validation,
+        use_cache=use_cache,
+    )
+    doc_gen = DocumentationGenerator(use_cache=use_cache)
     test_gen = TestGenerator()
 
     configs = config_gen.generate(inventory, output_path, device_filter)
-    docs = doc_gen.generate(inventory, output_path, device_filter)
-    tests = test_gen.generate(inventory, output_path, device_filter)
+    # Documentation uses eos_designs structured configs: reuse those computed for the configurations
+    shared_structured_configs = config_gen.eos_designs_configs if config_gen.workflow == "eos-design" else None
+    # Merged group/host variables are built once for the whole run
+    docs = doc_gen.generate(
+        inventory,
+        output_path,
+        device_filter,
+        structured_configs=shared_structured_configs,
+        inputs=config_gen.inputs,
+    )
+    # Test catalogs keep their own facts and structured configs, computed over devices with an id only
+    tests = test_gen.generate(inventory, output_path, device_filter, inputs=config_gen.inputs)
 
     return configs, docs, tests
@@ -8,9 +8,10 @@ and convert them into structured data models.
 """
 
 import logging
+import os
 from ipaddress import ip_address
 from pathlib import Path
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import yaml
 
@@ -18,6 +19,7 @@ from avd_cli.constants import INVENTORY_GROUP_VARS_DIR, INVENTORY_HOST_VARS_DIR
 from avd_cli.exceptions import FileSystemError, InvalidInventoryError
 from avd_cli.logics.templating import TemplateResolver, build_template_context
 from avd_cli.models.inventory import DeviceDefinition, FabricDefinition, InventoryData
+from avd_cli.utils import fastyaml
 from avd_cli.utils.merge import deep_merge
 
 logger = logging.getLogger(__name__)
@@ -54,6 +56,8 @@ class InventoryLoader:
     def __init__(self) -> None:
         """Initialize the inventory loader."""
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # inventory.yml contents parsed during the current load(), by file path
+        self._inventory_files: Optional[Dict[Path, Dict[str, Any]]] = None
 
     def load(self, inventory_path: Path) -> InventoryData:
         """Load AVD inventory from directory.
@@ -80,6 +84,15 @@ class InventoryLoader:
         # Validate directory exists and is readable
         self._validate_inventory_path(inventory_path)
 
+        # inventory.yml is read by several extractors: parse it once for this load
+        self._inventory_files = {}
+        try:
+            return self._load(inventory_path)
+        finally:
+            self._inventory_files = None
+
+    def _load(self, inventory_path: Path) -> InventoryData:
+        """Load a validated inventory directory (see :meth:`load`)."""
         # Load global variables
         global_vars = self._load_global_vars(inventory_path)
 
@@ -116,37 +129,38 @@ class InventoryLoader:
             len(host_vars),
         )
 
-        # Build template context BEFORE resolving templates
-        # This allows templates to reference hostvars that include group vars
-        self.logger.debug("Building template context with enriched hostvars")
-        context = build_template_context(global_vars, group_vars, host_vars)
-
         # Resolve Jinja2 templates in multiple passes
         # This handles nested templates (templates that reference other templates)
         self.logger.debug("Resolving Jinja2 templates in inventory variables")
+        # Variable sources still holding templates: everything on the first pass. Once a
+        # source has no template left, resolving it again would return it unchanged
+        pending_global = True
+        pending_groups = list(group_vars)
+        pending_hosts = list(host_vars)
+        # A single resolver keeps templates compiled across passes
+        resolver = TemplateResolver({}, inventory_path=inventory_path)
         max_passes = 5  # Prevent infinite loops
         for pass_num in range(max_passes):
-            # Rebuild context with partially resolved variables
-            context = build_template_context(global_vars, group_vars, host_vars)
-            resolver = TemplateResolver(context, inventory_path=inventory_path)
-
-            # Resolve templates in all variable dictionaries
-            new_global_vars = resolver.resolve_recursive(global_vars)
-            new_group_vars = {name: resolver.resolve_recursive(data) for name, data in group_vars.items()}
-            new_host_vars = {name: resolver.resolve_recursive(data) for name, data in host_vars.items()}
-
-            # Check if anything changed (templates resolved)
-            if (
-                new_global_vars == global_vars
-                and new_group_vars == group_vars
-                and new_host_vars == host_vars
-            ):
+            # Build template context with partially resolved variables
+            # This allows templates to reference hostvars that include group vars
+            resolver.set_context(build_template_context(global_vars, group_vars, host_vars))
+
+            # Resolve templates in the pending variable dictionaries only
+            new_global_vars = resolver.resolve_recursive(global_vars) if pending_global else global_vars
+            new_group_vars = {name: resolver.resolve_recursive(group_vars[name]) for name in pending_groups}
+            new_host_vars = {name: resolver.resolve_recursive(host_vars[name]) for name in pending_hosts}
+
+            # Check if anything changed (templates resolved), as tracked by the resolver
+            if not resolver.changed:
                 self.logger.debug("Template resolution complete after %d passes", pass_num + 1)
                 break
 
             global_vars = new_global_vars
-            group_vars = new_group_vars
-            host_vars = new_host_vars
+            group_vars = {**group_vars, **new_group_vars}
+            host_vars = {**host_vars, **new_host_vars}
+            pending_global = pending_global and resolver.contains_template(global_vars)
+            pending_groups = [name for name in pending_groups if resolver.contains_template(group_vars[name])]
+            pending_hosts = [name for name in pending_hosts if resolver.contains_template(host_vars[name])]
         else:
             self.logger.warning(
                 "Template resolution reached max passes (%d), some templates may remain unresolved",
@@ -222,8 +236,8 @@ class InventoryLoader:
         all_yml = inventory_path / INVENTORY_GROUP_VARS_DIR / "all.yml"
         if all_yml.exists():
             try:
-                with open(all_yml, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                with open(all_yml, "rb") as f:
+                    data = fastyaml.load(f)
                     if data:
                         global_vars.update(data)
                 self.logger.debug("Loaded global vars from: %s", all_yml)
@@ -258,22 +272,25 @@ class InventoryLoader:
             return group_vars
 
         try:
-            # Iterate through all entries in group_vars
-            for entry in group_vars_path.iterdir():
-                if entry.name == "all.yml" or entry.name == "all":
-                    continue  # Already loaded in global_vars
-
-                if entry.is_file() and entry.suffix in [".yml", ".yaml"]:
-                    # Single file format
-                    group_name = entry.stem
-                    group_vars[group_name] = self._load_yaml_file(entry)
-                    self.logger.debug("Loaded group vars for: %s (file)", group_name)
-
-                elif entry.is_dir():
-                    # Directory format - merge all YAML files
-                    group_name = entry.name
-                    group_vars[group_name] = self._load_yaml_directory(entry)
-                    self.logger.debug("Loaded group vars for: %s (directory)", group_name)
+            # Iterate through all entries in group_vars. DirEntry reuses the file type
+            # read with the directory listing instead of calling stat() per entry
+            with os.scandir(group_vars_path) as entries:
+                for entry in entries:
+                    if entry.name == "all.yml" or entry.name == "all":
+                        continue  # Already loaded in global_vars
+
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix in (".yml", ".yaml") and entry.is_file():
+                        # Single file format
+                        group_name = stem
+                        group_vars[group_name] = self._load_yaml_file(Path(entry.path))
+                        self.logger.debug("Loaded group vars for: %s (file)", group_name)
+
+                    elif entry.is_dir():
+                        # Directory format - merge all YAML files
+                        group_name = entry.name
+                        group_vars[group_name] = self._load_yaml_directory(Path(entry.path))
+                        self.logger.debug("Loaded group vars for: %s (directory)", group_name)
 
         except OSError as e:
             raise FileSystemError(f"Cannot read group_vars directory: {e}") from e
@@ -305,18 +322,20 @@ class InventoryLoader:
 
         try:
             # Iterate through all entries in host_vars
-            for entry in host_vars_path.iterdir():
-                if entry.is_file() and entry.suffix in [".yml", ".yaml"]:
-                    # Single file format
-                    hostname = entry.stem
-                    host_vars[hostname] = self._load_yaml_file(entry)
-                    self.logger.debug("Loaded host vars for: %s (file)", hostname)
-
-                elif entry.is_dir():
-                    # Directory format - merge all YAML files
-                    hostname = entry.name
-                    host_vars[hostname] = self._load_yaml_directory(entry)
-                    self.logger.debug("Loaded host vars for: %s (directory)", hostname)
+            with os.scandir(host_vars_path) as entries:
+                for entry in entries:
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix in (".yml", ".yaml") and entry.is_file():
+                        # Single file format
+                        hostname = stem
+                        host_vars[hostname] = self._load_yaml_file(Path(entry.path))
+                        self.logger.debug("Loaded host vars for: %s (file)", hostname)
+
+                    elif entry.is_dir():
+                        # Directory format - merge all YAML files
+                        hostname = entry.name
+                        host_vars[hostname] = self._load_yaml_directory(Path(entry.path))
+                        self.logger.debug("Loaded host vars for: %s (directory)", hostname)
 
         except OSError as e:
             raise FileSystemError(f"Cannot read host_vars directory: {e}") from e
@@ -340,16 +359,12 @@ class InventoryLoader:
             Dictionary mapping hostnames to their variables from inventory.yml
         """
         inventory_hosts: Dict[str, Dict[str, Any]] = {}
-        inventory_yml = inventory_path / "inventory.yml"
-
-        if not inventory_yml.exists():
-            # Try .yaml extension
-            inventory_yml = inventory_path / "inventory.yaml"
-            if not inventory_yml.exists():
-                return inventory_hosts
+        inventory_yml = self._find_inventory_yml(inventory_path)
+        if inventory_yml is None:
+            return inventory_hosts
 
         try:
-            inventory_data = self._load_yaml_file(inventory_yml)
+            inventory_data = self._load_inventory_yml(inventory_yml)
             self._extract_hosts_recursive(inventory_data, inventory_hosts)
             self.logger.debug("Extracted %d hosts from inventory.yml", len(inventory_hosts))
         except Exception as e:
@@ -374,15 +389,12 @@ class InventoryLoader:
             Dictionary mapping group names to their variables from inventory.yml
         """
         inventory_group_vars: Dict[str, Dict[str, Any]] = {}
-        inventory_yml = inventory_path / "inventory.yml"
-
-        if not inventory_yml.exists():
-            inventory_yml = inventory_path / "inventory.yaml"
-            if not inventory_yml.exists():
-                return inventory_group_vars
+        inventory_yml = self._find_inventory_yml(inventory_path)
+        if inventory_yml is None:
+            return inventory_group_vars
 
         try:
-            inventory_data = self._load_yaml_file(inventory_yml)
+            inventory_data = self._load_inventory_yml(inventory_yml)
             self._extract_group_vars_recursive(inventory_data, inventory_group_vars, current_group="root")
             self.logger.debug("Extracted group vars for %d groups from inventory.yml",
                               len(inventory_group_vars))
@@ -397,7 +409,10 @@ class InventoryLoader:
         result: Dict[str, Dict[str, Any]],
         current_group: str,
     ) -> None:
-        """Recursively extract group vars from inventory structure.
+        """Extract group vars from inventory structure.
+
+        Nested groups are walked depth-first with an explicit stack, in the same
+        order as a recursive walk, so deep inventories cannot hit the recursion limit.
 
         Parameters
         ----------
@@ -408,24 +423,19 @@ class InventoryLoader:
         current_group : str
             Name of current group being processed
         """
-        if not isinstance(data, dict):
-            return
+        stack: List[Tuple[Any, Any]] = [(data, current_group)]
+        while stack:
+            node, group = stack.pop()
+            if not isinstance(node, dict):
+                continue
 
-        # Check if this level has 'vars'
-        if "vars" in data and isinstance(data["vars"], dict):
-            if current_group not in result:
-                result[current_group] = {}
-            result[current_group].update(data["vars"])
+            # Check if this level has 'vars'
+            if "vars" in node and isinstance(node["vars"], dict):
+                if group not in result:
+                    result[group] = {}
+                result[group].update(node["vars"])
 
-        # Recurse into children
-        if "children" in data and isinstance(data["children"], dict):
-            for child_name, child_data in data["children"].items():
-                self._extract_group_vars_recursive(child_data, result, child_name)
-
-        # Also check any other dict values that might be groups
-        for key, value in data.items():
-            if key not in ["hosts", "children", "vars"] and isinstance(value, dict):
-                self._extract_group_vars_recursive(value, result, key)
+            stack.extend((value, name) for name, value, _ in reversed(self._inventory_subgroups(node)))
 
     def _build_group_hierarchy(self, inventory_path: Path) -> Dict[str, List[str]]:
         """Build a map of group names to ALL their ancestor groups (including self).
@@ -445,30 +455,20 @@ class InventoryLoader:
             Dictionary mapping each group name to sorted list of ALL its ancestor groups
             (e.g., {"campus_leaves": ["atd", "campus_avd", "campus_leaves", "campus_ports", "campus_services", "lab"]})
         """
-        inventory_yml = inventory_path / "inventory.yml"
-        if not inventory_yml.exists():
-            inventory_yml = inventory_path / "inventory.yaml"
-            if not inventory_yml.exists():
-                self.logger.warning("No inventory.yml found, cannot build group hierarchy")
-                return {}
+        inventory_yml = self._find_inventory_yml(inventory_path)
+        if inventory_yml is None:
+            self.logger.warning("No inventory.yml found, cannot build group hierarchy")
+            return {}
 
         try:
-            inventory_data = self._load_yaml_file(inventory_yml)
+            inventory_data = self._load_inventory_yml(inventory_yml)
         except Exception as e:
             self.logger.warning("Failed to load inventory.yml for hierarchy: %s", e)
             return {}
 
-        # First pass: build all paths
-        all_paths: Dict[str, List[List[str]]] = {}
-        self._extract_all_paths_recursive(inventory_data, all_paths, [])
-
-        # Second pass: flatten to sets of all ancestors, then convert to sorted lists
+        # Collect the ancestors of each group over all its paths from the root
         hierarchy_sets: Dict[str, Set[str]] = {}
-        for group_name, paths in all_paths.items():
-            ancestors = set()
-            for path in paths:
-                ancestors.update(path)
-            hierarchy_sets[group_name] = ancestors
+        self._extract_group_ancestors(inventory_data, hierarchy_sets)
 
         # Convert sets to sorted lists for consistent ordering
         hierarchy: Dict[str, List[str]] = {
@@ -478,44 +478,40 @@ class InventoryLoader:
         self.logger.debug("Built hierarchy for %d groups", len(hierarchy))
         return hierarchy
 
-    def _extract_all_paths_recursive(
-        self,
-        data: Any,
-        result: Dict[str, List[List[str]]],
-        current_path: List[str],
-    ) -> None:
-        """Recursively extract ALL paths to each group (handles multiple parents).
+    def _extract_group_ancestors(self, data: Any, result: Dict[str, Set[str]]) -> None:
+        """Collect ALL ancestors of each group, including itself (handles multiple parents).
+
+        Each group gets the union of the groups on every path leading to it, built
+        in a single depth-first walk with an explicit stack.
 
         Parameters
         ----------
         data : Any
-            Current level of inventory data
-        result : Dict[str, List[List[str]]]
-            Dictionary to populate with all paths to each group
-        current_path : List[str]
-            Current path from root to this level
+            Inventory data
+        result : Dict[str, Set[str]]
+            Dictionary to populate with the ancestor set of each group
         """
-        if not isinstance(data, dict):
-            return
-
-        # Process children groups
-        if "children" in data and isinstance(data["children"], dict):
-            for child_name, child_data in data["children"].items():
-                # Add this path for the child
-                child_path = current_path + [child_name]
-                if child_name not in result:
-                    result[child_name] = []
-                result[child_name].append(child_path)
-                # Recurse into child
-                self._extract_all_paths_recursive(child_data, result, child_path)
-
-        # Also check top-level groups (like 'lab', 'all', etc.)
-        for key, value in data.items():
-            if key not in ["hosts", "children", "vars"] and isinstance(value, dict):
-                if key not in result:
+        # Entries are (group data, group name, ancestors of the parent, listed under 'children'),
+        # with None instead of the flag for the starting level
+        stack: List[Tuple[Any, Any, FrozenSet[str], Optional[bool]]] = [(data, None, frozenset(), None)]
+        while stack:
+            node, name, ancestors, is_child = stack.pop()
+            if is_child:
+                # Add the ancestors along this path for the child
+                ancestors = ancestors | {name}
+                if name not in result:
+                    result[name] = set()
+                result[name] |= ancestors
+            elif is_child is not None:
+                # Also check top-level groups (like 'lab', 'all', etc.)
+                if name not in result:
                     # This is a root-level group
-                    result[key] = [[key]]
-                self._extract_all_paths_recursive(value, result, [key])
+                    result[name] = {name}
+                ancestors = frozenset((name,))
+            if isinstance(node, dict):
+                stack.extend(
+                    (value, key, ancestors, child) for key, value, child in reversed(self._inventory_subgroups(node))
+                )
 
     def _extract_hierarchy_recursive(
         self,
@@ -523,7 +519,10 @@ class InventoryLoader:
         result: Dict[str, List[str]],
         ancestors: List[str],
     ) -> None:
-        """Recursively build group hierarchy by traversing inventory structure.
+        """Build group hierarchy by traversing inventory structure.
+
+        Nested groups are walked depth-first with an explicit stack, in the same
+        order as a recursive walk, so deep inventories cannot hit the recursion limit.
 
         Parameters
         ----------
@@ -534,26 +533,26 @@ class InventoryLoader:
         ancestors : List[str]
             List of ancestor group names from root to current level
         """
-        if not isinstance(data, dict):
-            return
-
-        # Process children groups
-        if "children" in data and isinstance(data["children"], dict):
-            for child_name, child_data in data["children"].items():
+        # Entries are (group data, group name, ancestors of the parent, listed under 'children'),
+        # with None instead of the flag for the starting level
+        stack: List[Tuple[Any, Any, List[str], Optional[bool]]] = [(data, None, ancestors, None)]
+        while stack:
+            node, name, group_ancestors, is_child = stack.pop()
+            if is_child:
                 # Record this child's full ancestry (ancestors + self)
-                child_ancestors = ancestors + [child_name]
-                result[child_name] = child_ancestors
-                # Recurse into child
-                self._extract_hierarchy_recursive(child_data, result, child_ancestors)
-
-        # Also check top-level groups (like 'lab', 'all', etc.)
-        for key, value in data.items():
-            if key not in ["hosts", "children", "vars"] and isinstance(value, dict):
-                if key not in result:
-                    # This is a root-level group
-                    group_ancestors = [key]
-                    result[key] = group_ancestors
-                    self._extract_hierarchy_recursive(value, result, group_ancestors)
+                group_ancestors = group_ancestors + [name]
+                result[name] = group_ancestors
+            elif is_child is not None:
+                if name in result:
+                    continue
+                # This is a root-level group
+                group_ancestors = [name]
+                result[name] = group_ancestors
+            if isinstance(node, dict):
+                stack.extend(
+                    (value, key, group_ancestors, child)
+                    for key, value, child in reversed(self._inventory_subgroups(node))
+                )
 
     def _build_host_to_group_map(self, inventory_path: Path) -> Dict[str, str]:
         """Build a map of hostnames to their immediate Ansible group.
@@ -571,15 +570,13 @@ class InventoryLoader:
         Dict[str, str]
             Dictionary mapping hostname to its immediate group name
         """
-        inventory_yml = inventory_path / "inventory.yml"
-        if not inventory_yml.exists():
-            inventory_yml = inventory_path / "inventory.yaml"
-            if not inventory_yml.exists():
-                self.logger.warning("No inventory.yml found, cannot build host-to-group map")
-                return {}
+        inventory_yml = self._find_inventory_yml(inventory_path)
+        if inventory_yml is None:
+            self.logger.warning("No inventory.yml found, cannot build host-to-group map")
+            return {}
 
         try:
-            inventory_data = self._load_yaml_file(inventory_yml)
+            inventory_data = self._load_inventory_yml(inventory_yml)
         except Exception as e:
             self.logger.warning("Failed to load inventory.yml for host mapping: %s", e)
             return {}
@@ -595,7 +592,10 @@ class InventoryLoader:
         result: Dict[str, str],
         current_group: str,
     ) -> None:
-        """Recursively find hosts and record their immediate group.
+        """Find hosts and record their immediate group.
+
+        Nested groups are walked depth-first with an explicit stack, in the same
+        order as a recursive walk, so deep inventories cannot hit the recursion limit.
 
         Parameters
         ----------
@@ -606,24 +606,18 @@ class InventoryLoader:
         current_group : str
             Name of current group being processed
         """
-        if not isinstance(data, dict):
-            return
-
-        # Check if this level has 'hosts'
-        if "hosts" in data and isinstance(data["hosts"], dict):
-            for hostname in data["hosts"].keys():
-                # Record this host's immediate group
-                result[hostname] = current_group
+        stack: List[Tuple[Any, Any]] = [(data, current_group)]
+        while stack:
+            node, group = stack.pop()
+            if not isinstance(node, dict):
+                continue
 
-        # Recurse into children
-        if "children" in data and isinstance(data["children"], dict):
-            for child_name, child_data in data["children"].items():
-                self._extract_host_groups_recursive(child_data, result, child_name)
+            # Check if this level has 'hosts'
+            if "hosts" in node and isinstance(node["hosts"], dict):
+                # Record each host's immediate group
+                result.update(dict.fromkeys(node["hosts"], group))
 
-        # Also check any other dict values that might be groups
-        for key, value in data.items():
-            if key not in ["hosts", "children", "vars"] and isinstance(value, dict):
-                self._extract_host_groups_recursive(value, result, key)
+            stack.extend((value, name) for name, value, _ in reversed(self._inventory_subgroups(node)))
 
     def _extract_hosts_recursive(
         self,
@@ -631,7 +625,10 @@ class InventoryLoader:
         result: Dict[str, Dict[str, Any]],
         parent_vars: Union[Dict[str, Any], None] = None,
     ) -> None:
-        """Recursively extract hosts from inventory structure with inherited vars.
+        """Extract hosts from inventory structure with inherited vars.
+
+        Nested groups are walked depth-first with an explicit stack, in the same
+        order as a recursive walk, so deep inventories cannot hit the recursion limit.
 
         Parameters
         ----------
@@ -642,34 +639,94 @@ class InventoryLoader:
         parent_vars : Dict[str, Any], optional
             Variables inherited from parent groups
         """
-        if not isinstance(data, dict):
-            return
-
-        # Start with parent vars or empty dict
-        current_vars = dict(parent_vars) if parent_vars else {}
-
-        # Merge vars at this level
-        if "vars" in data and isinstance(data["vars"], dict):
-            current_vars.update(data["vars"])
-
-        # Check if this level has 'hosts'
-        if "hosts" in data and isinstance(data["hosts"], dict):
-            for hostname, host_data in data["hosts"].items():
-                # Merge: parent group vars + host vars
-                if isinstance(host_data, dict):
-                    result[hostname] = {**current_vars, **host_data}
-                else:
-                    result[hostname] = dict(current_vars)
-
-        # Recurse into children with accumulated vars
-        if "children" in data and isinstance(data["children"], dict):
-            for child_data in data["children"].values():
-                self._extract_hosts_recursive(child_data, result, current_vars)
-
-        # Also check any other dict values that might contain groups
-        for key, value in data.items():
-            if key not in ["hosts", "children", "vars"] and isinstance(value, dict):
-                self._extract_hosts_recursive(value, result, current_vars)
+        stack: List[Tuple[Any, Dict[str, Any]]] = [(data, parent_vars or {})]
+        while stack:
+            node, current_vars = stack.pop()
+            if not isinstance(node, dict):
+                continue
+
+            # Merge vars at this level. Levels without vars share their parent's
+            # dict, which is never modified once built
+            if "vars" in node and isinstance(node["vars"], dict):
+                current_vars = {**current_vars, **node["vars"]}
+
+            # Check if this level has 'hosts'
+            if "hosts" in node and isinstance(node["hosts"], dict):
+                for hostname, host_data in node["hosts"].items():
+                    # Merge: parent group vars + host vars
+                    if isinstance(host_data, dict):
+                        result[hostname] = {**current_vars, **host_data}
+                    else:
+                        result[hostname] = dict(current_vars)
+
+            # Walk children with accumulated vars
+            stack.extend((value, current_vars) for _, value, _ in reversed(self._inventory_subgroups(node)))
+
+    def _inventory_subgroups(self, data: Dict[str, Any]) -> List[Tuple[Any, Any, bool]]:
+        """List the groups nested in one level of the inventory structure.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            Current level of inventory data
+
+        Returns
+        -------
+        List[Tuple[Any, Any, bool]]
+            ``(name, data, listed_under_children)`` for each entry of 'children',
+            then for each other dict value that might be a group, in walk order
+        """
+        subgroups: List[Tuple[Any, Any, bool]] = []
+        children = data.get("children")
+        if isinstance(children, dict):
+            subgroups.extend((name, value, True) for name, value in children.items())
+        subgroups.extend(
+            (key, value, False)
+            for key, value in data.items()
+            if key not in ("hosts", "children", "vars") and isinstance(value, dict)
+        )
+        return subgroups
+
+    def _find_inventory_yml(self, inventory_path: Path) -> Optional[Path]:
+        """Find the inventory file of an inventory directory.
+
+        Parameters
+        ----------
+        inventory_path : Path
+            Path to inventory directory
+
+        Returns
+        -------
+        Optional[Path]
+            Path to inventory.yml, or to inventory.yaml if only that one exists,
+            None if there is neither
+        """
+        for name in ("inventory.yml", "inventory.yaml"):
+            inventory_yml = inventory_path / name
+            if inventory_yml.exists():
+                return inventory_yml
+        return None
+
+    def _load_inventory_yml(self, inventory_yml: Path) -> Dict[str, Any]:
+        """Load inventory.yml, parsing it only once per :meth:`load` call.
+
+        The extractors only read the parsed data, so they can share it.
+
+        Parameters
+        ----------
+        inventory_yml : Path
+            Path to the inventory.yml (or inventory.yaml) file
+
+        Returns
+        -------
+        Dict[str, Any]
+            Loaded data
+        """
+        if self._inventory_files is None:
+            return self._load_yaml_file(inventory_yml)
+        if inventory_yml not in self._inventory_files:
+            self._inventory_files[inventory_yml] = self._load_yaml_file(inventory_yml)
+        return self._inventory_files[inventory_yml]
 
     def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
         """Load a single YAML file.
@@ -690,8 +747,8 @@ class InventoryLoader:
             If YAML is invalid
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with open(file_path, "rb") as f:
+                data = fastyaml.load(f)
                 return data if data else {}
         except yaml.YAMLError as e:
             raise InvalidInventoryError(f"Invalid YAML in {file_path}: {e}") from e
@@ -722,9 +779,12 @@ class InventoryLoader:
         merged_data: Dict[str, Any] = {}
 
         # Get all YAML files and sort alphabetically
-        yaml_files = sorted(
-            [f for f in dir_path.iterdir() if f.is_file() and f.suffix in [".yml", ".yaml"]]
-        )
+        with os.scandir(dir_path) as entries:
+            yaml_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if os.path.splitext(entry.name)[1] in (".yml", ".yaml") and entry.is_file()
+            )
 
         for yaml_file in yaml_files:
             file_data = self._load_yaml_file(yaml_file)
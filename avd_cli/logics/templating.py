@@ -62,6 +62,13 @@ class TemplateResolver:
         self.context = context
         self.inventory_path = inventory_path
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Set when a resolved value differs from its template, so callers iterating
+        # to a fixed point do not have to compare data structures
+        self.changed = False
+        # Compiled templates and expressions by source: the same templates recur across
+        # hosts and resolution passes, and Environment.from_string() does not cache them
+        self._templates: Dict[str, Any] = {}
+        self._expressions: Dict[str, Any] = {}
 
         # Create Jinja2 environment with default undefined behavior
         # (undefined variables render as empty string instead of raising error)
@@ -82,6 +89,20 @@ class TemplateResolver:
         # Note: We don't store method references directly to avoid MyPy type issues
         self._supported_plugins = {'file', 'env', 'vars'}
 
+    def set_context(self, context: Dict[str, Any]) -> None:
+        """Replace the template context and reset the :attr:`changed` flag.
+
+        Lets one resolver, and its compiled templates, be reused across
+        resolution passes over updated variables.
+
+        Parameters
+        ----------
+        context : Dict[str, Any]
+            Variables available for template resolution
+        """
+        self.context = context
+        self.changed = False
+
     @staticmethod
     def _filter_bool(value: Any) -> bool:
         """Convert value to boolean (Ansible-style).
@@ -313,6 +334,37 @@ class TemplateResolver:
         """
         return bool(self.TEMPLATE_PATTERN.search(value))
 
+    def contains_template(self, data: Any) -> bool:
+        """Check if a data structure still contains templates to resolve.
+
+        Values of variables starting with 'raw_' are ignored, as in
+        :meth:`resolve_dict`: they are never resolved.
+
+        Parameters
+        ----------
+        data : Any
+            Data structure (dict, list, str, int, bool, None, etc.)
+
+        Returns
+        -------
+        bool
+            True if any string in ``data`` contains template syntax
+        """
+        stack: List[Any] = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str):
+                # Substring probe first: most values are plain strings
+                if ("{{" in value or "{%" in value) and self.has_template(value):
+                    return True
+            elif isinstance(value, dict):
+                stack.extend(
+                    item for key, item in value.items() if not (isinstance(key, str) and key.startswith('raw_'))
+                )
+            elif isinstance(value, list):
+                stack.extend(value)
+        return False
+
     def resolve(self, template_str: str) -> str:
         """Resolve a single template string.
 
@@ -344,9 +396,13 @@ class TemplateResolver:
             return template_str
 
         try:
-            template = self.env.from_string(template_str)
+            template = self._templates.get(template_str)
+            if template is None:
+                template = self._templates[template_str] = self.env.from_string(template_str)
             result = template.render(self.context)
             self.logger.debug("Resolved template '%s' to '%s'", template_str, result)
+            if result != template_str:
+                self.changed = True
             return result
         except Jinja2TemplateError as e:
             error_msg = f"Template error: {e}"
@@ -412,12 +468,18 @@ class TemplateResolver:
                 # Resolve and return the actual type using compile_expression
                 # This preserves dict/list/int types instead of converting to string
                 try:
-                    compiled_expr = self.env.compile_expression(expression)
+                    compiled_expr = self._expressions.get(expression)
+                    if compiled_expr is None:
+                        compiled_expr = self._expressions[expression] = self.env.compile_expression(expression)
                     result = compiled_expr(**self.context)
-                    self.logger.info(
-                        "Type-preserving resolution: '%s' -> %s (type: %s)",
-                        value[:80], str(result)[:80], type(result).__name__
-                    )
+                    # str() of a resolved dict or list is costly: only build it when logged
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(
+                            "Type-preserving resolution: '%s' -> %s (type: %s)",
+                            value[:80], str(result)[:80], type(result).__name__
+                        )
+                    if type(result) is not str or result != value:
+                        self.changed = True
                     return result
                 except Jinja2TemplateError as e:
                     error_msg = f"Template error: {e}"
@@ -521,6 +583,9 @@ class TemplateResolver:
         if isinstance(data, list):
             return self.resolve_list(data)
         if isinstance(data, str):
+            # Most values are plain strings: skip the template machinery for them
+            if "{{" not in data and "{%" not in data:
+                return data
             return self.resolve_value(data)  # Use resolve_value to preserve types
         # Preserve non-string types (int, bool, None, etc.)
         return data
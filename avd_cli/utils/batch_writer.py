@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""Batched file writing utilities.
+
+This module groups many small output files (device configurations,
+documentation) into a single batch submitted to a thread pool, so the
+blocking ``open``/``write``/``close`` syscalls overlap instead of running
+one after the other on the generation critical path.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+# Below this number of files the thread pool startup costs more than it saves
+SEQUENTIAL_THRESHOLD = 4
+
+
+def _write_one(path: Path, data: bytes) -> Path:
+    """Write a single file and return its path.
+
+    Content is written once, so the file is opened unbuffered: bytes go straight
+    to the raw file with no intermediate buffer copy.
+    """
+    with open(path, "wb", buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            # A raw write may write less than requested (e.g. when interrupted)
+            view = view[f.write(view):]
+    return path
+
+
+def batch_write(pairs: Sequence[Tuple[Path, bytes]], max_workers: Optional[int] = None) -> List[Path]:
+    """Write a batch of files to disk.
+
+    Parameters
+    ----------
+    pairs : Sequence[Tuple[Path, bytes]]
+        Destination paths and their encoded content
+    max_workers : Optional[int], optional
+        Maximum number of writer threads, by default ``min(32, cpu_count + 4)``
+
+    Returns
+    -------
+    List[Path]
+        Written file paths, in the same order as ``pairs``
+
+    Raises
+    ------
+    OSError
+        If any file cannot be written. The first error encountered is raised
+        once all submitted writes have completed.
+
+    Examples
+    --------
+    >>> batch_write([(Path("a.cfg"), b"hostname a\\n"), (Path("b.cfg"), b"hostname b\\n")])
+    [PosixPath('a.cfg'), PosixPath('b.cfg')]
+    """
+    if len(pairs) < SEQUENTIAL_THRESHOLD:
+        return [_write_one(path, data) for path, data in pairs]
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="avd-cli-writer") as executor:
+        futures = [executor.submit(_write_one, path, data) for path, data in pairs]
+        return [future.result() for future in futures]
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""On-disk cache of structured configurations.
+
+This module lets configuration generation skip unchanged devices: each
+device's eos_designs structured configuration is stored next to the
+generated configs, keyed by a fingerprint of everything it was built from,
+together with a digest of the configuration file rendered from it.
+"""
+
+import hashlib
+import logging
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from avd_cli.utils import fastjson
+from avd_cli.utils.batch_writer import batch_write
+
+logger = logging.getLogger(__name__)
+
+# Cache directory name, created inside the configs output directory
+CACHE_DIR_NAME = ".avdcache"
+
+
+def fingerprint(data: Any) -> Optional[str]:
+    """Return a stable digest of a data structure.
+
+    Plain data is hashed through its canonical JSON form, so the digest does
+    not depend on dict insertion order. Data that is not JSON serializable
+    (e.g. pyavd objects) is pickled instead.
+
+    Parameters
+    ----------
+    data : Any
+        Data to fingerprint (typically nested dicts and lists)
+
+    Returns
+    -------
+    Optional[str]
+        Hex digest of the serialized data, or None if it cannot be serialized
+    """
+    try:
+        payload = fastjson.dumps_canonical(data)
+    except (TypeError, ValueError):
+        try:
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _digest(data: bytes) -> str:
+    """Return the hex digest of raw bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class StructuredConfigCache:
+    """Per-device cache of structured configs and rendered config digests.
+
+    Each device has one JSON entry ``<cache_dir>/<hostname>.json`` holding the
+    fingerprint of its inputs, its eos_designs structured config and the
+    digest of the configuration file last rendered from it. Entries are stored as JSON (not
+    pickle) so that a tampered cache directory cannot execute code.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory holding cache entries
+    salt : str
+        Value mixed into every fingerprint (tool versions, workflow), so that
+        changing it invalidates all entries
+
+    Examples
+    --------
+    >>> cache = StructuredConfigCache(configs_dir / CACHE_DIR_NAME, salt="6.1.0:eos-design")
+    >>> key = cache.fingerprint(inputs)
+    >>> structured_config = cache.get("leaf-1a", key)
+    """
+
+    def __init__(self, cache_dir: Path, salt: str) -> None:
+        self.cache_dir = cache_dir
+        self.salt = salt
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._current: Dict[str, str] = {}
+        self._dirty: Set[str] = set()
+
+    def fingerprint(self, *parts: Any) -> Optional[str]:
+        """Fingerprint the given parts together with the cache salt."""
+        return fingerprint((self.salt,) + parts)
+
+    def _load_entry(self, hostname: str) -> Optional[Dict[str, Any]]:
+        """Load a cache entry from disk, returning None if missing or unreadable."""
+        if hostname not in self._entries:
+            entry_file = self.cache_dir / f"{hostname}.json"
+            try:
+                with open(entry_file, "rb") as f:
+                    entry = fastjson.loads(f.read())
+            except (OSError, ValueError):
+                return None
+            if not isinstance(entry, dict):
+                return None
+            self._entries[hostname] = entry
+        return self._entries[hostname]
+
+    def get(self, hostname: str, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached structured config for a device if its fingerprint matches.
+
+        Parameters
+        ----------
+        hostname : str
+            Device hostname
+        key : Optional[str]
+            Current fingerprint of the device; None disables caching for it
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Cached structured config, or None on cache miss
+        """
+        if key is None:
+            return None
+        self._current[hostname] = key
+        entry = self._load_entry(hostname)
+        if entry is None or entry.get("fingerprint") != key:
+            return None
+        structured_config = entry.get("structured_config")
+        return structured_config if isinstance(structured_config, dict) else None
+
+    def put(self, hostname: str, key: Optional[str], structured_config: Dict[str, Any]) -> None:
+        """Record the structured config generated for a device fingerprint."""
+        if key is None:
+            return
+        self._current[hostname] = key
+        self._entries[hostname] = {"fingerprint": key, "structured_config": structured_config, "config_digest": None}
+        self._dirty.add(hostname)
+
+    def is_config_current(self, hostname: str, config_file: Path) -> bool:
+        """Check whether a config file was rendered from the device's current cache entry.
+
+        Parameters
+        ----------
+        hostname : str
+            Device hostname
+        config_file : Path
+            Rendered configuration file
+
+        Returns
+        -------
+        bool
+            True if the cache entry matches this run and the file content is unchanged
+        """
+        entry = self._entries.get(hostname)
+        if entry is None or hostname in self._dirty or entry.get("fingerprint") != self._current.get(hostname):
+            return False
+        try:
+            with open(config_file, "rb") as f:
+                return bool(entry.get("config_digest")) and entry["config_digest"] == _digest(f.read())
+        except OSError:
+            return False
+
+    def record_config(self, hostname: str, config_text: str) -> str:
+        """Record the digest of the configuration rendered for a device and return the text unchanged."""
+        entry = self._entries.get(hostname)
+        if entry is not None and entry.get("fingerprint") == self._current.get(hostname):
+            entry["config_digest"] = _digest(config_text.encode("utf-8"))
+            self._dirty.add(hostname)
+        return config_text
+
+    def save(self) -> None:
+        """Write updated entries to disk.
+
+        Entries are serialized first, then written together through
+        :func:`~avd_cli.utils.batch_writer.batch_write`. Entries whose structured
+        config does not survive a JSON round trip are dropped. Write errors are
+        logged and ignored: the cache is an optimization.
+        """
+        pairs: List[Tuple[Path, bytes]] = []
+        for hostname in sorted(self._dirty):
+            entry = self._entries[hostname]
+            try:
+                payload = fastjson.dumps(entry)
+                if fastjson.loads(payload) != entry:
+                    logger.debug("Structured config for %s is not JSON round-trippable, not cached", hostname)
+                    continue
+            except (TypeError, ValueError) as e:
+                logger.debug("Unable to serialize cache entry for %s: %s", hostname, e)
+                continue
+            pairs.append((self.cache_dir / f"{hostname}.json", payload))
+        self._dirty.clear()
+
+        if not pairs:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            batch_write(pairs)
+        except OSError as e:
+            logger.debug("Unable to write cache entries to %s: %s", self.cache_dir, e)
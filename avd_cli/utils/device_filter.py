@@ -7,13 +7,18 @@ This module provides filtering functionality for selecting devices
 based on hostname or group name patterns using glob-style wildcards.
 """
 
-from dataclasses import dataclass
-from fnmatch import fnmatch
-from typing import TYPE_CHECKING, List, Optional
+import re
+from dataclasses import dataclass, field
+from fnmatch import translate
+from os.path import normcase
+from typing import TYPE_CHECKING, Callable, FrozenSet, List, Optional
 
 if TYPE_CHECKING:
     from avd_cli.models.inventory import DeviceDefinition, InventoryData
 
+# Characters that make a pattern a glob instead of an exact name
+_GLOB_CHARS = frozenset("*?[")
+
 
 @dataclass
 class DeviceFilter:
@@ -29,6 +34,27 @@ class DeviceFilter:
     """
 
     patterns: List[str]
+    # Exact names and one compiled matcher for all glob patterns, built once per filter
+    _names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _glob_match: Optional[Callable[[str], Optional["re.Match[str]"]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Split patterns into exact names (set lookup) and a single compiled glob regex.
+
+        Like ``fnmatch.fnmatch``, patterns and names are normalized with
+        ``os.path.normcase``, so matching is case-insensitive on Windows.
+        """
+        patterns = [normcase(pattern) for pattern in self.patterns]
+        globs = [pattern for pattern in patterns if not _GLOB_CHARS.isdisjoint(pattern)]
+        self._names = frozenset(pattern for pattern in patterns if _GLOB_CHARS.isdisjoint(pattern))
+        self._glob_match = re.compile("|".join(map(translate, globs))).match if globs else None
+
+    def _matches(self, name: str) -> bool:
+        """Check if a name matches any pattern."""
+        name = normcase(name)
+        if name in self._names:
+            return True
+        return self._glob_match is not None and self._glob_match(name) is not None
 
     @classmethod
     def from_patterns(cls, patterns: Optional[List[str]]) -> Optional["DeviceFilter"]:
@@ -59,7 +85,8 @@ class DeviceFilter:
     def matches_hostname(self, hostname: str) -> bool:
         """Check if hostname matches any pattern.
 
-        Pattern matching is case-sensitive and uses glob-style wildcards:
+        Pattern matching is case-sensitive (except on Windows, as with
+        ``fnmatch.fnmatch``) and uses glob-style wildcards:
         - * matches any number of characters
         - ? matches exactly one character
         - [...] matches any character in the brackets
@@ -74,12 +101,13 @@ class DeviceFilter:
         bool
             True if hostname matches any pattern, False otherwise
         """
-        return any(fnmatch(hostname, pattern) for pattern in self.patterns)
+        return self._matches(hostname)
 
     def matches_group(self, group: str) -> bool:
         """Check if group name matches any pattern.
 
-        Pattern matching is case-sensitive and uses glob-style wildcards:
+        Pattern matching is case-sensitive (except on Windows, as with
+        ``fnmatch.fnmatch``) and uses glob-style wildcards:
         - * matches any number of characters
         - ? matches exactly one character
         - [...] matches any character in the brackets
@@ -94,7 +122,7 @@ class DeviceFilter:
         bool
             True if group matches any pattern, False otherwise
         """
-        return any(fnmatch(group, pattern) for pattern in self.patterns)
+        return self._matches(group)
 
     def matches_device(self, hostname: str, groups: List[str]) -> bool:
         """Check if device matches filter by hostname OR group membership.
@@ -119,11 +147,14 @@ class DeviceFilter:
             True if device matches by hostname or any group, False otherwise
         """
         # Check hostname match first
-        if self.matches_hostname(hostname):
+        if self._matches(hostname):
             return True
 
-        # Check if any group matches
-        return any(self.matches_group(group) for group in groups)
+        # Check if any group matches: exact names with one set operation, then globs
+        if not self._names.isdisjoint(groups):
+            return True
+        glob_match = self._glob_match
+        return glob_match is not None and any(glob_match(group) is not None for group in groups)
 
     def __repr__(self) -> str:
         """Return string representation of filter.
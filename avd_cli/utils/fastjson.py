@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""JSON serialization helpers.
+
+This module uses ``orjson`` when it is installed (``pip install avd-cli[speedups]``)
+and falls back to the standard library ``json`` module otherwise. Both backends
+produce the same compact, key-sorted output for plain AVD data, so serialized
+payloads can be hashed to fingerprint data structures.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize data to compact UTF-8 encoded JSON.
+
+    Parameters
+    ----------
+    obj : Any
+        Data to serialize (nested dicts, lists and scalars)
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON document
+
+    Raises
+    ------
+    TypeError
+        If the data contains values that are not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """Serialize data to canonical JSON suitable for hashing.
+
+    Keys are sorted at every level so that equal data always gives the same
+    bytes, regardless of dict insertion order.
+
+    Parameters
+    ----------
+    obj : Any
+        Data to serialize (nested dicts, lists and scalars)
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded canonical JSON document
+
+    Raises
+    ------
+    TypeError
+        If the data contains values that are not JSON serializable
+
+    Examples
+    --------
+    >>> dumps_canonical({"b": 1, "a": [1, "2"]})
+    b'{"a":[1,"2"],"b":1}'
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+
+    Parameters
+    ----------
+    data : Union[bytes, str]
+        JSON document
+
+    Returns
+    -------
+    Any
+        Deserialized data
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
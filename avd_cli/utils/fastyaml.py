@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""YAML serialization helpers.
+
+This module loads and emits YAML with the libyaml-backed ``CSafeLoader`` and
+``CSafeDumper`` when PyYAML was built with libyaml (the default for PyYAML
+wheels) and falls back to the pure-Python ``SafeLoader`` and ``SafeDumper``
+otherwise. Both dumpers produce the same documents, except that long quoted
+strings may be folded at different points.
+"""
+
+import json
+import re
+from typing import IO, Any, Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Line width that disables folding. libyaml takes a C int, so math.inf cannot be used
+UNLIMITED_WIDTH = 2**31 - 1
+
+# Strings made of these characters are emitted unquoted, unless they resolve to another type
+_PLAIN_RE = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_./-]*")
+_RESOLVER = yaml.resolver.Resolver()
+
+
+def _implicit_tag(value: str) -> str:
+    """Return the tag a plain scalar resolves to when loaded."""
+    tag: str = _RESOLVER.resolve(yaml.ScalarNode, value, (True, False))  # type: ignore[no-untyped-call]
+    return tag
+
+
+def load(stream: Union[bytes, str, IO[bytes], IO[str]]) -> Any:
+    """Load a single YAML document with the safe loader.
+
+    Parameters
+    ----------
+    stream : Union[bytes, str, IO[bytes], IO[str]]
+        YAML document, or a file opened in binary or text mode. Binary input is
+        decoded by the parser itself (UTF-8 or UTF-16 with BOM).
+
+    Returns
+    -------
+    Any
+        Loaded data, None for an empty document
+
+    Raises
+    ------
+    yaml.YAMLError
+        If the document is not valid YAML
+
+    Examples
+    --------
+    >>> load(b"a: [1, '2']")
+    {'a': [1, '2']}
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, **options: Any) -> str:
+    """Serialize plain data to a block-style YAML document.
+
+    Parameters
+    ----------
+    data : Any
+        Data to serialize (nested dicts, lists and scalars)
+    **options : Any
+        Extra ``yaml.dump`` options (e.g. ``indent``, ``width``). Block style
+        and insertion key order are used unless overridden.
+
+    Returns
+    -------
+    str
+        YAML document
+
+    Raises
+    ------
+    yaml.representer.RepresenterError
+        If the data contains objects that are not plain YAML types
+
+    Examples
+    --------
+    >>> dump({"b": 1, "a": [1, "2"]})
+    "b: 1\\na:\\n- 1\\n- '2'\\n"
+    """
+    options.setdefault("default_flow_style", False)
+    options.setdefault("sort_keys", False)
+    result: str = yaml.dump(data, Dumper=SafeDumper, **options)
+    return result
+
+
+def dump_bytes(data: Any, **options: Any) -> bytes:
+    """Serialize plain data to a UTF-8 encoded block-style YAML document.
+
+    The emitter encodes the document itself, so content written to a file
+    does not go through an intermediate ``str``.
+
+    Parameters
+    ----------
+    data : Any
+        Data to serialize (nested dicts, lists and scalars)
+    **options : Any
+        Extra ``yaml.dump`` options, as for :func:`dump`
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded YAML document, equal to ``dump(data, **options).encode("utf-8")``
+    """
+    options.setdefault("default_flow_style", False)
+    options.setdefault("sort_keys", False)
+    result: bytes = yaml.dump(data, Dumper=SafeDumper, encoding="utf-8", **options)
+    return result
+
+
+def scalar(value: str) -> str:
+    """Format a string as a YAML scalar, quoting it only when needed.
+
+    Used by writers that emit a fixed document layout directly instead of
+    walking data with ``yaml.dump``. Strings that would load back as another
+    type (``"true"``, ``"65101"``, ``"1.5"``...) or that contain indicator
+    characters are quoted.
+
+    Parameters
+    ----------
+    value : str
+        String to format
+
+    Returns
+    -------
+    str
+        Plain, single-quoted or double-quoted YAML scalar that loads back as ``value``
+
+    Examples
+    --------
+    >>> scalar("leaf-1a"), scalar("65101"), scalar("fe80::1")
+    ('leaf-1a', "'65101'", "'fe80::1'")
+    """
+    if _PLAIN_RE.fullmatch(value) and _implicit_tag(value) == yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG:
+        return value
+    if value.isascii() and value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+    # JSON string escapes are a subset of YAML double-quoted escapes
+    return json.dumps(value)
@@ -240,6 +240,59 @@ class TestGenerateConfigsCommand:
         assert result.exit_code == 0
         mock_generator.generate.assert_called_once()
 
+    @patch("avd_cli.cli.commands.generate.InventoryLoader")
+    @patch("avd_cli.logics.generator.ConfigurationGenerator")
+    @patch("avd_cli.cli.commands.generate.resolve_output_path")
+    @patch("avd_cli.cli.commands.generate.display_generation_summary")
+    def test_generate_configs_skip_structured_config_validation(
+        self, mock_display, mock_resolve, mock_gen_class, mock_loader_class, mock_inventory_setup, tmp_path
+    ):
+        """Test --skip-structured-config-validation is passed to the generator."""
+        _device, _inventory, loader = mock_inventory_setup
+        mock_loader_class.return_value = loader
+        mock_resolve.return_value = tmp_path / "output"
+        mock_gen_class.return_value.generate.return_value = []
+
+        inventory_path = tmp_path / "inventory"
+        inventory_path.mkdir()
+
+        runner = CliRunner()
+        result = runner.invoke(
+            generate_configs,
+            ["--inventory-path", str(inventory_path), "--skip-structured-config-validation"],
+            obj={"verbose": False},
+        )
+
+        assert result.exit_code == 0
+        assert mock_gen_class.call_args.kwargs["skip_structured_config_validation"] is True
+        assert mock_gen_class.call_args.kwargs["use_cache"] is False
+
+    @patch("avd_cli.cli.commands.generate.InventoryLoader")
+    @patch("avd_cli.logics.generator.ConfigurationGenerator")
+    @patch("avd_cli.cli.commands.generate.resolve_output_path")
+    @patch("avd_cli.cli.commands.generate.display_generation_summary")
+    def test_generate_configs_cache(
+        self, mock_display, mock_resolve, mock_gen_class, mock_loader_class, mock_inventory_setup, tmp_path
+    ):
+        """Test --cache enables the structured config cache."""
+        _device, _inventory, loader = mock_inventory_setup
+        mock_loader_class.return_value = loader
+        mock_resolve.return_value = tmp_path / "output"
+        mock_gen_class.return_value.generate.return_value = []
+
+        inventory_path = tmp_path / "inventory"
+        inventory_path.mkdir()
+
+        runner = CliRunner()
+        result = runner.invoke(
+            generate_configs,
+            ["--inventory-path", str(inventory_path), "--cache"],
+            obj={"verbose": False},
+        )
+
+        assert result.exit_code == 0
+        assert mock_gen_class.call_args.kwargs["use_cache"] is True
+
     @patch("avd_cli.cli.commands.generate.InventoryLoader")
     def test_generate_configs_validation_failure(
         self, mock_loader_class, mock_inventory_setup, tmp_path
@@ -191,6 +191,27 @@ class TestAntaCatalogGenerator:
         assert any("VerifyReachability" in str(test) for test in connectivity_tests)
         assert len(connectivity_tests) > 0
 
+    def test_generate_connectivity_tests_limits_targets(self):
+        """Test each device checks reachability to at most 5 other management IPs."""
+        devices = [
+            DeviceDefinition(
+                hostname=f"leaf{index:02d}",
+                mgmt_ip=IPv4Address(f"192.168.0.{index}"),
+                platform="7280R3",
+                device_type="leaf",
+                fabric="TEST_FABRIC",
+            )
+            for index in range(1, 9)
+        ]
+
+        tests = self.generator._generate_connectivity_tests(devices)["anta.tests.connectivity"]
+
+        destinations = [test["VerifyReachability"]["hosts"][0]["destination"] for test in tests]
+        assert len(destinations) == 8 * 5 + 1
+        assert destinations[:5] == ["192.168.0.2", "192.168.0.3", "192.168.0.4", "192.168.0.5", "192.168.0.6"]
+        assert destinations[5:10] == ["192.168.0.1", "192.168.0.3", "192.168.0.4", "192.168.0.5", "192.168.0.6"]
+        assert destinations[-1] == "8.8.8.8"
+
     def test_generate_bgp_tests_with_neighbors(self):
         """Test BGP test generation with neighbors."""
         devices = [self.spine_device]
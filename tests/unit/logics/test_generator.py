@@ -9,9 +9,10 @@ and error cases.
 """
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 from avd_cli.exceptions import ConfigurationGenerationError, DocumentationGenerationError, TestGenerationError
 from avd_cli.logics.generator import ConfigurationGenerator, DocumentationGenerator, TestGenerator, generate_all
@@ -286,6 +287,317 @@ class TestConfigurationGenerator:
         with pytest.raises(ConfigurationGenerationError, match="Structured config validation failed"):
             generator.generate(sample_inventory, output_path)
 
+    def test_generate_skip_structured_config_validation(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test structured config validation can be skipped.
+
+        Given: Generator created with skip_structured_config_validation=True
+        When: Generating configurations
+        Then: validate_structured_config is never called
+        """
+        generator = ConfigurationGenerator(workflow="eos-design", skip_structured_config_validation=True)
+
+        result = generator.generate(sample_inventory, tmp_path / "output")
+
+        assert len(result) == 3
+        mock_pyavd.validate_structured_config.assert_not_called()
+
+    def test_generate_eos_design_validates_structured_configs_by_default(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test eos_designs structured configs are validated by default.
+
+        They also hold the eos_cli_config_gen variables merged from the inputs,
+        which input validation against the eos_designs schema does not cover.
+
+        Given: eos-design workflow with default options
+        When: Generating configurations
+        Then: Inputs and structured configs are both validated
+        """
+        generator = ConfigurationGenerator(workflow="eos-design")
+
+        result = generator.generate(sample_inventory, tmp_path / "output")
+
+        assert len(result) == 3
+        assert mock_pyavd.validate_inputs.call_count == 3
+        assert mock_pyavd.validate_structured_config.call_count == 3
+
+    def test_generate_cli_config_validates_structured_configs(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test cli-config structured configs are always validated.
+
+        Given: cli-config workflow
+        When: Generating configurations
+        Then: Each structured config is validated
+        """
+        generator = ConfigurationGenerator(workflow="cli-config")
+
+        generator.generate(sample_inventory, tmp_path / "output")
+
+        assert mock_pyavd.validate_structured_config.call_count == 3
+
+    def test_generate_validates_on_every_run(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test validation results are not reused between runs of a generator.
+
+        Given: A generator that already generated configurations once
+        When: Generating the same inventory again
+        Then: Inputs and structured configs are validated again
+        """
+        from unittest.mock import MagicMock
+
+        mock_validation = MagicMock()
+        mock_validation.validated_data = {}
+        mock_validation.validation_result.violations = []
+        mock_validation.validation_result.deprecations = []
+        mock_pyavd.validate_inputs.return_value = mock_validation
+        mock_pyavd.validate_structured_config.return_value = mock_validation
+
+        generator = ConfigurationGenerator(workflow="eos-design")
+        generator.generate(sample_inventory, tmp_path / "first")
+        inputs_calls = mock_pyavd.validate_inputs.call_count
+        structured_calls = mock_pyavd.validate_structured_config.call_count
+
+        generator.generate(sample_inventory, tmp_path / "second")
+
+        assert inputs_calls == 3
+        assert structured_calls == 3
+        assert mock_pyavd.validate_inputs.call_count == 2 * inputs_calls
+        assert mock_pyavd.validate_structured_config.call_count == 2 * structured_calls
+
+    def test_generate_reuses_cached_structured_configs(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test unchanged devices are served from the on-disk cache.
+
+        Given: Configurations already generated in the output directory
+        When: Generating again with a new generator
+        Then: No structured config or configuration is regenerated
+        """
+        mock_pyavd.get_device_config.return_value = "hostname test\n"
+        output_path = tmp_path / "output"
+        first = ConfigurationGenerator(use_cache=True)
+        first.generate(sample_inventory, output_path)
+        assert (output_path / "configs" / ".avdcache").is_dir()
+        mock_pyavd.get_device_structured_config.reset_mock()
+        mock_pyavd.get_device_config.reset_mock()
+
+        generator = ConfigurationGenerator(use_cache=True)
+        result = generator.generate(sample_inventory, output_path)
+
+        assert len(result) == 3
+        mock_pyavd.get_device_structured_config.assert_not_called()
+        mock_pyavd.get_device_config.assert_not_called()
+        # The cache holds eos_designs output: inputs are merged again on a cache hit
+        assert generator.eos_designs_configs == first.eos_designs_configs
+        assert generator.structured_configs == first.structured_configs
+
+    def test_generate_structured_configs_in_worker_pool(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test eos_designs and config rendering run in the worker pool for large enough batches.
+
+        Given: A batch size above PROCESS_POOL_THRESHOLD and several CPUs
+        When: Generating configurations
+        Then: Devices are dispatched to the pool and results keep the inventory order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        generator = ConfigurationGenerator(use_cache=False)
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            result = generator.generate(sample_inventory, tmp_path / "output")
+
+        # One pool for input validation, one for eos_designs, one for rendering
+        assert pool.call_count == 3
+        assert mock_pyavd.validate_inputs.call_count == 3
+        assert mock_pyavd.get_device_structured_config.call_count == 3
+        assert mock_pyavd.get_device_config.call_count == 3
+        assert [path.name for path in result] == ["spine01.cfg", "leaf01.cfg", "dc2-spine01.cfg"]
+        assert all(path.read_text() for path in result)
+        assert list(generator.structured_configs) == ["spine01", "leaf01", "dc2-spine01"]
+        assert generator.structured_configs["leaf01"]["hostname"] == "leaf01"
+
+    def test_generate_validation_failure_in_worker_pool(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test input validation errors from the worker pool name the invalid device.
+
+        Given: A batch size above PROCESS_POOL_THRESHOLD and one device with invalid inputs
+        When: Generating configurations
+        Then: Raises ConfigurationGenerationError for that device, before eos_designs runs
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        valid = MagicMock(validated_data={})
+        valid.validation_result.deprecations = []
+        violation = MagicMock(path=["router_bgp", "as"], message="Invalid value")
+        invalid = MagicMock(validated_data=None)
+        invalid.validation_result.violations = [violation]
+        mock_pyavd.validate_inputs.side_effect = lambda inputs: invalid if inputs["hostname"] == "leaf01" else valid
+
+        generator = ConfigurationGenerator(use_cache=False)
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", wraps=ThreadPoolExecutor):
+            with pytest.raises(ConfigurationGenerationError, match="leaf01:\nrouter_bgp.as: Invalid value"):
+                generator.generate(sample_inventory, tmp_path / "output")
+
+        mock_pyavd.get_avd_facts.assert_not_called()
+
+    def test_generate_structured_configs_share_inputs(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test structured configs reference the input subtrees they do not override.
+
+        Given: eos_designs output that only sets a few top-level keys
+        When: Generating configurations
+        Then: Other input subtrees are shared, not copied, and inputs are left unchanged
+        """
+        generator = ConfigurationGenerator(use_cache=False)
+        generator.generate(sample_inventory, tmp_path / "output")
+
+        for hostname, inputs in generator.inputs.items():
+            structured_config = generator.structured_configs[hostname]
+            assert structured_config is not inputs
+            assert structured_config["platform"] == "vEOS-lab"
+            for key, value in inputs.items():
+                if isinstance(value, dict) and key not in ("hostname", "platform", "type"):
+                    assert structured_config[key] is value
+
+    def test_generate_structured_configs_pool_fallback(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test eos_designs falls back to sequential generation if the pool fails.
+
+        Given: Worker processes that cannot be started
+        When: Generating configurations for a large enough batch
+        Then: Structured configs are generated in the current process
+        """
+        generator = ConfigurationGenerator(use_cache=False)
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", side_effect=OSError("no fork")):
+            result = generator.generate(sample_inventory, tmp_path / "output")
+
+        assert len(result) == 3
+        assert mock_pyavd.get_device_structured_config.call_count == 3
+
+    def test_generate_structured_configs_pool_error_propagates(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test errors raised by a worker are not retried sequentially.
+
+        Given: eos_designs failing for a device in the worker pool
+        When: Generating configurations for a large enough batch
+        Then: Raises ConfigurationGenerationError without running devices again in the current process
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_pyavd.get_device_structured_config.side_effect = ValueError("bad inputs")
+        generator = ConfigurationGenerator(use_cache=False)
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", wraps=ThreadPoolExecutor):
+            with pytest.raises(ConfigurationGenerationError, match="bad inputs"):
+                generator.generate(sample_inventory, tmp_path / "output")
+
+        assert mock_pyavd.get_device_structured_config.call_count <= 3
+
+    def test_generate_structured_configs_pool_os_error_propagates(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test an OSError raised by a worker is not mistaken for an unavailable pool.
+
+        Given: eos_designs raising OSError for a device in the worker pool
+        When: Generating configurations for a large enough batch
+        Then: Raises ConfigurationGenerationError without running devices again in the current process
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_pyavd.get_device_structured_config.side_effect = OSError("template not found")
+        generator = ConfigurationGenerator(use_cache=False)
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", wraps=ThreadPoolExecutor):
+            with pytest.raises(ConfigurationGenerationError, match="template not found"):
+                generator.generate(sample_inventory, tmp_path / "output")
+
+        assert mock_pyavd.get_device_structured_config.call_count <= 3
+
+    def test_generate_validates_inputs_again_in_new_run(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test validation results are not reused from the on-disk cache.
+
+        Given: Configurations already generated with the cache enabled
+        When: Generating again with a new generator
+        Then: Inputs and structured configs are validated again and deprecations are reported again
+        """
+        from unittest.mock import MagicMock
+
+        mock_deprecation = MagicMock()
+        mock_deprecation.message = "Old syntax"
+        mock_validation = MagicMock()
+        mock_validation.validated_data = {}
+        mock_validation.validation_result.violations = []
+        mock_validation.validation_result.deprecations = [mock_deprecation]
+        mock_pyavd.validate_inputs.return_value = mock_validation
+        mock_pyavd.validate_structured_config.return_value = mock_validation
+        output_path = tmp_path / "output"
+        ConfigurationGenerator(use_cache=True).generate(sample_inventory, output_path)
+        structured_calls = mock_pyavd.validate_structured_config.call_count
+        mock_pyavd.validate_inputs.reset_mock()
+        mock_pyavd.validate_structured_config.reset_mock()
+        mock_pyavd.get_device_structured_config.reset_mock()
+
+        with patch("avd_cli.logics.generator.logging.Logger.warning") as warning:
+            ConfigurationGenerator(use_cache=True).generate(sample_inventory, output_path)
+
+        mock_pyavd.get_device_structured_config.assert_not_called()
+        assert mock_pyavd.validate_inputs.call_count == 3
+        assert structured_calls > 0
+        assert mock_pyavd.validate_structured_config.call_count == structured_calls
+        assert any("Old syntax" in call.args for call in warning.call_args_list)
+
+    def test_generate_without_cache(self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd) -> None:
+        """Test the cache is opt-in: by default everything is regenerated and no cache is written.
+
+        Given: A generator created with default options
+        When: Generating twice
+        Then: Structured configs are regenerated and no cache directory exists
+        """
+        mock_pyavd.get_device_config.return_value = "hostname test\n"
+        output_path = tmp_path / "output"
+        generator = ConfigurationGenerator()
+        generator.generate(sample_inventory, output_path)
+        mock_pyavd.get_device_structured_config.reset_mock()
+
+        generator.generate(sample_inventory, output_path)
+
+        assert mock_pyavd.get_device_structured_config.call_count == 3
+        assert not (output_path / "configs" / ".avdcache").exists()
+
+    def test_generate_cli_config_writes_no_cache(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test the cache is not used with the cli-config workflow.
+
+        Given: A cli-config generator created with use_cache=True
+        When: Generating configurations
+        Then: No cache directory is written
+        """
+        output_path = tmp_path / "output"
+
+        result = ConfigurationGenerator(workflow="cli-config", use_cache=True).generate(sample_inventory, output_path)
+
+        assert len(result) == 3
+        assert not (output_path / "configs" / ".avdcache").exists()
+
     def test_generate_with_deprecation_warnings(
         self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
     ) -> None:
@@ -389,6 +701,76 @@ class TestConfigurationGenerator:
         assert result_edge["leading_zero_decimal"] == "1.001"  # Must remain string
         assert result_edge["leading_zero_int"] == "01.5"  # Must remain string
 
+    def test_convert_numeric_strings_in_place(self) -> None:
+        """Test _convert_numeric_strings updates nested containers in place.
+
+        Given: Lists of dicts nested several levels deep
+        When: Converting numeric strings
+        Then: The same containers are returned with converted values
+        """
+        generator = ConfigurationGenerator()
+
+        data = {
+            "node_groups": [{"group": "DC1", "nodes": [{"name": "leaf1", "id": "1", "uplink": "1.10"}]}],
+            "scalar": "7",
+        }
+        nodes = data["node_groups"][0]["nodes"]
+        result = generator._convert_numeric_strings(data)
+
+        assert result is data
+        assert nodes[0] == {"name": "leaf1", "id": 1, "uplink": 1.1}
+        assert result["scalar"] == 7
+        assert generator._convert_numeric_strings("42") == 42
+        assert generator._convert_numeric_strings("-42") == -42
+        assert generator._convert_numeric_strings("-") == "-"
+        assert generator._convert_numeric_strings("--5") == "--5"
+        assert generator._convert_numeric_strings("-1.5") == -1.5
+        assert generator._convert_numeric_strings("v1.5") == "v1.5"
+        assert generator._convert_numeric_strings("1.5a") == "1.5a"
+        # int()/float() would accept these, the conversion must not
+        assert generator._convert_numeric_strings("1_000") == "1_000"
+        assert generator._convert_numeric_strings(" 12") == " 12"
+        assert generator._convert_numeric_strings("1e3") == "1e3"
+        assert generator._convert_numeric_strings("") == ""
+        assert generator._convert_numeric_strings(None) is None
+
+    def test_converted_numeric_strings_copy_on_write(self) -> None:
+        """Test _converted_numeric_strings copies only the converted paths.
+
+        Given: Variables where only one branch holds numeric strings
+        When: Converting them copy-on-write
+        Then: The input is untouched, changed paths are copied and other subtrees are shared
+        """
+        generator = ConfigurationGenerator()
+
+        untouched = {"servers": [{"name": "ntp1"}]}
+        data = {"ntp": untouched, "l3leaf": {"nodes": [{"name": "leaf1", "id": "1"}]}}
+        result = generator._converted_numeric_strings(data)
+
+        assert data["l3leaf"]["nodes"][0]["id"] == "1"
+        assert result["l3leaf"]["nodes"][0]["id"] == 1
+        assert result is not data
+        assert result["ntp"] is untouched
+        assert generator._converted_numeric_strings(untouched) is untouched
+        assert generator._converted_numeric_strings(["5", "a"]) == [5, "a"]
+        assert generator._converted_numeric_strings("42") == 42
+
+    def test_build_inputs_leaves_inventory_untouched(self, sample_inventory: InventoryData) -> None:
+        """Test building inputs does not modify the inventory variables.
+
+        Given: Global variables with numeric strings
+        When: Building pyavd inputs
+        Then: Inputs hold numbers while the inventory keeps its original strings
+        """
+        generator = ConfigurationGenerator()
+        sample_inventory.global_vars["mgmt_interface_vrf_id"] = "10"
+        devices = sample_inventory.get_all_devices()
+
+        inputs = generator._build_pyavd_inputs_from_inventory(sample_inventory, devices)
+
+        assert inputs[devices[0].hostname]["mgmt_interface_vrf_id"] == 10
+        assert sample_inventory.global_vars["mgmt_interface_vrf_id"] == "10"
+
     def test_deep_merge(self) -> None:
         """Test deep_merge utility function.
 
@@ -455,6 +837,27 @@ class TestConfigurationGenerator:
         data = {"spine": {"node_groups": []}}
         assert generator._determine_device_type(data, "spine01") is None
 
+        # Node entries that are not dicts or have no name
+        data = {"spine": {"node_groups": [{"nodes": ["spine01", {"id": 1}, None]}]}}
+        assert generator._determine_device_type(data, "spine01") is None
+
+    def test_determine_device_type_mapping_and_direct_nodes(self) -> None:
+        """Test _determine_device_type maps topology keys and checks direct nodes.
+
+        Given: l2leaf node groups and MPLS P routers declared in nodes[]
+        When: Determining device type
+        Then: l2leaf is reported as leaf and other keys as-is
+        """
+        generator = ConfigurationGenerator()
+
+        data = {
+            "l2leaf": {"node_groups": [{"nodes": [{"name": "leaf01", "id": 1}]}]},
+            "p": {"defaults": {}, "nodes": [{"name": "p01", "id": 1}]},
+        }
+
+        assert generator._determine_device_type(data, "leaf01") == "leaf"
+        assert generator._determine_device_type(data, "p01") == "p"
+
     def test_extract_node_id(self) -> None:
         """Test _extract_node_id method.
 
@@ -523,6 +926,266 @@ class TestConfigurationGenerator:
 
         assert result == {}
 
+    def test_build_pyavd_inputs_shares_group_layer(self) -> None:
+        """Test _build_pyavd_inputs_from_inventory shares group variables between devices.
+
+        Given: Two devices in the same groups, one with host variables
+        When: Building pyavd inputs
+        Then: Untouched group subtrees are shared, merged paths are copied
+              and the inventory variables are left unchanged
+        """
+        from ipaddress import IPv4Address
+
+        generator = ConfigurationGenerator()
+        devices = [
+            DeviceDefinition(
+                hostname=f"leaf{i}",
+                platform="7050X3",
+                mgmt_ip=IPv4Address(f"192.168.1.{i}"),
+                device_type="leaf",
+                fabric="FABRIC",
+                groups=["DC1_LEAFS"],
+            )
+            for i in (1, 2)
+        ]
+        inventory = InventoryData(
+            root_path=Path("/tmp"),
+            fabrics=[],
+            global_vars={"ntp": {"servers": [{"name": "10.0.0.1"}]}},
+            group_vars={
+                "FABRIC": {"bgp_asn": "65000"},
+                "DC1_LEAFS": {"type": "l3leaf", "mtu": {"default": "9214"}},
+            },
+            host_vars={"leaf2": {"mtu": {"mgmt": "1500"}}},
+        )
+
+        result = generator._build_pyavd_inputs_from_inventory(inventory, devices)
+
+        assert result["leaf1"]["bgp_asn"] == 65000
+        assert result["leaf2"]["mtu"] == {"default": 9214, "mgmt": 1500}
+        assert result["leaf1"]["mtu"] == {"default": 9214}
+        assert result["leaf1"]["ntp"] is result["leaf2"]["ntp"]
+        assert result["leaf1"]["mtu"] is not result["leaf2"]["mtu"]
+        assert result["leaf1"]["type"] == result["leaf2"]["type"] == "l3leaf"
+        assert inventory.group_vars["DC1_LEAFS"]["mtu"] == {"default": "9214"}
+        assert inventory.host_vars["leaf2"] == {"mtu": {"mgmt": "1500"}}
+
+    def test_build_pyavd_inputs_reuses_group_prefix_layers(self) -> None:
+        """Test group layers are built on top of cached layers of shared leading groups.
+
+        Given: Devices whose group sets share their leading groups
+        When: Building pyavd inputs
+        Then: Each variable source is merged once per distinct group prefix
+        """
+        from ipaddress import IPv4Address
+
+        generator = ConfigurationGenerator()
+        devices = [
+            DeviceDefinition(
+                hostname=hostname,
+                platform="7050X3",
+                mgmt_ip=IPv4Address("192.168.1.1"),
+                device_type="leaf",
+                fabric="FABRIC",
+                groups=groups,
+            )
+            for hostname, groups in (("leaf1", ["POD1", "RACK1"]), ("leaf2", ["POD1", "RACK2"]), ("spine1", []))
+        ]
+        inventory = InventoryData(
+            root_path=Path("/tmp"),
+            fabrics=[],
+            global_vars={"ntp": {"servers": [{"name": "10.0.0.1"}]}},
+            group_vars={
+                "FABRIC": {"bgp_asn": "65000"},
+                "POD1": {"type": "l3leaf", "mtu": "9214"},
+                "RACK1": {"rack": "1"},
+                "RACK2": {"rack": "2"},
+            },
+            host_vars={},
+        )
+
+        with patch.object(
+            generator, "_merge_layer_source", wraps=generator._merge_layer_source
+        ) as merge_source:
+            result = generator._build_pyavd_inputs_from_inventory(inventory, devices)
+
+        merged_sources = [merge_call.args[2] for merge_call in merge_source.call_args_list]
+        assert merged_sources == [None, "FABRIC", "POD1", "RACK1", "RACK2"]
+        assert result["leaf1"]["rack"] == 1
+        assert result["leaf2"]["rack"] == 2
+        assert result["leaf1"]["type"] == result["leaf2"]["type"] == "l3leaf"
+        assert "mtu" not in result["spine1"]
+        assert result["spine1"]["bgp_asn"] == 65000
+
+    def test_build_pyavd_inputs_ignores_groups_without_variables(self) -> None:
+        """Test groups without variables do not create separate group layers.
+
+        Given: Devices whose group lists only differ by groups without variables
+        When: Building pyavd inputs
+        Then: Both devices get the same merged group layer
+        """
+        from ipaddress import IPv4Address
+
+        generator = ConfigurationGenerator()
+        devices = [
+            DeviceDefinition(
+                hostname=hostname,
+                platform="7050X3",
+                mgmt_ip=IPv4Address("192.168.1.1"),
+                device_type="leaf",
+                fabric="FABRIC",
+                groups=groups,
+            )
+            for hostname, groups in (("leaf1", ["POD1", "RACK1"]), ("leaf2", ["RACK2", "POD1"]))
+        ]
+        inventory = InventoryData(
+            root_path=Path("/tmp"),
+            fabrics=[],
+            global_vars={},
+            group_vars={"FABRIC": {"bgp_asn": "65000"}, "POD1": {"mtu": {"default": "9214"}}},
+            host_vars={},
+        )
+
+        with patch.object(generator, "_build_group_layer", wraps=generator._build_group_layer) as build_layer:
+            result = generator._build_pyavd_inputs_from_inventory(inventory, devices)
+
+        assert build_layer.call_count == 1
+        assert build_layer.call_args.args[1] == ("FABRIC", "POD1")
+        assert result["leaf1"]["mtu"] is result["leaf2"]["mtu"]
+        assert result["leaf2"]["bgp_asn"] == 65000
+
+    def test_build_pyavd_inputs_shares_topology_index(self) -> None:
+        """Test group sets with the same topology share one node ID index.
+
+        Given: Devices in different rack groups that do not redefine the topology
+        When: Building pyavd inputs
+        Then: The topology is indexed once and each device gets its node ID
+        """
+        from ipaddress import IPv4Address
+
+        generator = ConfigurationGenerator()
+        devices = [
+            DeviceDefinition(
+                hostname=hostname,
+                platform="7050X3",
+                mgmt_ip=IPv4Address("192.168.1.1"),
+                device_type="leaf",
+                fabric="FABRIC",
+                groups=[rack],
+            )
+            for hostname, rack in (("leaf1", "RACK1"), ("leaf2", "RACK2"))
+        ]
+        inventory = InventoryData(
+            root_path=Path("/tmp"),
+            fabrics=[],
+            global_vars={},
+            group_vars={
+                "FABRIC": {
+                    "l3leaf": {"node_groups": [{"nodes": [{"name": "leaf1", "id": 1}, {"name": "leaf2", "id": 2}]}]}
+                },
+                "RACK1": {"rack": "1"},
+                "RACK2": {"rack": "2"},
+            },
+            host_vars={},
+        )
+
+        with patch.object(
+            generator, "_build_topology_index", wraps=generator._build_topology_index
+        ) as build_index:
+            result = generator._build_pyavd_inputs_from_inventory(inventory, devices)
+
+        assert build_index.call_count == 1
+        assert result["leaf1"]["id"] == 1
+        assert result["leaf2"]["id"] == 2
+
+    def test_build_pyavd_inputs_shares_sources_across_groups(self) -> None:
+        """Test subtrees from the same variable source are shared across group sets.
+
+        Given: Devices in different groups of the same fabric
+        When: Building pyavd inputs
+        Then: Global and fabric subtrees are the same objects for both devices
+        """
+        from ipaddress import IPv4Address
+
+        generator = ConfigurationGenerator()
+        devices = [
+            DeviceDefinition(
+                hostname=hostname,
+                platform="7050X3",
+                mgmt_ip=IPv4Address(f"192.168.1.{i}"),
+                device_type=device_type,
+                fabric="FABRIC",
+                groups=[group],
+            )
+            for i, (hostname, device_type, group) in enumerate(
+                [("spine1", "spine", "SPINES"), ("leaf1", "leaf", "LEAFS")], start=1
+            )
+        ]
+        inventory = InventoryData(
+            root_path=Path("/tmp"),
+            fabrics=[],
+            global_vars={"ntp": {"servers": [{"name": "10.0.0.1"}]}},
+            group_vars={
+                "FABRIC": {"local_users": [{"name": "admin", "privilege": "15"}]},
+                "SPINES": {"type": "spine"},
+                "LEAFS": {"type": "l3leaf"},
+            },
+            host_vars={},
+        )
+
+        result = generator._build_pyavd_inputs_from_inventory(inventory, devices)
+
+        assert result["spine1"]["type"] == "spine"
+        assert result["leaf1"]["type"] == "l3leaf"
+        assert result["spine1"]["ntp"] is result["leaf1"]["ntp"]
+        assert result["spine1"]["local_users"] is result["leaf1"]["local_users"]
+        assert result["leaf1"]["local_users"][0]["privilege"] == 15
+        assert inventory.group_vars["FABRIC"]["local_users"][0]["privilege"] == "15"
+
+    def test_build_pyavd_inputs_extracts_node_ids(self) -> None:
+        """Test node IDs are resolved from group topology and host_vars overrides.
+
+        Given: A group defining l3leaf node_groups and a host overriding its topology
+        When: Building pyavd inputs
+        Then: Each device gets the ID declared for it, host_vars taking precedence
+        """
+        from ipaddress import IPv4Address
+
+        generator = ConfigurationGenerator()
+        devices = [
+            DeviceDefinition(
+                hostname=f"leaf{i}",
+                platform="7050X3",
+                mgmt_ip=IPv4Address(f"192.168.1.{i}"),
+                device_type="leaf",
+                fabric="FABRIC",
+                groups=["DC1_LEAFS"],
+            )
+            for i in (1, 2, 3)
+        ]
+        inventory = InventoryData(
+            root_path=Path("/tmp"),
+            fabrics=[],
+            global_vars={},
+            group_vars={
+                "DC1_LEAFS": {
+                    "type": "l3leaf",
+                    "l3leaf": {
+                        "node_groups": [
+                            {"group": "PAIR1", "nodes": [{"name": "leaf1", "id": 1}, {"name": "leaf2", "id": "2"}]}
+                        ]
+                    },
+                },
+            },
+            host_vars={"leaf3": {"l3leaf": {"nodes": [{"name": "leaf3", "id": 30}]}}},
+        )
+
+        result = generator._build_pyavd_inputs_from_inventory(inventory, devices)
+
+        assert result["leaf1"]["id"] == 1
+        assert result["leaf2"]["id"] == 2
+        assert result["leaf3"]["id"] == 30
+
     def test_convert_inventory_to_pyavd_inputs(self) -> None:
         """Test _convert_inventory_to_pyavd_inputs method (wrapper).
 
@@ -628,6 +1291,26 @@ class TestConfigurationGenerator:
 class TestDocumentationGenerator:
     """Test DocumentationGenerator class."""
 
+    def test_write_docs_in_worker_pool(self, tmp_path: Path, mock_pyavd) -> None:
+        """Test documentation is rendered in the worker pool for large enough batches.
+
+        Given: A batch size above PROCESS_POOL_THRESHOLD and several CPUs
+        When: Writing device documentation
+        Then: Every device is rendered once and its document is written
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        structured_configs = {"spine01": {"hostname": "spine01"}, "leaf01": {"hostname": "leaf01"}}
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            result = DocumentationGenerator().write_docs(structured_configs, tmp_path)
+
+        assert pool.call_count == 1
+        assert mock_pyavd.get_device_doc.call_count == 2
+        assert sorted(path.name for path in result) == ["leaf01.md", "spine01.md"]
+        assert all(path.read_text() for path in result)
+
     def test_init(self) -> None:
         """Test documentation generator initialization.
 
@@ -773,6 +1456,73 @@ class TestDocumentationGenerator:
             with pytest.raises(DocumentationGenerationError, match="Failed to generate documentation"):
                 generator.generate(sample_inventory, output_path)
 
+    def test_generate_documents_eos_designs_output(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test documentation is rendered from the eos_designs structured configs as they are.
+
+        Given: eos_designs output that only sets a few top-level keys
+        When: Generating documentation
+        Then: Each device is documented from its eos_designs output, without its inputs merged in
+        """
+        DocumentationGenerator().generate(sample_inventory, tmp_path / "output")
+
+        documented = [call.args[0] for call in mock_pyavd.get_device_doc.call_args_list]
+        assert sorted(config["hostname"] for config in documented) == ["dc2-spine01", "leaf01", "spine01"]
+        assert all(set(config) == {"hostname", "platform", "type"} for config in documented)
+
+    def test_generate_reuses_configuration_cache(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test documentation reuses structured configs cached by a configuration run.
+
+        Given: Configurations already generated in the output directory with the cache enabled
+        When: Generating documentation in a separate run with the cache enabled
+        Then: eos_designs is not run again and every device is documented
+        """
+        output_path = tmp_path / "output"
+        ConfigurationGenerator(use_cache=True).generate(sample_inventory, output_path)
+        mock_pyavd.get_device_structured_config.reset_mock()
+
+        result = DocumentationGenerator(use_cache=True).generate(sample_inventory, output_path)
+
+        assert len(result) == 3
+        mock_pyavd.get_device_structured_config.assert_not_called()
+
+    def test_generate_ignores_configuration_cache_by_default(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test documentation does not read a leftover configuration cache unless enabled.
+
+        Given: Configurations already generated in the output directory with the cache enabled
+        When: Generating documentation in a separate run with default options
+        Then: eos_designs runs for every device
+        """
+        output_path = tmp_path / "output"
+        ConfigurationGenerator(use_cache=True).generate(sample_inventory, output_path)
+        mock_pyavd.get_device_structured_config.reset_mock()
+
+        result = DocumentationGenerator().generate(sample_inventory, output_path)
+
+        assert len(result) == 3
+        assert mock_pyavd.get_device_structured_config.call_count == 3
+
+    def test_generate_without_configuration_cache(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test documentation generates structured configs when no cache exists.
+
+        Given: An empty output directory
+        When: Generating documentation
+        Then: eos_designs runs for every device and no cache directory is created
+        """
+        output_path = tmp_path / "output"
+
+        DocumentationGenerator().generate(sample_inventory, output_path)
+
+        assert mock_pyavd.get_device_structured_config.call_count == 3
+        assert not (output_path / "configs").exists()
+
 
 class TestTestGenerator:
     """Test TestGenerator class."""
@@ -797,6 +1547,23 @@ class TestTestGenerator:
         generator = TestGenerator(test_type="robot")
         assert generator.test_type == "robot"
 
+    def test_generate_raises_on_import_error(self, tmp_path: Path) -> None:
+        """Test error when pyavd is not available.
+
+        Given: pyavd not importable
+        When: Calling generate() on the configuration and test generators
+        Then: Each raises its own error type with install instructions
+        """
+        import sys
+
+        empty_inventory = InventoryData(root_path=tmp_path, fabrics=[])
+
+        with patch.dict(sys.modules, {"pyavd": None}):
+            with pytest.raises(ConfigurationGenerationError, match="pyavd library not installed"):
+                ConfigurationGenerator().generate(empty_inventory, tmp_path / "output")
+            with pytest.raises(TestGenerationError, match="pyavd library not installed"):
+                TestGenerator().generate(empty_inventory, tmp_path / "output")
+
     def test_generate_creates_output_directory(self, sample_inventory: InventoryData, tmp_path: Path) -> None:
         """Test test generation creates output directory.
 
@@ -835,6 +1602,25 @@ class TestTestGenerator:
         assert "anta_catalog.yml" in file_names
         assert "anta_inventory.yml" in file_names
 
+    def test_generate_json_format(self, sample_inventory: InventoryData, tmp_path: Path) -> None:
+        """Test test files are written as JSON when requested.
+
+        Given: A generator configured for the JSON serialization format
+        When: Calling generate()
+        Then: Catalog and inventory are written to .json files with the same content structure
+        """
+        import json
+
+        generator = TestGenerator(serialization_format="json")
+
+        result = generator.generate(sample_inventory, tmp_path / "output")
+
+        assert [f.name for f in result] == ["anta_catalog.json", "anta_inventory.json"]
+        catalog = json.loads(result[0].read_bytes())
+        inventory = json.loads(result[1].read_bytes())
+        assert "anta.tests.connectivity" in catalog
+        assert [host["name"] for host in inventory["anta_inventory"]["hosts"]] == ["spine01", "leaf01", "dc2-spine01"]
+
     def test_generate_with_limit_to_groups(self, sample_inventory: InventoryData, tmp_path: Path) -> None:
         """Test test generation limited to specific devices using DeviceFilter.
 
@@ -940,6 +1726,201 @@ class TestTestGenerator:
         content = catalog_file.read_text(encoding="utf-8")
         assert "ANTA" in content or "anta.tests" in content
 
+    def test_build_interface_test_limits_interfaces(self) -> None:
+        """Test interface status tests keep the first 10 enabled interfaces.
+
+        Given: A device with 15 ethernet interfaces, some shut down, and a port-channel-only device
+        When: Building interface tests
+        Then: Shut interfaces are skipped, at most 10 are kept and port-channel-only devices get an empty list
+        """
+        generator = TestGenerator()
+        ethernet_interfaces = [{"name": f"Ethernet{i}", "shutdown": i % 3 == 0} for i in range(1, 16)]
+
+        test = generator._build_interface_test("leaf1", {"ethernet_interfaces": ethernet_interfaces})
+
+        assert [iface["name"] for iface in test["VerifyInterfacesStatus"]["interfaces"]] == [
+            f"Ethernet{i}" for i in (1, 2, 4, 5, 7, 8, 10, 11, 13, 14)
+        ]
+        port_channel_test = generator._build_interface_test("leaf2", {"port_channel_interfaces": [{"name": "Po1"}]})
+        assert port_channel_test == {"VerifyInterfacesStatus": {"interfaces": [], "filters": {"tags": ["leaf2"]}}}
+        assert generator._build_interface_test("spine1", {}) is None
+
+    def test_generate_anta_inventory(self, sample_inventory: InventoryData) -> None:
+        """Test the ANTA inventory lists known devices with their connection details.
+
+        Given: Structured configs for two inventory devices and an unknown host
+        When: Generating the ANTA inventory
+        Then: Known devices are listed in order with management IP and tags
+        """
+        generator = TestGenerator()
+        structured_configs = {"spine01": {}, "unknown": {}, "leaf01": {}}
+
+        content = generator._generate_anta_inventory(structured_configs, sample_inventory)
+
+        assert content == (
+            "anta_inventory:\n"
+            "  hosts:\n"
+            "  - host: 192.168.1.10\n"
+            "    name: spine01\n"
+            "    tags:\n"
+            "    - DC1\n"
+            "    - spine\n"
+            "  - host: 192.168.1.20\n"
+            "    name: leaf01\n"
+            "    tags:\n"
+            "    - DC1\n"
+            "    - leaf\n"
+        )
+
+    def test_get_device_test_catalogs_in_worker_pool(self, mock_pyavd) -> None:
+        """Test the ANTA test factory runs in the worker pool for large enough batches.
+
+        Given: A batch size above PROCESS_POOL_THRESHOLD and several CPUs
+        When: Building the per-device test catalogs
+        Then: Devices are dispatched to the pool with the shared fabric data and tests keep device order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from avd_cli.logics.generator import _get_device_test_catalogs
+
+        fabric_data = object()
+        structured_configs = {"spine01": {}, "leaf01": {}, "leaf02": {}}
+        mock_pyavd.get_device_test_catalog.side_effect = lambda hostname, **_: MagicMock(tests=[hostname])
+        with patch("avd_cli.logics.generator.PROCESS_POOL_THRESHOLD", 2), \
+                patch("avd_cli.logics.generator.os.cpu_count", return_value=2), \
+                patch("avd_cli.logics.generator.ProcessPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            tests = _get_device_test_catalogs(mock_pyavd, structured_configs, fabric_data)
+
+        assert pool.call_count == 1
+        assert tests == ["spine01", "leaf01", "leaf02"]
+        for call in mock_pyavd.get_device_test_catalog.call_args_list:
+            assert call.kwargs["fabric_data"] is fabric_data
+
+    def test_import_anta_factory_probes_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test a missing ANTA factory is detected once per generator.
+
+        Given: An environment without the pyavd ANTA factory
+        When: Building the ANTA catalog twice with the same generator
+        Then: The import is attempted and reported once and the basic catalog is generated
+        """
+        generator = TestGenerator()
+        structured_configs = {"leaf1": {"router_bgp": {"as": "65101"}}}
+
+        with patch.dict("sys.modules", {"anta.catalog": None}), caplog.at_level("WARNING"):
+            first = generator._build_anta_catalog(MagicMock(), structured_configs)
+            second = generator._build_anta_catalog(MagicMock(), structured_configs)
+
+        assert generator._anta_factory == ()
+        assert first == second == generator._generate_basic_anta_catalog(structured_configs)
+        assert caplog.text.count("Could not use pyavd ANTA factory") == 1
+
+    def test_build_anta_catalog_groups_tests_by_module(self, mock_pyavd) -> None:
+        """Test the ANTA factory catalog is built without validating the tests again.
+
+        Given: Test definitions returned by the pyavd ANTA factory for two devices
+        When: Building the ANTA catalog
+        Then: The catalog file is constructed with tests grouped by module in order
+        """
+        from types import SimpleNamespace
+
+        def definition(module: str, name: str) -> SimpleNamespace:
+            return SimpleNamespace(test=type(name, (), {"__module__": module}))
+
+        uptime, reachability, temperature = (
+            definition("anta.tests.system", "VerifyUptime"),
+            definition("anta.tests.connectivity", "VerifyReachability"),
+            definition("anta.tests.system", "VerifyTemperature"),
+        )
+        mock_pyavd.get_device_test_catalog.side_effect = [
+            MagicMock(tests=[uptime, reachability]),
+            MagicMock(tests=[temperature]),
+        ]
+        catalog_file_cls = MagicMock()
+        catalog_file_cls.model_construct.return_value.model_dump_json.return_value = '{"anta.tests.system": []}'
+        generator = TestGenerator()
+        generator._anta_factory = (MagicMock(), catalog_file_cls)
+
+        content = generator._build_anta_catalog(mock_pyavd, {"leaf1": {}, "leaf2": {}})
+
+        catalog_file_cls.model_construct.assert_called_once_with(
+            root={"anta.tests.system": [uptime, temperature], "anta.tests.connectivity": [reachability]}
+        )
+        assert content == b"anta.tests.system: []\n"
+
+    def test_serialize_anta_catalog_matches_anta_yaml(self) -> None:
+        """Test the catalog is serialized like AntaCatalogFile.yaml().
+
+        Given: A catalog file object with a JSON dump
+        When: Serializing the ANTA catalog
+        Then: The output equals ANTA's JSON-reload-YAML document and yaml() is not called
+        """
+        import math
+
+        catalog_json = (
+            '{"anta.tests.system": [{"VerifyUptime": {"minimum": 86400}}],'
+            ' "anta.tests.connectivity": [{"VerifyReachability": {"hosts": [{"destination": "10.0.0.1",'
+            ' "source": "Loopback0", "vrf": "default", "description": "' + "peer " * 40 + '"}]}}]}'
+        )
+        catalog_file_obj = MagicMock()
+        catalog_file_obj.model_dump_json.return_value = catalog_json
+
+        content = TestGenerator()._serialize_anta_catalog(catalog_file_obj)
+
+        expected = yaml.safe_dump(yaml.safe_load(catalog_json), indent=2, width=math.inf)
+        assert content == expected.encode("utf-8")
+        catalog_file_obj.yaml.assert_not_called()
+
+    def test_dump_anta_inventory_matches_yaml(self) -> None:
+        """Test the ANTA inventory writer quotes values that need it.
+
+        Given: Hosts with values that YAML would otherwise load as other types
+        When: Dumping the ANTA inventory
+        Then: The output loads back unchanged
+        """
+        rows = [("fe80::1", "leaf-1a", "65101", "l3leaf"), ("10.0.0.1", "it's", "true", "DC 1")]
+        hosts = [
+            {"host": "fe80::1", "name": "leaf-1a", "tags": ["65101", "l3leaf"]},
+            {"host": "10.0.0.1", "name": "it's", "tags": ["true", "DC 1"]},
+        ]
+        data = {"anta_inventory": {"hosts": hosts}}
+
+        content = TestGenerator._dump_anta_inventory(rows)
+
+        assert yaml.safe_load(content) == data
+        assert TestGenerator._dump_anta_inventory([]) == yaml.dump({"anta_inventory": {"hosts": []}})
+
+    def test_build_device_tests_categories(self) -> None:
+        """Test device-specific tests are grouped by category in catalog order.
+
+        Given: Devices with MLAG, BGP, VXLAN and interfaces configured on some of them
+        When: Building device tests
+        Then: Every device gets a connectivity test and other categories only list matching devices
+        """
+        generator = TestGenerator()
+        structured_configs = {
+            "leaf1": {
+                "ethernet_interfaces": [{"name": "Ethernet1"}],
+                "mlag_configuration": {"domain_id": "pod1"},
+                "router_bgp": {"as": "65101"},
+                "vxlan_interface": {"vxlan1": {}},
+            },
+            "spine1": {"router_bgp": {"as": "65001"}},
+        }
+
+        tests = generator._build_device_tests(structured_configs)
+
+        assert list(tests) == [
+            "anta.tests.connectivity",
+            "anta.tests.interfaces",
+            "anta.tests.mlag",
+            "anta.tests.routing.bgp",
+            "anta.tests.vxlan",
+        ]
+        assert len(tests["anta.tests.connectivity"]) == 2
+        assert len(tests["anta.tests.routing.bgp"]) == 4
+        assert tests["anta.tests.mlag"] == [{"VerifyMlagStatus": {"filters": {"tags": ["leaf1"]}}}]
+        assert generator._build_device_tests({}) == {"anta.tests.connectivity": []}
+
 
 class TestGenerateAll:
     """Test generate_all convenience function."""
@@ -959,6 +1940,56 @@ class TestGenerateAll:
         assert len(docs) == 3
         assert len(tests) >= 1  # At least one test file
 
+    def test_generate_all_shares_structured_configs_with_docs(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test documentation reuses the structured configs built for configurations.
+
+        Given: eos-design workflow
+        When: Calling generate_all()
+        Then: Structured configs are computed once for configs and docs
+              (the test catalog still computes its own)
+        """
+        generate_all(sample_inventory, tmp_path / "output", use_cache=False)
+
+        assert mock_pyavd.get_avd_facts.call_count == 2
+        assert mock_pyavd.get_device_structured_config.call_count == 6
+
+    def test_generate_all_documents_eos_designs_output(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test generate_all documents the same data as a standalone documentation run.
+
+        Given: eos-design workflow
+        When: Calling generate_all()
+        Then: Docs get the eos_designs output, configs get it merged with the inputs
+        """
+        generate_all(sample_inventory, tmp_path / "output", use_cache=False)
+
+        documented = [call.args[0] for call in mock_pyavd.get_device_doc.call_args_list]
+        rendered = [call.args[0] for call in mock_pyavd.get_device_config.call_args_list]
+        assert all(set(config) == {"hostname", "platform", "type"} for config in documented)
+        assert all(set(config) > {"hostname", "platform", "type"} for config in rendered)
+
+    def test_generate_all_builds_inputs_once(
+        self, sample_inventory: InventoryData, tmp_path: Path, mock_pyavd
+    ) -> None:
+        """Test pyavd inputs are built once and shared by all generators.
+
+        Given: eos-design workflow
+        When: Calling generate_all()
+        Then: Group and host variables are merged a single time for the run
+        """
+        with patch.object(
+            ConfigurationGenerator,
+            "_build_pyavd_inputs_from_inventory",
+            autospec=True,
+            side_effect=ConfigurationGenerator._build_pyavd_inputs_from_inventory,
+        ) as build_inputs:
+            generate_all(sample_inventory, tmp_path / "output", use_cache=False)
+
+        assert build_inputs.call_count == 1
+
     def test_generate_all_with_workflow(self, sample_inventory: InventoryData, tmp_path: Path) -> None:
         """Test generate_all with custom workflow.
 
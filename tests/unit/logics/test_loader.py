@@ -7,7 +7,9 @@ Tests cover YAML loading, device parsing, fabric creation,
 and validation as specified in AC-001 to AC-010.
 """
 
+import sys
 from ipaddress import IPv4Address
+from unittest.mock import patch
 
 import pytest
 
@@ -311,6 +313,46 @@ node_groups:
         # Template should be resolved
         assert device.mgmt_ip == IPv4Address("192.168.0.10")
 
+    def test_template_resolution_skips_resolved_variables(self, loader, tmp_path):
+        """Test that later passes only resolve variables still holding templates."""
+        from avd_cli.logics.templating import TemplateResolver
+
+        inventory_dir = tmp_path / "inventory"
+        group_vars_dir = inventory_dir / "group_vars"
+        group_vars_dir.mkdir(parents=True)
+        (group_vars_dir / "all.yml").write_text("---\nbase: vEOS\nplatform_var: \"{{ base }}-lab\"\n")
+        (group_vars_dir / "FABRIC.yml").write_text(
+            """---
+fabric_name: TEST
+type: spine
+spine:
+  defaults:
+    platform: "{{ platform_var }}"
+  node_groups:
+    - group: TEST
+      nodes:
+        - name: spine1
+          id: 1
+          mgmt_ip: 192.168.0.10/24
+"""
+        )
+        (group_vars_dir / "STATIC.yml").write_text("---\nntp_server: 10.0.0.1\n")
+
+        resolved = []
+        original = TemplateResolver.resolve_recursive
+
+        def record(resolver, data):
+            resolved.append(data)
+            return original(resolver, data)
+
+        with patch.object(TemplateResolver, "resolve_recursive", autospec=True, side_effect=record):
+            inventory = loader.load(inventory_dir)
+
+        assert inventory.fabrics[0].get_all_devices()[0].platform == "vEOS-lab"
+        # Top-level calls only: STATIC has no template and is resolved on the first pass only
+        assert sum(1 for data in resolved if data == {"ntp_server": "10.0.0.1"}) == 1
+        assert inventory.group_vars["FABRIC"]["spine"]["defaults"]["platform"] == "vEOS-lab"
+
     def test_topology_defaults_merge(self, loader, tmp_path):
         """Test that topology defaults are properly merged to nodes."""
         inventory_dir = tmp_path / "inventory"
@@ -586,6 +628,27 @@ spine:
         # The fact that loading succeeds validates mixed format support
         assert inventory is not None
 
+    def test_host_vars_entry_filtering(self, loader, tmp_path):
+        """Test host_vars listing keeps YAML files, symlinked files and directories only."""
+        host_vars_dir = tmp_path / "host_vars"
+        host_vars_dir.mkdir()
+        (host_vars_dir / "spine1.yml").write_text("hostname: spine1\n")
+        (host_vars_dir / "README.md").write_text("not: loaded\n")
+        (tmp_path / "shared.yaml").write_text("hostname: spine2\n")
+        (host_vars_dir / "spine2.yaml").symlink_to(tmp_path / "shared.yaml")
+        (host_vars_dir / "leaf1").mkdir()
+        (host_vars_dir / "leaf1" / "b.yml").write_text("mtu: 1500\n")
+        (host_vars_dir / "leaf1" / "a.yml").write_text("mtu: 9214\nhostname: leaf1\n")
+        (host_vars_dir / "leaf1" / "notes.txt").write_text("mtu: 0\n")
+
+        host_vars = loader._load_host_vars(tmp_path)
+
+        assert host_vars == {
+            "spine1": {"hostname": "spine1"},
+            "spine2": {"hostname": "spine2"},
+            "leaf1": {"mtu": 1500, "hostname": "leaf1"},
+        }
+
     def test_invalid_ip_address_format(self, loader, tmp_path):
         """AC-012: Given invalid IP address format, When validating, Then error explains requirements."""
         inventory_dir = tmp_path / "inventory"
@@ -906,6 +969,52 @@ interface_profiles:
         assert 'leaf-1b' in host_map
         assert host_map['leaf-1b'] == 'IDF1'
 
+    def test_inventory_yml_parsed_once_per_load(self, loader, hierarchical_inventory):
+        """Test that inventory.yml is parsed a single time by load().
+
+        Hosts, inventory group vars, group hierarchy and host-to-group map are all
+        extracted from the same parsed document.
+        """
+        with patch.object(loader, "_load_yaml_file", wraps=loader._load_yaml_file) as load_yaml:
+            inventory = loader.load(hierarchical_inventory)
+
+        inventory_files = [call.args[0].name for call in load_yaml.call_args_list]
+        assert inventory_files.count("inventory.yml") == 1
+        assert inventory.get_device_by_hostname("leaf-1a") is not None
+        assert loader._inventory_files is None
+
+    def test_deeply_nested_groups(self, loader):
+        """Test inventory walks handle nesting deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        inventory_data = {"hosts": {"leaf1": {"mgmt": "10.0.0.1"}}}
+        for level in reversed(range(depth)):
+            inventory_data = {"children": {f"g{level}": inventory_data}, "vars": {f"v{level}": level}}
+
+        hosts: dict = {}
+        loader._extract_hosts_recursive(inventory_data, hosts)
+        host_map: dict = {}
+        loader._extract_host_groups_recursive(inventory_data, host_map, current_group="root")
+        ancestors: dict = {}
+        loader._extract_group_ancestors(inventory_data, ancestors)
+
+        assert len(hosts["leaf1"]) == depth + 1
+        assert hosts["leaf1"]["v0"] == 0
+        assert host_map == {"leaf1": f"g{depth - 1}"}
+        assert ancestors[f"g{depth - 1}"] == {f"g{level}" for level in range(depth)}
+
+    def test_inventory_yaml_extension(self, loader, tmp_path):
+        """Test inventory.yaml is used when there is no inventory.yml."""
+        assert loader._find_inventory_yml(tmp_path) is None
+
+        (tmp_path / "inventory.yaml").write_text(
+            "all:\n  children:\n    FABRIC:\n      hosts:\n        spine1:\n          ansible_host: 192.168.0.10\n"
+        )
+        assert loader._find_inventory_yml(tmp_path) == tmp_path / "inventory.yaml"
+        assert loader._build_host_to_group_map(tmp_path) == {"spine1": "FABRIC"}
+
+        (tmp_path / "inventory.yml").write_text("all: {}\n")
+        assert loader._find_inventory_yml(tmp_path) == tmp_path / "inventory.yml"
+
     def test_multiple_children_in_hierarchy(self, loader, tmp_path):
         """Test group hierarchy with multiple children at same level (siblings).
 
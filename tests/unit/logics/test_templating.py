@@ -7,7 +7,9 @@ Tests cover template variable resolution, hostvars access, filters,
 and error handling as specified in AC-036 to AC-045.
 """
 
+import logging
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -161,6 +163,72 @@ class TestTemplateResolver:
         assert resolver.has_template("prefix {{ var }} suffix") is True
         assert resolver.has_template("multiple {{ var1 }} and {{ var2 }}") is True
 
+    def test_contains_template_detection(self):
+        """Test template detection in nested data, ignoring raw_ variables."""
+        resolver = TemplateResolver({})
+
+        assert resolver.contains_template({"a": [1, {"b": "{{ var }}"}]}) is True
+        assert resolver.contains_template({"a": ["{% if x %}y{% endif %}"]}) is True
+        assert resolver.contains_template({"a": [1, {"b": "plain {"}], "c": None}) is False
+        assert resolver.contains_template({"raw_eos_cli": "{{ switch.id }}"}) is False
+        assert resolver.contains_template("{{ var }}") is True
+
+    def test_changed_flag(self):
+        """Test the resolver records whether a resolution changed a value."""
+        resolver = TemplateResolver({"mtu": 9214, "loop": "{{ loop }}"})
+
+        resolver.resolve_recursive({"a": "plain", "raw_b": "{{ mtu }}", "c": "{{ loop }}"})
+        assert resolver.changed is False
+
+        resolver.resolve_recursive({"a": ["{{ mtu }}"]})
+        assert resolver.changed is True
+
+    def test_compiled_templates_are_reused(self):
+        """Test each template source is compiled once and follows context updates."""
+        resolver = TemplateResolver({"mtu": 1500})
+
+        with patch.object(resolver.env, "from_string", wraps=resolver.env.from_string) as from_string, \
+                patch.object(resolver.env, "compile_expression", wraps=resolver.env.compile_expression) as compile_expr:
+            assert resolver.resolve_recursive(["mtu {{ mtu }}", "{{ mtu }}"] * 3) == ["mtu 1500", 1500] * 3
+            resolver.set_context({"mtu": 9214})
+            assert resolver.resolve_recursive(["mtu {{ mtu }}", "{{ mtu }}"]) == ["mtu 9214", 9214]
+
+        # One template, plus the one compile_expression() builds for the expression
+        assert from_string.call_count == 2
+        assert compile_expr.call_count == 1
+        assert resolver.changed is True
+
+    def test_type_preserving_log_built_only_when_enabled(self, caplog):
+        """Test the resolved value is only converted to a string when INFO is logged."""
+
+        class Config(dict):
+            str_calls = 0
+
+            def __str__(self):
+                Config.str_calls += 1
+                return super().__str__()
+
+        resolver = TemplateResolver({"config": Config(key="value")})
+
+        with caplog.at_level(logging.WARNING, logger=resolver.logger.name):
+            assert resolver.resolve_value("{{ config }}") == {"key": "value"}
+        assert Config.str_calls == 0
+
+        with caplog.at_level(logging.INFO, logger=resolver.logger.name):
+            resolver.resolve_value("{{ config }}")
+        assert Config.str_calls == 1
+        assert "Type-preserving resolution" in caplog.text
+
+    def test_plain_strings_skip_resolution(self):
+        """Test strings without template markers are returned without calling resolve_value."""
+        resolver = TemplateResolver({"mtu": 9214})
+
+        with patch.object(resolver, "resolve_value", wraps=resolver.resolve_value) as resolve_value:
+            result = resolver.resolve_recursive({"name": "Ethernet1", "desc": "a {b} c", "mtu": "{{ mtu }}"})
+
+        assert result == {"name": "Ethernet1", "desc": "a {b} c", "mtu": 9214}
+        resolve_value.assert_called_once_with("{{ mtu }}")
+
     def test_resolve_value_with_string(self):
         """Test resolve_value with string containing template."""
         context = {"my_var": "test"}
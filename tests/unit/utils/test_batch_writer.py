@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""Unit tests for batch_writer utilities."""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from avd_cli.utils.batch_writer import SEQUENTIAL_THRESHOLD, batch_write
+
+
+class TestBatchWrite:
+    """Test cases for batch_write function."""
+
+    def test_batch_write_empty(self) -> None:
+        """Test that an empty batch writes nothing."""
+        assert batch_write([]) == []
+
+    def test_batch_write_small_batch(self, tmp_path: Path) -> None:
+        """Test sequential path for batches below the threshold."""
+        pairs = [(tmp_path / "a.cfg", b"hostname a\n")]
+        result = batch_write(pairs)
+        assert result == [tmp_path / "a.cfg"]
+        assert (tmp_path / "a.cfg").read_bytes() == b"hostname a\n"
+
+    def test_batch_write_large_batch_preserves_order(self, tmp_path: Path) -> None:
+        """Test threaded path writes every file and keeps input order."""
+        count = SEQUENTIAL_THRESHOLD * 5
+        pairs = [(tmp_path / f"leaf{i}.cfg", f"hostname leaf{i}\n".encode("utf-8")) for i in range(count)]
+        result = batch_write(pairs)
+        assert result == [path for path, _ in pairs]
+        for path, data in pairs:
+            assert path.read_bytes() == data
+
+    def test_batch_write_preserves_utf8(self, tmp_path: Path) -> None:
+        """Test non-ASCII content is written byte-for-byte."""
+        data = "description Liaison vers le cœur\n".encode("utf-8")
+        batch_write([(tmp_path / "spine.cfg", data)])
+        assert (tmp_path / "spine.cfg").read_text(encoding="utf-8") == data.decode("utf-8")
+
+    def test_batch_write_replaces_existing_file(self, tmp_path: Path) -> None:
+        """Test a shorter write truncates the previous content and large content is complete."""
+        path = tmp_path / "leaf.cfg"
+        batch_write([(path, b"x" * 1_000_000)])
+        assert path.stat().st_size == 1_000_000
+        batch_write([(path, b"hostname leaf\n")])
+        assert path.read_bytes() == b"hostname leaf\n"
+
+    def test_batch_write_propagates_errors(self, tmp_path: Path) -> None:
+        """Test write errors surface to the caller."""
+        pairs = [(tmp_path / f"leaf{i}.cfg", b"x") for i in range(SEQUENTIAL_THRESHOLD * 2)]
+        with patch("builtins.open", side_effect=PermissionError("Access denied")):
+            with pytest.raises(PermissionError, match="Access denied"):
+                batch_write(pairs)
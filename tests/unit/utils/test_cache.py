@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""Unit tests for structured config cache utilities."""
+from pathlib import Path
+
+from avd_cli.utils.cache import StructuredConfigCache, fingerprint
+
+
+class TestFingerprint:
+    """Test cases for fingerprint function."""
+
+    def test_fingerprint_is_stable(self) -> None:
+        """Test equal data gives equal fingerprints."""
+        assert fingerprint({"a": [1, 2]}) == fingerprint({"a": [1, 2]})
+
+    def test_fingerprint_distinguishes_types(self) -> None:
+        """Test numeric strings and numbers do not collide."""
+        assert fingerprint({"mtu": "9214"}) != fingerprint({"mtu": 9214})
+
+    def test_fingerprint_ignores_key_order(self) -> None:
+        """Test dict insertion order does not change the fingerprint."""
+        assert fingerprint({"a": 1, "b": {"c": 2, "d": 3}}) == fingerprint({"b": {"d": 3, "c": 2}, "a": 1})
+
+    def test_fingerprint_not_json_serializable(self) -> None:
+        """Test data that is not JSON serializable is still fingerprinted."""
+        assert fingerprint({"ids": {1, 2}}) is not None
+
+    def test_fingerprint_unpicklable(self) -> None:
+        """Test unpicklable data disables fingerprinting."""
+        assert fingerprint({"fn": lambda: None}) is None
+
+
+class TestStructuredConfigCache:
+    """Test cases for StructuredConfigCache class."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test a saved entry is returned for the same fingerprint only."""
+        cache = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        key = cache.fingerprint({"hostname": "leaf1"})
+        assert cache.get("leaf1", key) is None
+        cache.put("leaf1", key, {"hostname": "leaf1", "router_bgp": {"as": "65101"}})
+        cache.save()
+
+        reloaded = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        assert reloaded.get("leaf1", key) == {"hostname": "leaf1", "router_bgp": {"as": "65101"}}
+        assert reloaded.get("leaf1", reloaded.fingerprint({"hostname": "other"})) is None
+
+    def test_salt_invalidates_entries(self, tmp_path: Path) -> None:
+        """Test changing the salt changes fingerprints."""
+        key_v1 = StructuredConfigCache(tmp_path, salt="v1").fingerprint({"a": 1})
+        key_v2 = StructuredConfigCache(tmp_path, salt="v2").fingerprint({"a": 1})
+        assert key_v1 != key_v2
+
+    def test_config_current_after_record(self, tmp_path: Path) -> None:
+        """Test a rendered config is reused only while the file is unchanged."""
+        cache = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        key = cache.fingerprint({"hostname": "leaf1"})
+        cache.put("leaf1", key, {"hostname": "leaf1"})
+        config_file = tmp_path / "leaf1.cfg"
+        config_file.write_text(cache.record_config("leaf1", "hostname leaf1\n"), encoding="utf-8")
+        cache.save()
+
+        reloaded = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        assert reloaded.get("leaf1", key) is not None
+        assert reloaded.is_config_current("leaf1", config_file)
+
+        config_file.write_text("hostname edited\n", encoding="utf-8")
+        assert not reloaded.is_config_current("leaf1", config_file)
+
+    def test_config_not_current_for_new_entry(self, tmp_path: Path) -> None:
+        """Test a freshly generated structured config always needs rendering."""
+        cache = StructuredConfigCache(tmp_path, salt="v1")
+        cache.put("leaf1", "key", {"hostname": "leaf1"})
+        assert not cache.is_config_current("leaf1", tmp_path / "leaf1.cfg")
+
+    def test_non_json_entries_are_not_saved(self, tmp_path: Path) -> None:
+        """Test structured configs that do not survive JSON are skipped."""
+        cache = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        cache.put("leaf1", "key", {"vlans": {10: "ten"}})
+        cache.save()
+        assert not (tmp_path / ".avdcache" / "leaf1.json").exists()
+
+    def test_save_many_entries(self, tmp_path: Path) -> None:
+        """Test all dirty entries are written in one batch."""
+        cache = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        for index in range(10):
+            cache.put(f"leaf{index}", f"key{index}", {"hostname": f"leaf{index}"})
+        cache.save()
+
+        reloaded = StructuredConfigCache(tmp_path / ".avdcache", salt="v1")
+        assert all(reloaded.get(f"leaf{index}", f"key{index}") is not None for index in range(10))
+
+    def test_save_write_error_is_ignored(self, tmp_path: Path) -> None:
+        """Test an unwritable cache directory does not raise."""
+        cache_dir = tmp_path / ".avdcache"
+        cache_dir.write_text("not a directory", encoding="utf-8")
+        cache = StructuredConfigCache(cache_dir, salt="v1")
+        cache.put("leaf1", "key", {"hostname": "leaf1"})
+        cache.save()
+        assert cache_dir.is_file()
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test unreadable entries are ignored."""
+        (tmp_path / "leaf1.json").write_text("{not json", encoding="utf-8")
+        cache = StructuredConfigCache(tmp_path, salt="v1")
+        assert cache.get("leaf1", "key") is None
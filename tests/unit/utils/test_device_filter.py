@@ -3,7 +3,8 @@
 
 """Unit tests for DeviceFilter utility class."""
 
-from unittest.mock import MagicMock
+import ntpath
+from unittest.mock import MagicMock, patch
 
 from avd_cli.utils.device_filter import DeviceFilter, filter_devices
 
@@ -112,6 +113,15 @@ class TestHostnameMatching:
         assert device_filter.matches_hostname("Leaf-1a") is True
         assert device_filter.matches_hostname("leaf-1a") is False
 
+    def test_case_insensitive_on_windows(self):
+        """Test that names and patterns are case-normalized like fnmatch on Windows."""
+        with patch("avd_cli.utils.device_filter.normcase", ntpath.normcase):
+            device_filter = DeviceFilter(patterns=["Leaf-*", "SPINE-1"])
+            assert device_filter.matches_hostname("leaf-1a") is True
+            assert device_filter.matches_hostname("spine-1") is True
+            assert device_filter.matches_group("LEAF-PODS") is True
+            assert device_filter.matches_hostname("spine-2") is False
+
 
 class TestGroupMatching:
     """Test group name pattern matching."""
@@ -190,6 +200,18 @@ class TestDeviceMatching:
         assert device_filter.matches_device("leaf-1a", []) is True
         assert device_filter.matches_device("spine-1", []) is False
 
+    def test_mixed_exact_and_glob_patterns(self):
+        """Test exact names and glob patterns are both checked against every group."""
+        device_filter = DeviceFilter(patterns=["SPINES", "DC2_*", "border-[12]"])
+        assert device_filter.matches_device("leaf-1a", ["DC1_LEAFS", "SPINES"]) is True
+        assert device_filter.matches_device("leaf-1a", ["DC1_LEAFS", "DC2_LEAFS"]) is True
+        assert device_filter.matches_device("border-2", ["DC1"]) is True
+        assert device_filter.matches_device("border-3", ["DC1", "SPINES_OLD"]) is False
+
+    def test_equality_ignores_compiled_matchers(self):
+        """Test filters with the same patterns compare equal."""
+        assert DeviceFilter(patterns=["leaf-*"]) == DeviceFilter(patterns=["leaf-*"])
+
 
 class TestDeviceFilterRepr:
     """Test string representation."""
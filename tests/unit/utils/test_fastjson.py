@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""Unit tests for JSON serialization helpers."""
+import pytest
+
+from avd_cli.utils import fastjson
+
+
+class TestFastJson:
+    """Test cases for fastjson helpers."""
+
+    def test_dumps_roundtrip(self) -> None:
+        """Test serialized data loads back unchanged."""
+        data = {"hostname": "leaf1", "router_bgp": {"as": "65101", "peers": [1, 2.5, None, True]}}
+        assert fastjson.loads(fastjson.dumps(data)) == data
+
+    def test_dumps_canonical_sorts_keys(self) -> None:
+        """Test canonical output does not depend on dict insertion order."""
+        assert fastjson.dumps_canonical({"b": 1, "a": {"d": 2, "c": 3}}) == b'{"a":{"c":3,"d":2},"b":1}'
+
+    def test_dumps_canonical_keeps_unicode(self) -> None:
+        """Test non-ASCII text is emitted as UTF-8."""
+        assert fastjson.dumps_canonical({"description": "café"}) == '{"description":"café"}'.encode("utf-8")
+
+    def test_dumps_unserializable(self) -> None:
+        """Test unserializable data raises TypeError."""
+        with pytest.raises(TypeError):
+            fastjson.dumps_canonical({"ids": {1, 2}})
+
+    def test_loads_invalid(self) -> None:
+        """Test invalid documents raise ValueError."""
+        with pytest.raises(ValueError):
+            fastjson.loads(b"{not json")
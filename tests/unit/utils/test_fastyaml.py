@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# coding: utf-8 -*-
+
+"""Unit tests for YAML serialization helpers."""
+import pytest
+import yaml
+
+from avd_cli.utils import fastyaml
+
+
+class TestFastYaml:
+    """Test cases for fastyaml helpers."""
+
+    def test_dump_block_style_keeps_key_order(self) -> None:
+        """Test documents are block style and keep insertion order."""
+        assert fastyaml.dump({"b": 1, "a": [1, "2"]}) == "b: 1\na:\n- 1\n- '2'\n"
+
+    def test_dump_matches_pure_python_dumper(self) -> None:
+        """Test output matches PyYAML's default dumper for catalog-like data."""
+        data = {
+            "anta.tests.interfaces": [
+                {"VerifyInterfacesStatus": {"interfaces": [{"name": "Ethernet1", "status": "up"}], "tags": ["leaf1"]}}
+            ],
+            "anta.tests.hardware": [{"VerifyTemperature": None}, {"VerifyUptime": {"minimum": 86400}}],
+        }
+        expected = yaml.dump(data, default_flow_style=False, sort_keys=False, indent=2)
+        assert fastyaml.dump(data, indent=2) == expected
+
+    def test_dump_long_unicode_roundtrip(self) -> None:
+        """Test long non-ASCII strings load back unchanged."""
+        data = {"description": "Liaison vers le cœur " * 8}
+        assert yaml.safe_load(fastyaml.dump(data)) == data
+
+    def test_dump_rejects_python_objects(self) -> None:
+        """Test non-plain objects are refused by the safe dumper."""
+        with pytest.raises(yaml.representer.RepresenterError):
+            fastyaml.dump({"value": object()})
+
+    @pytest.mark.parametrize("value", ["leaf-1a", "192.168.1.10", "DC1_POD.1", "1e3"])
+    def test_scalar_plain(self, value: str) -> None:
+        """Test strings that load back as themselves are not quoted."""
+        assert fastyaml.scalar(value) == value
+
+    @pytest.mark.parametrize(
+        "value", ["65101", "1.5", "true", "yes", "null", "~", "", "fe80::1", "-x", "a b", "it's", "cœur", "tab\there"]
+    )
+    def test_scalar_quoted_roundtrip(self, value: str) -> None:
+        """Test strings that need quoting are quoted and load back unchanged."""
+        formatted = fastyaml.scalar(value)
+        assert formatted != value
+        assert yaml.safe_load(f"key: {formatted}") == {"key": value}
+
+    def test_dump_bytes_matches_encoded_dump(self) -> None:
+        """Test the encoded document equals the encoded string document."""
+        data = {"description": "Liaison vers le cœur", "tags": ["leaf1", "65101"]}
+        assert fastyaml.dump_bytes(data, indent=2) == fastyaml.dump(data, indent=2).encode("utf-8")
+
+    def test_dump_unlimited_width(self) -> None:
+        """Test long strings are not folded with the unlimited width."""
+        data = {"description": "peer " * 100}
+        assert fastyaml.dump(data, width=fastyaml.UNLIMITED_WIDTH) == yaml.safe_dump(data, width=float("inf"))
+
+    def test_load_matches_safe_load(self) -> None:
+        """Test binary and text documents load like yaml.safe_load."""
+        document = "fabric_name: DC1\nbgp_as: '65101'\nmtu: 9214\ndescription: Liaison vers le cœur\nempty:\n"
+        expected = yaml.safe_load(document)
+        assert fastyaml.load(document.encode("utf-8")) == expected
+        assert fastyaml.load(document) == expected
+        assert fastyaml.load(b"") is None
+
+    def test_load_rejects_python_tags(self) -> None:
+        """Test documents cannot construct arbitrary Python objects."""
+        with pytest.raises(yaml.YAMLError):
+            fastyaml.load(b"value: !!python/object/apply:os.getcwd []")
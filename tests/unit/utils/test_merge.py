@@ -2,7 +2,13 @@
 # coding: utf-8 -*-
 
 """Unit tests for deep_merge utility."""
-from avd_cli.utils.merge import deep_merge
+from datetime import date
+from ipaddress import IPv4Address
+from unittest.mock import patch
+
+import yaml
+
+from avd_cli.utils.merge import deep_merge, fast_clone
 
 
 class TestDeepMerge:
@@ -37,6 +43,17 @@ class TestDeepMerge:
         assert base == {"a": {"b": 1}}
         assert override == {"a": {"c": 2}}
 
+    def test_deep_merge_copy_shares_nothing(self) -> None:
+        """Test that copy=True returns nested values independent from both inputs."""
+        base = {"a": {"b": {"c": [1]}, "keep": {"k": 1}}}
+        override = {"a": {"b": {"d": [2]}, "new": {"n": 1}}}
+        result = deep_merge(base, override)
+        assert result == {"a": {"b": {"c": [1], "d": [2]}, "keep": {"k": 1}, "new": {"n": 1}}}
+        assert result["a"]["b"]["c"] is not base["a"]["b"]["c"]
+        assert result["a"]["keep"] is not base["a"]["keep"]
+        assert result["a"]["b"]["d"] is not override["a"]["b"]["d"]
+        assert result["a"]["new"] is not override["a"]["new"]
+
     def test_deep_merge_empty_base(self) -> None:
         """Test merging into empty base."""
         result = deep_merge({}, {"a": 1})
@@ -44,5 +61,92 @@ class TestDeepMerge:
 
     def test_deep_merge_empty_override(self) -> None:
         """Test merging empty override."""
-        result = deep_merge({"a": 1}, {})
+        base = {"a": 1}
+        result = deep_merge(base, {})
         assert result == {"a": 1}
+        assert result is not base
+
+    def test_deep_merge_no_copy_shares_untouched_values(self) -> None:
+        """Test that copy=False shares untouched subtrees without mutating inputs."""
+        base = {"a": {"b": 1}, "shared": {"x": [1, 2]}}
+        override = {"a": {"c": 2}}
+        result = deep_merge(base, override, copy=False)
+        assert result == {"a": {"b": 1, "c": 2}, "shared": {"x": [1, 2]}}
+        assert result["shared"] is base["shared"]
+        assert result["a"] is not base["a"]
+        assert base == {"a": {"b": 1}, "shared": {"x": [1, 2]}}
+
+    def test_deep_merge_disjoint_keys(self) -> None:
+        """Test that dicts without common keys are combined without touching the inputs."""
+        base = {"a": {"b": {"x": 1}}}
+        override = {"a": {"c": {"y": 2}}}
+        result = deep_merge(base, override, copy=False)
+        assert result == {"a": {"b": {"x": 1}, "c": {"y": 2}}}
+        assert result["a"]["b"] is base["a"]["b"]
+        assert result["a"]["c"] is override["a"]["c"]
+        assert base == {"a": {"b": {"x": 1}}}
+        assert override == {"a": {"c": {"y": 2}}}
+
+    def test_deep_merge_deeply_nested(self) -> None:
+        """Test merging structures nested deeper than the recursion limit."""
+        base: dict = {}
+        override: dict = {}
+        base_node, override_node = base, override
+        for _ in range(5000):
+            base_node["k"] = {}
+            override_node["k"] = {}
+            base_node, override_node = base_node["k"], override_node["k"]
+        base_node["a"] = 1
+        override_node["b"] = 2
+
+        result = deep_merge(base, override, copy=False)
+
+        node = result
+        for _ in range(5000):
+            node = node["k"]
+        assert node == {"a": 1, "b": 2}
+
+
+class TestFastClone:
+    """Test cases for fast_clone function."""
+
+    def test_fast_clone_nested_data(self) -> None:
+        """Test nested dicts and lists are copied, not shared."""
+        original = {"a": [{"b": 1}, "x"], "c": {"d": None, "e": 1.5, "f": True}}
+        clone = fast_clone(original)
+        assert clone == original
+        assert clone is not original
+        assert clone["a"] is not original["a"]
+        assert clone["a"][0] is not original["a"][0]
+        assert clone["c"] is not original["c"]
+
+    def test_fast_clone_other_types_fall_back_to_deepcopy(self) -> None:
+        """Test non JSON-like values are still copied safely."""
+        original = {"tags": {"a", "b"}, "when": date(2024, 1, 1), "ip": IPv4Address("10.0.0.1")}
+        clone = fast_clone(original)
+        assert clone == original
+        assert clone["tags"] is not original["tags"]
+
+    def test_fast_clone_yaml_inventory_data(self) -> None:
+        """Test YAML-loaded AVD variables are cloned without falling back to deepcopy."""
+        document = """
+        fabric_name: DC1
+        bgp_as: 65100
+        mtu: 9214.0
+        l3leaf:
+          defaults:
+            loopback_ipv4_pool: 192.168.255.0/24
+            evpn_route_servers: [spine1, spine2]
+          node_groups:
+            - group: POD1
+              bgp_as: "65101"
+              nodes:
+                - {name: leaf1, id: 1, uplink_switch_interfaces: [Ethernet1, Ethernet1]}
+              filter: null
+              mlag: true
+        """
+        original = yaml.safe_load(document)
+        with patch("avd_cli.utils.merge.deepcopy", side_effect=AssertionError("unexpected deepcopy")):
+            clone = fast_clone(original)
+        assert clone == original
+        assert clone["l3leaf"]["node_groups"][0]["nodes"] is not original["l3leaf"]["node_groups"][0]["nodes"]